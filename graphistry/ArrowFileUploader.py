@@ -1,25 +1,69 @@
-import pyarrow as pa, requests, sys
-from functools import lru_cache
-from typing import Any, Tuple, Optional
-from weakref import WeakKeyDictionary
+import hashlib, pyarrow as pa, requests, sys, threading
+from collections import OrderedDict
+from typing import Any, Iterator, Tuple, Optional
 from .util import setup_logger
 logger = setup_logger(__name__)
 
 
-# WrappedTable -> {'file_id': str, 'output': dict}
-DF_TO_FILE_ID_CACHE : WeakKeyDictionary = WeakKeyDictionary()
-"""
-NOTE: Will switch to pa.Table -> ... when RAPIDS upgrades from pyarrow, 
-     which adds weakref support
-"""
+# (arrow_fingerprint(table), server, org) -> MemoizedFileUpload, least recently used first
+DF_TO_FILE_ID_CACHE : 'OrderedDict[Tuple[str, str, Optional[str]], MemoizedFileUpload]' = OrderedDict()
+
+# Most recent uploads remembered
+DF_TO_FILE_ID_CACHE_SIZE = 100
+
+# Guards DF_TO_FILE_ID_CACHE, as node and edge files upload concurrently
+DF_TO_FILE_ID_CACHE_LOCK = threading.Lock()
+
+
+def arrow_fingerprint(arr: pa.Table) -> str:
+    """
+    Content hash of an Arrow table: its schema, and the layout and per-buffer hashes of each column chunk,
+    including the values of dictionary-encoded columns at any nesting depth
+
+    Equal tables with the same chunking hash alike whichever objects hold them, without copying any buffers
+    """
+    h = hashlib.sha256(arr.schema.serialize())
+    h.update(f'rows:{arr.num_rows}'.encode('utf-8'))
+    for col in arr.columns:
+        for chunk in col.chunks:
+            _hash_array(h, chunk)
+    return h.hexdigest()
+
+
+def _hash_array(h: Any, arr: pa.Array) -> None:
+    h.update(f'chunk:{arr.offset}:{len(arr)}'.encode('utf-8'))
+    # buffers() covers nested children, but not the values of dictionary arrays
+    for buf in arr.buffers():
+        if buf is None:
+            h.update(b'none')
+        else:
+            h.update(hashlib.sha256(buf).digest())
+    for dictionary in _dictionaries(arr):
+        h.update(b'dictionary')
+        _hash_array(h, dictionary)
+
+
+def _dictionaries(arr: pa.Array) -> Iterator[pa.Array]:
+    """
+    Dictionaries of arr and of its nested children
+    """
+    t = arr.type
+    if pa.types.is_dictionary(t):
+        yield arr.dictionary
+    elif pa.types.is_struct(t) or pa.types.is_union(t):
+        for i in range(t.num_fields):
+            yield from _dictionaries(arr.field(i))
+    elif pa.types.is_list(t) or pa.types.is_large_list(t) or pa.types.is_fixed_size_list(t) or pa.types.is_map(t):
+        yield from _dictionaries(arr.values)
 
 class ArrowFileUploader():
     """
         Implement file API with focus on Arrow support
 
-        Memoization in this class is based on reference equality, while plotter is based on hash.
-        That means the plotter resolves different-identity value matches, so by the time ArrowFileUploader compares,
-        identities are unified for faster reference-based checks.
+        Memoization in this class is by content, see arrow_fingerprint(), so an equal table built anew,
+        such as by rerunning a notebook cell, reuses the earlier upload. The last DF_TO_FILE_ID_CACHE_SIZE
+        uploads are remembered, without holding on to their tables. When the uploader has an upload_cache,
+        uploads are also looked up in and recorded to it, so other processes and sessions reuse them.
 
         Example: Upload files with per-session memoization
             uploader : ArrowUploader
@@ -29,7 +73,7 @@ class ArrowFileUploader():
             file1_id = afu.create_and_post_file(arr)[0]
             file2_id = afu.create_and_post_file(arr)[0]
 
-            assert file1_id == file2_id # memoizes by default (memory-safe: weak refs)
+            assert file1_id == file2_id # memoizes by default (memory-safe: keeps only content hashes)
 
         Example: Explicitly create a file and upload data for it
             uploader : ArrowUploader
@@ -73,7 +117,7 @@ class ArrowFileUploader():
             **file_opts
         }
 
-        res = requests.post(
+        res = self.uploader.session.post(
             self.uploader.server_base_path + '/api/v2/files/',
             verify=self.uploader.certificate_validation,
             headers={'Authorization': f'Bearer {tok}'},
@@ -127,20 +171,31 @@ class ArrowFileUploader():
 
             Default upload_url_opts='erase=true' throws exceptions on parse errors and deletes upload.
 
-            Default memoize=True skips uploading 'arr' when previously uploaded in current session
+            Default memoize=True skips uploading 'arr' when a table with the same content was recently uploaded to the same server and org in current session,
+            or, when the uploader has an upload_cache, by any process sharing it (see UploadCache)
 
             See File REST API for file_opts (file create) and upload_url_opts (file upload)
         """
 
         if memoize:
-            #FIXME if pa.Table was hashable, could do direct set/get map
-            wrapped_table : WrappedTable
-            val : MemoizedFileUpload
-            for wrapped_table, val in DF_TO_FILE_ID_CACHE.items():
-                if wrapped_table.arr is arr:
+            fingerprint = arrow_fingerprint(arr)
+            server, org = self.uploader.server_base_path, self.uploader.org_name
+            key = (fingerprint, server, org)
+            with DF_TO_FILE_ID_CACHE_LOCK:
+                val = DF_TO_FILE_ID_CACHE.get(key)
+                if val is not None:
+                    DF_TO_FILE_ID_CACHE.move_to_end(key)
                     logger.debug('arrow->file_id memoization hit: %s', val.file_id)
                     return val.file_id, val.output
-            logger.debug('arrow->file_id memoization miss (of %s)', len(DF_TO_FILE_ID_CACHE))
+                logger.debug('arrow->file_id memoization miss (of %s)', len(DF_TO_FILE_ID_CACHE))
+
+            upload_cache = self.uploader.upload_cache
+            if upload_cache is not None:
+                hit = upload_cache.get(fingerprint, server, org)
+                if hit is not None:
+                    logger.debug('arrow->file_id upload cache hit: %s', hit[0])
+                    self.memoize(key, MemoizedFileUpload(*hit))
+                    return hit
 
         if file_id is None:
             file_id = self.create_file(file_opts)
@@ -149,25 +204,19 @@ class ArrowFileUploader():
         out = MemoizedFileUpload(file_id, resp)
 
         if memoize:
-            wrapped = WrappedTable(arr)
-            cache_arr(wrapped)
-            DF_TO_FILE_ID_CACHE[wrapped] = out
+            self.memoize(key, out)
+            if upload_cache is not None:
+                upload_cache.put(fingerprint, server, org, file_id, resp)
             logger.debug('Memoized arrow->file_id %s', file_id)
         
         return out.file_id, out.output
 
-@lru_cache(maxsize=100)
-def cache_arr(arr):
-    """
-        Hold reference to most recent memoization entries
-        Hack until RAPIDS supports Arrow 2.0, when pa.Table becomes weakly referenceable
-    """
-    return arr
-
-class WrappedTable():
-    arr : pa.Table
-    def __init__(self, arr: pa.Table):
-        self.arr = arr
+    def memoize(self, key: Tuple[str, str, Optional[str]], upload: 'MemoizedFileUpload') -> None:
+        with DF_TO_FILE_ID_CACHE_LOCK:
+            DF_TO_FILE_ID_CACHE[key] = upload
+            DF_TO_FILE_ID_CACHE.move_to_end(key)
+            while len(DF_TO_FILE_ID_CACHE) > DF_TO_FILE_ID_CACHE_SIZE:
+                DF_TO_FILE_ID_CACHE.popitem(last=False)
 
 class MemoizedFileUpload():    
     file_id: str
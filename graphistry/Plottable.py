@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
 from typing_extensions import Literal
 import pandas as pd
 
@@ -76,6 +76,12 @@ class Plottable(object):
     _umap : Optional[UMAP]
 
     _adjacency : Optional[Any]
+    _adjacency_index : Optional[Any]
+    _time_index : Optional[Any]
+    _node_encoding : Optional[pd.Index]
+    _fingerprint : Optional[Any]
+    _chain_profile : Optional[pd.DataFrame]
+    _chain_paths : Optional[pd.DataFrame]
     _entity_to_index : dict
     _index_to_entity : dict
 
@@ -129,12 +135,12 @@ class Plottable(object):
 
     # ### compute
 
-    def get_indegrees(self, col: str = 'degree_in') -> 'Plottable':
+    def get_indegrees(self, col: str = 'degree_in', weight: Optional[str] = None) -> 'Plottable':
         if 1 + 1:
             raise RuntimeError('should not happen')
         return self
 
-    def get_outdegrees(self, col: str = 'degree_out') -> 'Plottable':
+    def get_outdegrees(self, col: str = 'degree_out', weight: Optional[str] = None) -> 'Plottable':
         if 1 + 1:
             raise RuntimeError('should not happen')
         return self
@@ -144,6 +150,7 @@ class Plottable(object):
         col: str = "degree",
         degree_in: str = "degree_in",
         degree_out: str = "degree_out",
+        weight: Optional[str] = None
     ) -> 'Plottable':
         if 1 + 1:
             raise RuntimeError('should not happen')
@@ -201,6 +208,21 @@ class Plottable(object):
             raise RuntimeError('should not happen')
         return self
 
+    def encode_ids(self) -> 'Plottable':
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return self
+
+    def decode_ids(self) -> 'Plottable':
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return self
+
+    def node_codes(self, ids: Any) -> Any:
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return self
+
     def hop(self,
         nodes: Optional[pd.DataFrame],
         hops: Optional[int] = 1,
@@ -209,12 +231,56 @@ class Plottable(object):
         edge_match: Optional[dict] = None,
         source_node_match: Optional[dict] = None,
         destination_node_match: Optional[dict] = None,
+        return_as_wave_front: bool = False,
+        label_hops: Optional[str] = None,
+        cache: bool = False,
+        time_col: Optional[str] = None,
+        time_window: Optional[Tuple[Any, Any]] = None,
+        time_order: Optional[str] = None,
+        max_cost: Optional[float] = None,
+        label_cost: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> 'Plottable':
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return self
+
+    def hop_batch(self,
+        seeds: pd.DataFrame,
+        seed_col: str = 'seed_id',
+        hops: Optional[int] = 1,
+        to_fixed_point: bool = False,
+        direction: str = 'forward',
+        edge_match: Optional[dict] = None,
+        source_node_match: Optional[dict] = None,
+        destination_node_match: Optional[dict] = None,
         return_as_wave_front: bool = False
     ) -> 'Plottable':
         if 1 + 1:
             raise RuntimeError('should not happen')
         return self
 
+    def shortest_path_lengths(self,
+        sources: Any,
+        targets: Any,
+        direction: str = 'forward',
+        edge_match: Optional[dict] = None,
+        max_hops: Optional[int] = None
+    ) -> pd.DataFrame:
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return pd.DataFrame()
+
+    def compute_native(self,
+        alg: str,
+        out_col: Optional[str] = None,
+        directed: bool = True,
+        params: dict = {}
+    ) -> 'Plottable':
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return self
+
     def filter_nodes_by_dict(self, filter_dict: Optional[dict] = None) -> 'Plottable':
         if 1 + 1:
             raise RuntimeError('should not happen')
@@ -226,7 +292,7 @@ class Plottable(object):
         return self
 
     # FIXME python recursive typing issues
-    def chain(self, ops: List[Any]) -> 'Plottable':
+    def chain(self, ops: List[Any], plan: str = 'auto', cache: bool = False, profile: bool = False, limit: Optional[int] = None, return_paths: bool = False) -> 'Plottable':
         """
         ops is List[ASTObject]
         """
@@ -234,6 +300,22 @@ class Plottable(object):
             raise RuntimeError('should not happen')
         return self
 
+    def chain_plan(self, ops: List[Any], plan: str = 'auto') -> Any:
+        """
+        ops is List[ASTObject], returns ChainPlan
+        """
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return None
+
+    def chain_incremental(self, ops: List[Any], merge_ratio: float = 0.1) -> Any:
+        """
+        ops is List[ASTObject], returns IncrementalChain
+        """
+        if 1 + 1:
+            raise RuntimeError('should not happen')
+        return None
+
     def to_igraph(self, 
         directed: bool = True,
         use_vids: bool = False,
@@ -33,6 +33,7 @@ from .bolt_util import (
 from .arrow_uploader import ArrowUploader
 from .nodexlistry import NodeXLGraphistry
 from .tigeristry import Tigeristry
+from .upload_cache import upload_cache_for
 from .util import setup_logger
 logger = setup_logger(__name__)
 
@@ -195,6 +196,19 @@ class PlotterBase(Plottable):
         self._adjacency = None
         self._entity_to_index = None
         self._index_to_entity = None
+
+        # compute: cached CSR index over edges, see compute/adjacency.py
+        self._adjacency_index = None
+        # compute: cached time-sorted edge index, see compute/adjacency.py
+        self._time_index = None
+        # compute: original node ids when encoded as int codes, see compute/encode_ids.py
+        self._node_encoding = None
+        # compute: cached content hash of nodes and edges, see compute/result_cache.py
+        self._fingerprint = None
+        # compute: per-step measurements of chain(profile=True), see compute/chain_profile.py
+        self._chain_profile = None
+        # compute: one row per matched path of chain(return_paths=True), see compute/chain_paths.py
+        self._chain_paths = None
         
         # KG embeddings
         self._relation : Optional[str] = None
@@ -1024,6 +1038,7 @@ class PlotterBase(Plottable):
         else:
             res = copy.copy(base)
             res._nodes = nodes
+            res._fingerprint = None
         # for use in text_utils.py search index
         if hasattr(res, 'search_index'):
             delattr(res, 'search_index')  # reset so that g.search will rebuild index
@@ -1131,6 +1146,9 @@ class PlotterBase(Plottable):
         else:
             res = copy.copy(base)
             res._edges = edges
+            res._adjacency_index = None
+            res._time_index = None
+            res._fingerprint = None
         return res
 
     def pipe(self, graph_transform: Callable, *args, **kwargs) -> Plottable:
@@ -1314,7 +1332,7 @@ class PlotterBase(Plottable):
 
     def plot(
         self, graph=None, nodes=None, name=None, description=None, render=None, skip_upload=False, as_files=False, memoize=True,
-        extra_html="", override_html_style=None
+        extra_html="", override_html_style=None, compression=None
     ):  # noqa: C901
         """Upload data to the Graphistry server and show as an iframe of it.
 
@@ -1353,6 +1371,9 @@ class PlotterBase(Plottable):
         :param override_html_style: Set fully custom style tag.
         :type override_html_style: Optional[str]
 
+        :param compression: Compress uploaded Arrow buffers with 'lz4' or 'zstd', or 'auto' to pick per table from a sample. Default off. Only for .register(api=3) sessions: other API versions raise a ValueError when set. Compare locally via graphistry.arrow_uploader.compression_benchmark().
+        :type compression: Optional[str]
+
         **Example: Simple**
             ::
 
@@ -1390,6 +1411,8 @@ class PlotterBase(Plottable):
 
         # from .pygraphistry import PyGraphistry
         api_version = PyGraphistry.api_version()
+        if compression is not None and api_version != 3:
+            raise ValueError(f'compression requires .register(api=3) uploads, current api: {api_version}')
         logger.debug("2. @PloatterBase plot: PyGraphistry.org_name(): {}".format(PyGraphistry.org_name()))
         if api_version == 1:
             dataset = self._plot_dispatch(g, n, name, description, 'json', self._style, memoize)
@@ -1402,6 +1425,7 @@ class PlotterBase(Plottable):
             logger.debug("4. @PloatterBase plot: PyGraphistry.org_name(): {}".format(PyGraphistry.org_name()))
 
             dataset = self._plot_dispatch(g, n, name, description, 'arrow', self._style, memoize)
+            dataset.compression = compression
             if skip_upload:
                 return dataset
             dataset.token = PyGraphistry.api_token()
@@ -1980,7 +2004,8 @@ class PlotterBase(Plottable):
                 'agentversion': sys.modules['graphistry'].__version__,  # type: ignore
                 **(metadata or {})
             },
-            certificate_validation=PyGraphistry.certificate_validation())
+            certificate_validation=PyGraphistry.certificate_validation(),
+            upload_cache=upload_cache_for(PyGraphistry.upload_cache_dir()))
 
         au.edge_encodings = au.g_to_edge_encodings(self)
         au.node_encodings = au.g_to_node_encodings(self)
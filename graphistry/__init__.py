@@ -11,6 +11,7 @@ from graphistry.pygraphistry import (  # noqa: E402, F401
     api_token,
     verify_token,
     store_token_creds_in_memory,
+    upload_cache_dir,
     name,
     description,
     bind,
@@ -50,7 +51,8 @@ from graphistry.pygraphistry import (  # noqa: E402, F401
 )
 
 from graphistry.compute import (
-    n, e_forward, e_reverse, e_undirected
+    n, e_forward, e_reverse, e_undirected,
+    gt, ge, lt, le, ne, between, isin, startswith, isna, notna
 )
 
 from graphistry.Engine import Engine
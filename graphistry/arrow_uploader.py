@@ -1,12 +1,138 @@
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-import io, pyarrow as pa, requests, sys
+import io, numpy as np, pandas as pd, pyarrow as pa, requests, sys, time
+from requests.adapters import HTTPAdapter
 
 from .ArrowFileUploader import ArrowFileUploader
+from .upload_cache import UploadCache
 from .util import setup_logger
 logger = setup_logger(__name__)
 
+
+# Most uploads issued at once, such as a dataset's node and edge files, and connections kept open for them
+UPLOAD_MAX_WORKERS = 4
+
+# Default rows per record batch when streaming a table upload
+UPLOAD_BATCH_SIZE = 65536
+
+# Arrow IPC buffer compression codecs for uploads; 'auto' picks one per table, see choose_compression()
+COMPRESSION_CODECS = ['lz4', 'zstd']
+COMPRESSION_MODES = [None, 'auto'] + COMPRESSION_CODECS
+
+# compression='auto': rows sampled, and the least estimated savings for compressing at all, and for zstd over lz4
+AUTO_COMPRESSION_SAMPLE_ROWS = 10000
+AUTO_COMPRESSION_MIN_SAVINGS = 0.1
+
+
+def compressed_size(arr: pa.ChunkedArray, codec: str) -> int:
+    """
+    Total bytes of arr's buffers after compressing each with codec, as Arrow IPC buffer compression does
+    """
+    return sum(
+        pa.compress(buf, codec=codec, asbytes=False).size
+        for chunk in arr.chunks
+        for buf in chunk.buffers()
+        if buf is not None
+    )
+
+
+def estimate_compressed_sizes(table: pa.Table, sample_rows: int = AUTO_COMPRESSION_SAMPLE_ROWS) -> Dict[str, float]:
+    """
+    Estimated upload bytes of table per codec, and uncompressed under 'none', from compressing evenly spaced sample rows
+
+    Each column's sampled ratio is scaled by the column's full size, so wide or incompressible columns weigh in proportionally
+    """
+    sizes: Dict[str, float] = {'none': float(table.nbytes)}
+    for codec in COMPRESSION_CODECS:
+        sizes[codec] = 0.0
+    if table.num_rows == 0:
+        return sizes
+    rows = np.unique(np.linspace(0, table.num_rows - 1, min(sample_rows, table.num_rows)).astype(np.int64))
+    sample = table.take(pa.array(rows))
+    for name in table.column_names:
+        scale = table.column(name).nbytes / max(sample.column(name).nbytes, 1)
+        for codec in COMPRESSION_CODECS:
+            sizes[codec] += compressed_size(sample.column(name), codec) * scale
+    return sizes
+
+
+def choose_compression(table: pa.Table, sample_rows: int = AUTO_COMPRESSION_SAMPLE_ROWS) -> Optional[str]:
+    """
+    Codec for compression='auto': None unless lz4 saves AUTO_COMPRESSION_MIN_SAVINGS of the bytes,
+    then zstd when it saves that much again over lz4, else the cheaper lz4
+    """
+    sizes = estimate_compressed_sizes(table, sample_rows)
+    if sizes['lz4'] >= (1 - AUTO_COMPRESSION_MIN_SAVINGS) * sizes['none']:
+        return None
+    if sizes['zstd'] <= (1 - AUTO_COMPRESSION_MIN_SAVINGS) * sizes['lz4']:
+        return 'zstd'
+    return 'lz4'
+
+
+def compression_benchmark(table: pa.Table, modes: Sequence[Optional[str]] = (None, 'lz4', 'zstd', 'auto')) -> pd.DataFrame:
+    """
+    Serialize table as an upload would under each compression mode, reporting bytes saved versus CPU spent
+
+    Run locally to pick a mode for plot(compression=...), such as print(compression_benchmark(pa.Table.from_pandas(df)))
+
+    :returns: DataFrame with one row per mode: compression, codec (as chosen for 'auto'), bytes, bytes_saved, saved_ratio, cpu_s
+    """
+    uploader = ArrowUploader(org_name='benchmark')
+    rows = []
+    for mode in modes:
+        uploader.compression = mode
+        t0 = time.process_time()
+        codec = uploader.resolve_compression(table)
+        n_bytes = sum(len(chunk) for chunk in uploader.arrow_to_chunks(table, compression=codec))
+        rows.append({'compression': mode, 'codec': codec, 'bytes': n_bytes, 'cpu_s': time.process_time() - t0})
+    out = pd.DataFrame(rows)
+    baseline = sum(len(chunk) for chunk in uploader.arrow_to_chunks(table))
+    out['bytes_saved'] = baseline - out['bytes']
+    out['saved_ratio'] = out['bytes_saved'] / max(baseline, 1)
+    return out[['compression', 'codec', 'bytes', 'bytes_saved', 'saved_ratio', 'cpu_s']]
+
+
+class ChunkSink:
+    """
+    Write-only file for Arrow IPC writers that hands back what was written since the last drain()
+
+    tell() counts all bytes ever written, so the IPC file footer records correct batch offsets
+    """
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        out = b''.join(self.parts)
+        self.parts = []
+        return out
+
+
 class ArrowUploader:
+
+    # pooled lazily, see session
+    __session: Optional[requests.Session]
     
     @property
     def token(self) -> str:
@@ -134,6 +260,64 @@ class ArrowUploader:
     def certificate_validation(self, certificate_validation):
         self.__certificate_validation = certificate_validation
 
+    @property
+    def batch_size(self) -> int:
+        """
+        Rows per record batch when streaming table uploads, bounding the serialized bytes held at once
+        """
+        return self.__batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int):
+        self.__batch_size = batch_size
+
+    @property
+    def compression(self) -> Optional[str]:
+        """
+        Arrow IPC buffer compression of uploads: None (default), 'lz4', 'zstd', or 'auto' to pick per table, see choose_compression()
+        """
+        return self.__compression
+
+    @compression.setter
+    def compression(self, compression: Optional[str]):
+        if compression not in COMPRESSION_MODES:
+            raise ValueError(f'Invalid compression: "{compression}", must be one of: {COMPRESSION_MODES}')
+        self.__compression = compression
+
+    def resolve_compression(self, table: pa.Table) -> Optional[str]:
+        """
+        Codec to upload table with, if any
+        """
+        if self.compression == 'auto':
+            codec = choose_compression(table)
+            logger.debug('Auto compression for %s bytes: %s', table.nbytes, codec)
+            return codec
+        return self.compression
+
+    @property
+    def upload_cache(self) -> Optional[UploadCache]:
+        """
+        On-disk index of uploads shared across processes, consulted by memoized file uploads, see UploadCache
+        """
+        return self.__upload_cache
+
+    @upload_cache.setter
+    def upload_cache(self, upload_cache: Optional[UploadCache]):
+        self.__upload_cache = upload_cache
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Connection pool shared by this uploader's file and upload requests, including concurrent ones
+        """
+        if self.__session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=UPLOAD_MAX_WORKERS, pool_maxsize=UPLOAD_MAX_WORKERS)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.__session = session
+        return self.__session
+
 
     ########################################################################3
 
@@ -159,7 +343,10 @@ class ArrowUploader:
             token = None, dataset_id = None,
             metadata = None,
             certificate_validation = True, 
-            org_name: Optional[str] = None):
+            org_name: Optional[str] = None,
+            batch_size: int = UPLOAD_BATCH_SIZE,
+            compression: Optional[str] = None,
+            upload_cache: Optional[UploadCache] = None):
 
         self.__name = name
         self.__description = description
@@ -173,6 +360,10 @@ class ArrowUploader:
         self.__edge_encodings = edge_encodings
         self.__metadata = metadata
         self.__certificate_validation = certificate_validation
+        self.__session = None
+        self.__batch_size = batch_size
+        self.compression = compression
+        self.__upload_cache = upload_cache
         self.__org_name = org_name if org_name else None
 
         if org_name:
@@ -408,6 +599,24 @@ class ArrowUploader:
         writer.close()
         return b.getvalue()
 
+    def arrow_to_chunks(self, table: pa.Table, batch_size: Optional[int] = None, compression: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Serialize table as the same Arrow IPC file as arrow_to_buffer(), yielding the bytes of one record batch at a time
+
+        Batches are zero-copy slices of batch_size rows (default self.batch_size), so only one is serialized at once.
+        A compression codec ('lz4' or 'zstd') compresses each batch's buffers, which Arrow readers undo transparently.
+        """
+        sink = ChunkSink()
+        if compression is None:
+            writer = pa.RecordBatchFileWriter(sink, table.schema)
+        else:
+            writer = pa.RecordBatchFileWriter(sink, table.schema, options=pa.ipc.IpcWriteOptions(compression=compression))
+        for batch in table.to_batches(max_chunksize=batch_size or self.batch_size):
+            writer.write_batch(batch)
+            yield sink.drain()
+        writer.close()
+        yield sink.drain()
+
 
     def maybe_bindings(self, g, bindings, base = {}):
         out = { **base }
@@ -484,9 +693,23 @@ class ArrowUploader:
         return encodings
 
 
+    def run_concurrently(self, tasks: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Run independent upload tasks on a bounded thread pool, returning their results in order
+
+        Any task exception is raised, first task first, after all tasks finish
+        """
+        if len(tasks) <= 1:
+            return [task() for task in tasks]
+        with ThreadPoolExecutor(max_workers=min(len(tasks), UPLOAD_MAX_WORKERS)) as pool:
+            futures = [pool.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
     def post(self, as_files: bool = True, memoize: bool = True):
         """
         Note: likely want to pair with self.maybe_post_share_link(g)
+
+        Edge and node tables are created and uploaded concurrently
         """
         logger.debug("@ArrowUploader.post, self.org_name : {}".format(self.org_name))
         if as_files:
@@ -496,10 +719,14 @@ class ArrowUploader:
             if self.org_name:
                 file_opts['org_name'] = self.org_name
 
-            e_file_id, _ = file_uploader.create_and_post_file(self.edges, file_opts=file_opts)
+            def upload(arr: pa.Table) -> str:
+                return file_uploader.create_and_post_file(arr, file_opts=file_opts, memoize=memoize)[0]
 
+            tables = [self.edges] + ([self.nodes] if not (self.nodes is None) else [])
+            file_ids = self.run_concurrently([partial(upload, arr) for arr in tables])
+            e_file_id = file_ids[0]
             if not (self.nodes is None):
-                n_file_id, _ = file_uploader.create_and_post_file(self.nodes, file_opts=file_opts)
+                n_file_id = file_ids[1]
 
             self.create_dataset({
                 "node_encodings": self.node_encodings,
@@ -521,10 +748,9 @@ class ArrowUploader:
                 "description": self.description
             })
             
-            self.post_edges_arrow()
-            
-            if not (self.nodes is None):
-                self.post_nodes_arrow()
+            self.run_concurrently(
+                [self.post_edges_arrow] + ([self.post_nodes_arrow] if not (self.nodes is None) else [])
+            )
         
         return self
 
@@ -663,14 +889,19 @@ class ArrowUploader:
             raise e
 
     def post_arrow_generic(self, sub_path: str, tok: str, arr: pa.Table, opts='') -> requests.Response:
-        buf = self.arrow_to_buffer(arr)
+        """
+        Upload arr as an Arrow IPC file, streamed in record batches via a chunked request body, see arrow_to_chunks()
+
+        Buffers are compressed according to self.compression
+        """
+        buf = self.arrow_to_chunks(arr, compression=self.resolve_compression(arr))
 
         base_path = self.server_base_path
 
         url = f'{base_path}/{sub_path}'
         if len(opts) > 0:
             url = f'{url}?{opts}'
-        resp = requests.post(
+        resp = self.session.post(
             url,
             verify=self.certificate_validation,
             headers={'Authorization': f'Bearer {tok}'},
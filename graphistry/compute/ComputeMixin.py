@@ -1,12 +1,24 @@
 import logging, numpy as np, pandas as pd
-from typing import Any, List, Union, TYPE_CHECKING
+from typing import Any, List, Optional, Union, TYPE_CHECKING
 from typing_extensions import Literal
 
 from graphistry.Engine import Engine
 from graphistry.Plottable import Plottable
 from .chain import chain as chain_base
+from .chain_plan import chain_plan as chain_plan_base
+from .incremental import chain_incremental as chain_incremental_base
 from .collapse import collapse_by
-from .hop import hop as hop_base
+from .degrees import degrees as degrees_base
+from .encode_ids import (
+    encode_ids as encode_ids_base,
+    decode_ids as decode_ids_base,
+    node_codes as node_codes_base
+)
+from .adjacency import AdjacencyIndex
+from .algorithms import compute_native as compute_native_base
+from .out_of_core import is_dask_df
+from .hop import hop as hop_base, hop_batch as hop_batch_base
+from .paths import shortest_path_lengths as shortest_path_lengths_base
 from .filter_by_dict import (
     filter_edges_by_dict as filter_edges_by_dict_base,
     filter_nodes_by_dict as filter_nodes_by_dict_base
@@ -34,7 +46,7 @@ class ComputeMixin(MIXIN_BASE):
 
         Uses g._node for node id if exists, else 'id'
 
-        Edges must be dataframe-like: cudf, pandas, ...
+        Edges must be dataframe-like: cudf, pandas, dask, ...
 
         When reuse=True and g._nodes is not None, use it
 
@@ -56,12 +68,13 @@ class ComputeMixin(MIXIN_BASE):
             raise ValueError(
                 "Missing source/destination bindings; set via .bind() or .edges()"
             )
-        if len(g._edges) == 0:
+        # dask lengths need a full scan, so skip emptiness checks
+        if not is_dask_df(g._edges) and len(g._edges) == 0:
             return g
         # TODO use built-ins for igraph/nx/...
 
         if reuse:
-            if g._nodes is not None and len(g._nodes) > 0:
+            if g._nodes is not None and (is_dask_df(g._nodes) or len(g._nodes) > 0):
                 if g._node is None:
                     logger.warning(
                         "Must set node id binding, not just nodes; set via .bind() or .nodes()"
@@ -74,6 +87,8 @@ class ComputeMixin(MIXIN_BASE):
         if engine == 'auto':
             if isinstance(g._edges, pd.DataFrame):
                 engine = Engine.PANDAS
+            elif is_dask_df(g._edges):
+                engine = Engine.DASK
             else:
                 try:
                     import cudf
@@ -82,7 +97,7 @@ class ComputeMixin(MIXIN_BASE):
                 except ImportError:
                     pass
             if engine == 'auto':
-                raise ValueError('Could not determine engine for edges, expected pandas or cudf dataframe, got: {}'.format(type(g._edges)))
+                raise ValueError('Could not determine engine for edges, expected pandas, cudf, or dask dataframe, got: {}'.format(type(g._edges)))
         if engine == Engine.PANDAS:
             concat_df = pd.concat([g._edges[g._source], g._edges[g._destination]])
         elif engine == Engine.CUDF:
@@ -94,53 +109,53 @@ class ComputeMixin(MIXIN_BASE):
             else:
                 raise ValueError('Unexpected edges type; convert edges to cudf.DataFrame')
             concat_df = cudf.concat([edges_gdf[g._source].rename(node_id), edges_gdf[g._destination].rename(node_id)])
+        elif engine in [Engine.DASK, Engine.DASK_CUDF]:
+            import dask.dataframe as dd
+            concat_df = dd.concat([g._edges[g._source].rename(node_id), g._edges[g._destination].rename(node_id)])
         else:
-            raise ValueError('Expected engine to be pandas or cudf, got: {}'.format(engine))
+            raise ValueError('Expected engine to be pandas, cudf, dask, or dask_cudf, got: {}'.format(engine))
         nodes_df = concat_df.rename(node_id).drop_duplicates().to_frame().reset_index(drop=True)
         return g.nodes(nodes_df, node_id)
 
-    def get_indegrees(self, col: str = "degree_in"):
+    def get_indegrees(self, col: str = "degree_in", weight: Optional[str] = None):
         """See get_degrees"""
-        g = self
-        g_nodes = g.materialize_nodes()
-        in_degree_df = (
-            g._edges[[g._source, g._destination]]
-            .groupby(g._destination)
-            .agg({g._source: "count"})
-            .reset_index()
-            .rename(columns={g._source: col, g._destination: g_nodes._node})
-        )
-        nodes_df = g_nodes._nodes[
-            [c for c in g_nodes._nodes.columns if c != col]
-        ].merge(in_degree_df, how="left", on=g._node)
-        nodes_df[col].fillna(0, inplace=True)
-        nodes_df[col] = nodes_df[col].astype("int32")
-        return g.nodes(nodes_df, g_nodes._node)
-
-    def get_outdegrees(self, col: str = "degree_out"):
+        return degrees_base(self, self.materialize_nodes(), degree_in=col, weight=weight)
+
+    def get_outdegrees(self, col: str = "degree_out", weight: Optional[str] = None):
         """See get_degrees"""
         g = self
-        g2 = g.edges(
-            g._edges.rename(
-                columns={g._source: g._destination, g._destination: g._source}
-            )
-        ).get_indegrees(col)
-        return g.nodes(g2._nodes, g2._node)
+        if g._nodes is None:
+            # materialize from destinations first, as if reversing edges
+            g_nodes = g.edges(
+                g._edges[[g._destination, g._source]].rename(
+                    columns={g._source: g._destination, g._destination: g._source}
+                )
+            ).materialize_nodes()
+        else:
+            g_nodes = g.materialize_nodes()
+        return degrees_base(g, g_nodes, degree_out=col, weight=weight)
 
     def get_degrees(
         self,
         col: str = "degree",
         degree_in: str = "degree_in",
         degree_out: str = "degree_out",
+        weight: Optional[str] = None
     ):
         """Decorate nodes table with degree info
 
-        Edges must be dataframe-like: pandas, cudf, ...
+        Edges must be dataframe-like: pandas, cudf, dask, ...
 
         Parameters determine generated column names
 
+        In, out, and total degree are computed in one pass over the edges and attached together.
+        For pandas, counts are a bincount over node table positions, so no groupby or join is needed.
+
         Warning: Self-cycles are currently double-counted. This may change.
 
+        :param weight: Optional edge column to sum instead of counting edges, for weighted degree
+        :type weight: Optional[str]
+
         **Example: Generate degree columns**
 
             ::
@@ -150,11 +165,19 @@ class ComputeMixin(MIXIN_BASE):
                 print(g._nodes)  # None
                 g2 = g.get_degrees()
                 print(g2._nodes)  # pd.DataFrame with 'id', 'degree', 'degree_in', 'degree_out'
+
+        **Example: Weighted degree**
+
+            ::
+
+                edges = pd.DataFrame({'s': ['a','b','c','d'], 'd': ['c','c','e','e'], 'w': [1.0, 2.0, 0.5, 0.5]})
+                g2 = graphistry.edges(edges, 's', 'd').get_degrees(weight='w')
+                print(g2._nodes)  # 'degree_in' of 'c' is 3.0
         """
-        g = self
-        g2 = g.get_indegrees(degree_in).get_outdegrees(degree_out)
-        g2._nodes[col] = g2._nodes["degree_in"] + g2._nodes["degree_out"]
-        return g2
+        return degrees_base(
+            self, self.materialize_nodes(),
+            degree_in=degree_in, degree_out=degree_out, col=col, weight=weight
+        )
 
     def drop_nodes(self, nodes):
         """
@@ -252,7 +275,7 @@ class ComputeMixin(MIXIN_BASE):
     ) -> Plottable:
         """
         Label nodes on column level_col based on topological sort depth
-        Supports pandas + cudf, using parallelism within each level computation
+        Supports pandas + cudf, peeling levels with Kahn's algorithm in O(V + E)
         Options:
         * allow_cycles: if False and detects a cycle, throw ValueException, else break cycle by picking a lowest-in-degree node
         * warn_cycles: if True and detects a cycle, proceed with a warning
@@ -273,58 +296,66 @@ class ComputeMixin(MIXIN_BASE):
         if (g2._nodes is None) or (len(g2._nodes) == 0):
             return g2
 
-        g2 = g2.edges(g2._edges.drop_duplicates([g2._source, g2._destination]))
+        # Kahn's algorithm over node table positions: one in-degree count, then each level
+        # decrements the counts of its out-neighbors through a CSR index, so cost is O(V + E) overall
+        n_nodes = len(g2._nodes)
+        node_ids = pd.Index(g2._nodes[g2._node].to_numpy())
+        src = node_ids.get_indexer(g2._edges[g2._source].to_numpy())
+        dst = node_ids.get_indexer(g2._edges[g2._destination].to_numpy())
+        keep = (src >= 0) & (dst >= 0)
         if remove_self_loops:
-            non_self_loops = g2._edges[g2._source] != g2._edges[g2._destination]
-            g2 = g2.edges(g2._edges[non_self_loops])
+            keep &= src != dst
+        pairs = np.unique(src[keep].astype(np.int64) * n_nodes + dst[keep])
+        index = AdjacencyIndex(
+            pd.DataFrame({'s': pairs // n_nodes, 'd': pairs % n_nodes}), 's', 'd',
+            n_nodes=n_nodes
+        )
 
-        nodes_with_levels: List[Any] = []
-        while True:
-            if len(g2._nodes) == 0:
-                break
-            g2 = g2.get_degrees()
+        degree_in = np.bincount(index.dst_codes, minlength=n_nodes).astype(np.int64)
+        degree_out = np.bincount(index.src_codes, minlength=n_nodes).astype(np.int64)
+        remaining = np.ones(n_nodes, dtype=bool)
+        levels = np.zeros(n_nodes, dtype=np.int64)
 
-            roots = g2._nodes[g2._nodes["degree_in"] == 0]
+        level = 0
+        roots = np.flatnonzero(degree_in == 0)
+        n_remaining = n_nodes
+        while n_remaining > 0:
             if len(roots) == 0:
                 if not allow_cycles:
                     raise ValueError(
                         "Cyclic graph in get_topological_levels(); remove cycles or set allow_cycles=True"
                     )
                 # tie break by picking biggest node
-                max_degree = g2._nodes["degree"].max()
-                roots = g2._nodes[g2._nodes["degree"] == max_degree][:1]
+                degree = np.where(remaining, degree_in + degree_out, -1)
+                roots = np.array([np.argmax(degree)])
                 if warn_cycles:
                     logger.warning(
-                        "Cycle on computing level %s", len(nodes_with_levels)
+                        "Cycle on computing level %s", level
                     )
 
-            nodes_with_levels.append(
-                (
-                    roots[
-                        [
-                            c
-                            for c in roots
-                            if c not in ["degree_in", "degree_out", "degree"]
-                        ]
-                    ].assign(**{level_col: len(nodes_with_levels)})
-                )
+            levels[roots] = level
+            remaining[roots] = False
+            n_remaining -= len(roots)
+
+            successors, counts = np.unique(
+                index.dst_codes[index.frontier_edges(roots)], return_counts=True
             )
+            degree_in[successors] -= counts
+            predecessors, counts = np.unique(
+                index.src_codes[index.frontier_edges(roots, reverse=True)], return_counts=True
+            )
+            degree_out[predecessors] -= counts
 
-            g2 = g2.drop_nodes(roots[g2._node])
-        nodes_df0 = nodes_with_levels[0]
-        if len(nodes_with_levels) > 1:
-            nodes_df = pd.concat([nodes_df0] + nodes_with_levels[1:])
-        else:
-            nodes_df = nodes_df0
+            roots = successors[(degree_in[successors] == 0) & remaining[successors]]
+            level += 1
 
         if self._nodes is None:
+            order = np.argsort(levels, kind="stable")
+            nodes_df = g2._nodes.assign(**{level_col: levels}).iloc[order].reset_index(drop=True)
             return self.nodes(nodes_df)
         else:
             # use orig cols, esp. in case collisions like degree
-            out_df = g2_base._nodes.merge(
-                nodes_df[[g2_base._node, level_col]], on=g2_base._node, how="left"
-            )
-            return self.nodes(out_df)
+            return self.nodes(g2_base._nodes.assign(**{level_col: levels}))
 
     def prune_self_edges(self):
         return self.edges(self._edges[ self._edges[self._source] != self._edges[self._destination] ])
@@ -355,20 +386,42 @@ class ComputeMixin(MIXIN_BASE):
         return collapse_by(
             self,
             start_node=node,
-            parent=node,
             attribute=attribute,
             column=column,
-            seen={},
             self_edges=self_edges,
             unwrap=unwrap,
             verbose=verbose
         )
 
 
+    def encode_ids(self, *args, **kwargs):
+        return encode_ids_base(self, *args, **kwargs)
+    encode_ids.__doc__ = encode_ids_base.__doc__
+
+    def decode_ids(self, *args, **kwargs):
+        return decode_ids_base(self, *args, **kwargs)
+    decode_ids.__doc__ = decode_ids_base.__doc__
+
+    def node_codes(self, *args, **kwargs):
+        return node_codes_base(self, *args, **kwargs)
+    node_codes.__doc__ = node_codes_base.__doc__
+
     def hop(self, *args, **kwargs):
         return hop_base(self, *args, **kwargs)
     hop.__doc__ = hop_base.__doc__
 
+    def hop_batch(self, *args, **kwargs):
+        return hop_batch_base(self, *args, **kwargs)
+    hop_batch.__doc__ = hop_batch_base.__doc__
+
+    def shortest_path_lengths(self, *args, **kwargs):
+        return shortest_path_lengths_base(self, *args, **kwargs)
+    shortest_path_lengths.__doc__ = shortest_path_lengths_base.__doc__
+
+    def compute_native(self, *args, **kwargs):
+        return compute_native_base(self, *args, **kwargs)
+    compute_native.__doc__ = compute_native_base.__doc__
+
     def filter_nodes_by_dict(self, *args, **kwargs):
         return filter_nodes_by_dict_base(self, *args, **kwargs)
     filter_nodes_by_dict.__doc__ = filter_nodes_by_dict_base.__doc__
@@ -380,3 +433,11 @@ class ComputeMixin(MIXIN_BASE):
     def chain(self, *args, **kwargs):
         return chain_base(self, *args, **kwargs)
     chain.__doc__ = chain_base.__doc__
+
+    def chain_plan(self, *args, **kwargs):
+        return chain_plan_base(self, *args, **kwargs)
+    chain_plan.__doc__ = chain_plan_base.__doc__
+
+    def chain_incremental(self, *args, **kwargs):
+        return chain_incremental_base(self, *args, **kwargs)
+    chain_incremental.__doc__ = chain_incremental_base.__doc__
@@ -2,3 +2,7 @@ from .ComputeMixin import ComputeMixin
 from .ast import (
     n, e_forward, e_reverse, e_undirected
 )
+from .predicates import (
+    gt, ge, lt, le, ne, between, isin, startswith, isna, notna
+)
+from .result_cache import ResultCache, result_cache
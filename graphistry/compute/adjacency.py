@@ -0,0 +1,217 @@
+from typing import Any, Optional, Tuple
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+
+
+# traversal direction -> whether each expansion follows edges in reverse
+REVERSALS = {'forward': [False], 'reverse': [True], 'undirected': [False, True]}
+
+
+def index_dtype(n: int) -> Any:
+    """
+    Smallest signed integer dtype for indexing n elements
+    """
+    return np.int32 if n < np.iinfo(np.int32).max else np.int64
+
+
+def gather_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Concatenate the integer ranges [starts[i], ends[i]) without a Python loop
+    """
+    lens = ends - starts
+    total = int(lens.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(starts - (np.cumsum(lens) - lens), lens)
+    return np.arange(total, dtype=np.int64) + offsets
+
+
+class AdjacencyIndex(object):
+    """
+    Forward and reverse CSR adjacency over integer-coded node ids
+
+    Node ids appearing in the edge table are factorized into dense codes 0..n-1,
+    and edges are referred to by their row position in the edge table.
+
+    Built once per edge table via adjacency_index(g), which caches it on the Plottable.
+    When ids are already dense codes 0..n_nodes-1 (see encode_ids), pass n_nodes to skip factorization.
+    """
+
+    def __init__(self, edges: pd.DataFrame, source: str, destination: str, n_nodes: Optional[int] = None):
+
+        self.source = source
+        self.destination = destination
+        self.n_edges = len(edges)
+
+        if n_nodes is None:
+            codes, uniques = pd.factorize(
+                pd.concat([edges[source], edges[destination]], ignore_index=True)
+            )
+            self.node_ids = pd.Index(uniques)
+        else:
+            codes = np.concatenate([edges[source].to_numpy(), edges[destination].to_numpy()])
+            self.node_ids = pd.RangeIndex(n_nodes)
+        self.n_nodes = len(self.node_ids)
+
+        dtype = index_dtype(max(self.n_nodes, self.n_edges) + 1)
+        codes = codes.astype(dtype, copy=False)
+        self.src_codes: np.ndarray = codes[:self.n_edges]
+        self.dst_codes: np.ndarray = codes[self.n_edges:]
+
+        self.fwd_offsets, self.fwd_edges = self._csr(self.src_codes, dtype)
+        self.rev_offsets, self.rev_edges = self._csr(self.dst_codes, dtype)
+
+    def _csr(self, codes: np.ndarray, dtype: Any) -> Tuple[np.ndarray, np.ndarray]:
+        # null ids factorize to -1 and are never traversed
+        valid = np.flatnonzero(codes >= 0)
+        valid_codes = codes[valid]
+        edges = valid[np.argsort(valid_codes, kind='stable')].astype(dtype, copy=False)
+        offsets = np.zeros(self.n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(valid_codes, minlength=self.n_nodes), out=offsets[1:])
+        return offsets, edges
+
+    def matches(self, g: Plottable) -> bool:
+        """
+        Whether this index was built for g's current edge bindings
+        """
+        return (
+            g._source == self.source
+            and g._destination == self.destination  # noqa: W503
+            and g._edges is not None  # noqa: W503
+            and len(g._edges) == self.n_edges  # noqa: W503
+        )
+
+    def encode(self, ids: Any) -> np.ndarray:
+        """
+        Map node ids to codes, with -1 for ids not found in the edge table
+        """
+        return self.node_ids.get_indexer(ids)
+
+    def decode(self, codes: np.ndarray) -> pd.Index:
+        """
+        Map codes back to node ids
+        """
+        return self.node_ids[codes]
+
+    def frontier_edges(self, frontier: np.ndarray, reverse: bool = False) -> np.ndarray:
+        """
+        Row positions of all edges leaving (or entering, when reverse) the frontier codes
+
+        Frontier codes must be valid (non-negative)
+        """
+        if reverse:
+            offsets, edges = self.rev_offsets, self.rev_edges
+        else:
+            offsets, edges = self.fwd_offsets, self.fwd_edges
+        return edges[gather_ranges(offsets[frontier], offsets[frontier + 1])]
+
+    def frontier_degrees(self, frontier: np.ndarray, reverse: bool = False) -> np.ndarray:
+        """
+        Number of edges leaving (or entering, when reverse) each frontier code, aligned with frontier_edges()
+        """
+        offsets = self.rev_offsets if reverse else self.fwd_offsets
+        return offsets[frontier + 1] - offsets[frontier]
+
+
+def adjacency_index(g: Plottable) -> AdjacencyIndex:
+    """
+    Return the adjacency index for g's edges, building and caching it on g when missing or stale
+
+    The cache is reset whenever edges are set via .edges()
+    """
+    index: Optional[AdjacencyIndex] = getattr(g, '_adjacency_index', None)
+    if index is None or not index.matches(g):
+        if g._source is None or g._destination is None:
+            raise ValueError('Source and destination binding cannot be None, please set g._source and g._destination via bind() or edges()')
+        encoding = getattr(g, '_node_encoding', None)
+        index = AdjacencyIndex(
+            g._edges, g._source, g._destination,
+            n_nodes=len(encoding) if encoding is not None else None
+        )
+        g._adjacency_index = index
+    return index
+
+
+class TimeIndex(object):
+    """
+    Per-node time-sorted edge lists over an AdjacencyIndex, for temporal traversals
+
+    Edge times are ranked densely (null times are never traversed), and each direction's edges are sorted by
+    (node code, time rank), so the edges of a node within a time range are one contiguous slice found by binary search.
+
+    Built once per edge table and time column via time_index(g, time_col), which caches it on the Plottable.
+    """
+
+    def __init__(self, edges: pd.DataFrame, time_col: str, index: AdjacencyIndex):
+
+        self.time_col = time_col
+        self.adjacency = index
+        self.n_edges = len(edges)
+
+        ranks, times = pd.factorize(edges[time_col], sort=True)
+        self.times = pd.Index(times)
+        self.n_times = len(self.times)
+        self.ranks: np.ndarray = ranks.astype(np.int64, copy=False)
+
+        # key = node code * width + time rank, where rank n_times is an exclusive upper bound
+        self.width = self.n_times + 1
+        self.fwd_keys, self.fwd_edges = self._sorted(index.src_codes)
+        self.rev_keys, self.rev_edges = self._sorted(index.dst_codes)
+
+    def _sorted(self, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        valid = np.flatnonzero((codes >= 0) & (self.ranks >= 0))
+        keys = codes[valid].astype(np.int64) * self.width + self.ranks[valid]
+        order = np.argsort(keys, kind='stable')
+        return keys[order], valid[order]
+
+    def matches(self, g: Plottable, time_col: str, index: AdjacencyIndex) -> bool:
+        """
+        Whether this index was built for g's current edges, time column, and adjacency index
+        """
+        return (
+            self.time_col == time_col
+            and self.adjacency is index  # noqa: W503
+            and g._edges is not None  # noqa: W503
+            and len(g._edges) == self.n_edges  # noqa: W503
+        )
+
+    def window_ranks(self, window: Optional[Tuple[Any, Any]]) -> Tuple[int, int]:
+        """
+        Time rank range [lo, hi) of the inclusive time window (start, end), where None leaves a side open
+        """
+        start, end = window if window is not None else (None, None)
+        if isinstance(self.times, pd.DatetimeIndex):
+            start = pd.Timestamp(start) if start is not None else None
+            end = pd.Timestamp(end) if end is not None else None
+        lo = int(self.times.searchsorted(start, side='left')) if start is not None else 0
+        hi = int(self.times.searchsorted(end, side='right')) if end is not None else self.n_times
+        return lo, hi
+
+    def frontier_edges(self, frontier: np.ndarray, lo: np.ndarray, hi: np.ndarray, reverse: bool = False) -> np.ndarray:
+        """
+        Row positions of edges leaving (or entering, when reverse) each frontier code with time rank in [lo, hi)
+
+        lo and hi are aligned with frontier
+        """
+        keys, edges = (self.rev_keys, self.rev_edges) if reverse else (self.fwd_keys, self.fwd_edges)
+        base = frontier.astype(np.int64) * self.width
+        starts = np.searchsorted(keys, base + lo, side='left')
+        ends = np.searchsorted(keys, base + np.maximum(hi, lo), side='left')
+        return edges[gather_ranges(starts, ends)]
+
+
+def time_index(g: Plottable, time_col: str) -> TimeIndex:
+    """
+    Return the time index for g's edges on time_col, building and caching it on g when missing or stale
+
+    The cache is reset whenever edges are set via .edges()
+    """
+    index = adjacency_index(g)
+    t_index: Optional[TimeIndex] = getattr(g, '_time_index', None)
+    if t_index is None or not t_index.matches(g, time_col, index):
+        if time_col not in g._edges.columns:
+            raise ValueError(f'Time column "{time_col}" not found in edges')
+        t_index = TimeIndex(g._edges, time_col, index)
+        g._time_index = t_index
+    return t_index
@@ -0,0 +1,367 @@
+from typing import Any, Optional, Tuple
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+from .adjacency import AdjacencyIndex
+
+
+# (oriented) wedges checked per triangle counting batch, bounding memory
+TRIANGLE_BATCH_WEDGES = 1 << 22
+
+
+def node_adjacency(g: Plottable, weight: Optional[str] = None) -> Tuple[Plottable, AdjacencyIndex, Optional[np.ndarray]]:
+    """
+    Materialize g's nodes and index its edges by node table position
+
+    Edges with endpoints missing from the node table are ignored.
+    Returns the materialized graph, the index, and edge weights aligned with the index's edges (when weight is set)
+    """
+    g2 = g.materialize_nodes()
+    node, src, dst = g2._node, g2._source, g2._destination
+    if node is None or src is None or dst is None:
+        raise ValueError('Node, source, and destination bindings cannot be None, please set via bind(), nodes(), or edges()')
+    if not isinstance(g2._nodes, pd.DataFrame) or not isinstance(g2._edges, pd.DataFrame):
+        raise ValueError('Native algorithms expect pandas node and edge tables')
+
+    ids = pd.Index(g2._nodes[node].to_numpy())
+    if not ids.is_unique:
+        raise ValueError(f'Node ids in column "{node}" must be unique')
+    src_codes = ids.get_indexer(g2._edges[src])
+    dst_codes = ids.get_indexer(g2._edges[dst])
+    keep = (src_codes >= 0) & (dst_codes >= 0)
+
+    index = AdjacencyIndex(
+        pd.DataFrame({'s': src_codes[keep], 'd': dst_codes[keep]}), 's', 'd',
+        n_nodes=len(ids)
+    )
+    weights = g2._edges[weight].to_numpy(dtype=np.float64)[keep] if weight is not None else None
+    return g2, index, weights
+
+
+def lazy_csgraph() -> Any:
+    """
+    scipy.sparse.csgraph when scipy is installed, else None
+    """
+    try:
+        from scipy.sparse import csgraph
+        return csgraph
+    except ImportError:
+        return None
+
+
+def csr_matrix(index: AdjacencyIndex) -> Any:
+    """
+    scipy CSR adjacency matrix over the index's node codes, reusing its forward CSR arrays
+    """
+    from scipy.sparse import csr_matrix as scipy_csr_matrix
+    n = index.n_nodes
+    return scipy_csr_matrix(
+        (np.ones(len(index.fwd_edges), dtype=np.int8), index.dst_codes[index.fwd_edges], index.fwd_offsets),
+        shape=(n, n)
+    )
+
+
+def simple_undirected(index: AdjacencyIndex) -> AdjacencyIndex:
+    """
+    Index of the simple undirected graph underlying index: both directions of each distinct pair, without self-loops
+    """
+    n = max(index.n_nodes, 1)
+    lo = np.minimum(index.src_codes, index.dst_codes).astype(np.int64)
+    hi = np.maximum(index.src_codes, index.dst_codes).astype(np.int64)
+    pairs = np.unique((lo * n + hi)[lo != hi])
+    lo, hi = np.divmod(pairs, n)
+    return AdjacencyIndex(
+        pd.DataFrame({'s': np.concatenate([lo, hi]), 'd': np.concatenate([hi, lo])}), 's', 'd',
+        n_nodes=index.n_nodes
+    )
+
+
+def first_seen_labels(roots: np.ndarray) -> np.ndarray:
+    """
+    Renumber component representatives 0..k-1 in order of each component's first node
+    """
+    _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int32)
+    rank[np.argsort(first)] = np.arange(len(first), dtype=np.int32)
+    return rank[inverse]
+
+
+def pagerank(
+    index: AdjacencyIndex,
+    weights: Optional[np.ndarray] = None,
+    directed: bool = True,
+    damping: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1e-10
+) -> np.ndarray:
+    """
+    PageRank by power iteration, where dangling nodes spread their rank uniformly
+    """
+    n = index.n_nodes
+    if n == 0:
+        return np.zeros(0, dtype=np.float64)
+    src, dst = index.src_codes, index.dst_codes
+    w = weights if weights is not None else np.ones(len(src), dtype=np.float64)
+    if not directed:
+        src, dst, w = np.concatenate([src, dst]), np.concatenate([dst, src]), np.concatenate([w, w])
+
+    out_weight = np.bincount(src, weights=w, minlength=n)
+    dangling = out_weight == 0
+    edge_share = w / np.where(dangling, 1, out_weight)[src]
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = np.bincount(dst, weights=rank[src] * edge_share, minlength=n)
+        rank_next = damping * spread + (damping * rank[dangling].sum() + 1 - damping) / n
+        rank_next /= rank_next.sum()
+        err = np.abs(rank_next - rank).sum()
+        rank = rank_next
+        if err < tol:
+            break
+    return rank
+
+
+def weakly_connected_components(index: AdjacencyIndex) -> np.ndarray:
+    """
+    Component id per node, ignoring edge direction
+
+    Uses scipy's csgraph when installed, and otherwise hooks roots to smaller neighbors with pointer jumping
+    """
+    csgraph = lazy_csgraph()
+    if csgraph is not None:
+        _, labels = csgraph.connected_components(csr_matrix(index), directed=True, connection='weak')
+        return first_seen_labels(labels)
+
+    parent: np.ndarray = np.arange(index.n_nodes, dtype=np.int64)
+    src, dst = index.src_codes, index.dst_codes
+    while True:
+        lo = np.minimum(parent[src], parent[dst])
+        hi = np.maximum(parent[src], parent[dst])
+        merge = lo != hi
+        if not merge.any():
+            break
+        np.minimum.at(parent, hi[merge], lo[merge])
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    return first_seen_labels(parent)
+
+
+def peel_unreachable(index: AdjacencyIndex, active: np.ndarray, reverse: bool) -> np.ndarray:
+    """
+    Repeatedly remove active nodes without active in-edges (out-edges when reverse), returning them
+
+    Such nodes cannot lie on a cycle, so each is its own strongly connected component.
+    """
+    near, far = (index.dst_codes, index.src_codes) if reverse else (index.src_codes, index.dst_codes)
+    counted = active[near] & active[far]
+    degree = np.bincount(far[counted], minlength=index.n_nodes)
+    frontier = np.flatnonzero(active & (degree == 0))
+    peeled = []
+    while len(frontier) > 0:
+        active[frontier] = False
+        peeled.append(frontier)
+        succ = far[index.frontier_edges(frontier, reverse=reverse)]
+        succ, counts = np.unique(succ[active[succ]], return_counts=True)
+        degree[succ] -= counts
+        frontier = succ[degree[succ] == 0]
+    return np.concatenate(peeled) if len(peeled) > 0 else np.zeros(0, dtype=np.int64)
+
+
+def strongly_connected_components(index: AdjacencyIndex) -> np.ndarray:
+    """
+    Component id per node, following edge direction
+
+    Uses scipy's csgraph when installed. Otherwise, nodes that cannot be on a cycle are trimmed first, and
+    each round colors every node with the highest (random) priority of the nodes reaching it: the nodes of
+    each color that reach back to its source node form one component.
+    """
+    n = index.n_nodes
+    csgraph = lazy_csgraph()
+    if csgraph is not None:
+        _, labels = csgraph.connected_components(csr_matrix(index), directed=True, connection='strong')
+        return first_seen_labels(labels)
+
+    src, dst = index.src_codes, index.dst_codes
+    roots = np.full(n, -1, dtype=np.int64)
+    active = np.ones(n, dtype=bool)
+
+    for reverse in [False, True]:
+        trimmed = peel_unreachable(index, active, reverse)
+        roots[trimmed] = trimmed
+
+    # random priorities keep the expected number of color changes per node logarithmic, even along long paths
+    priority = np.random.default_rng(0).permutation(n)
+    by_priority = np.argsort(priority)
+    colors = priority.copy()
+    while active.any():
+        remaining = np.flatnonzero(active)
+        colors[remaining] = priority[remaining]
+
+        frontier = remaining
+        while len(frontier) > 0:
+            edges = index.frontier_edges(frontier)
+            s, d = src[edges], dst[edges]
+            hit = active[d] & (colors[s] > colors[d])
+            np.maximum.at(colors, d[hit], colors[s[hit]])
+            frontier = np.unique(d[hit])
+
+        frontier = remaining[colors[remaining] == priority[remaining]]
+        roots[frontier] = frontier
+        while len(frontier) > 0:
+            edges = index.frontier_edges(frontier, reverse=True)
+            s, d = src[edges], dst[edges]
+            hit = active[s] & (roots[s] < 0) & (colors[s] == colors[d])
+            frontier = np.unique(s[hit])
+            roots[frontier] = by_priority[colors[frontier]]
+        active[roots >= 0] = False
+
+    return first_seen_labels(roots)
+
+
+def coreness(index: AdjacencyIndex) -> np.ndarray:
+    """
+    Core number per node of the simple undirected graph, by peeling all nodes of degree <= k before raising k
+    """
+    n = index.n_nodes
+    simple = simple_undirected(index)
+    degree = np.bincount(simple.src_codes, minlength=n)
+    core = np.zeros(n, dtype=np.int32)
+    alive = np.ones(n, dtype=bool)
+    k = 0
+    while alive.any():
+        k = max(k, int(degree[alive].min()))
+        frontier = np.flatnonzero(alive & (degree <= k))
+        while len(frontier) > 0:
+            core[frontier] = k
+            alive[frontier] = False
+            nbrs = simple.dst_codes[simple.frontier_edges(frontier)]
+            nbrs, counts = np.unique(nbrs[alive[nbrs]], return_counts=True)
+            degree[nbrs] -= counts
+            frontier = nbrs[degree[nbrs] <= k]
+    return core
+
+
+def triangle_count(index: AdjacencyIndex) -> np.ndarray:
+    """
+    Number of triangles through each node of the simple undirected graph
+
+    Edges are oriented from lower to higher (degree, position) rank so each triangle is found once,
+    from its lowest node u: for each oriented edge u->v, check which of v's out-neighbors w also have an edge u->w.
+    """
+    n = index.n_nodes
+    simple = simple_undirected(index)
+    degree = np.bincount(simple.src_codes, minlength=n)
+    rank = np.empty(n, dtype=np.int64)
+    rank[np.lexsort((np.arange(n), degree))] = np.arange(n)
+
+    up = rank[simple.src_codes] < rank[simple.dst_codes]
+    oriented = AdjacencyIndex(
+        pd.DataFrame({'s': simple.src_codes[up], 'd': simple.dst_codes[up]}), 's', 'd',
+        n_nodes=n
+    )
+    base = max(n, 1)
+    keys = np.sort(oriented.src_codes.astype(np.int64) * base + oriented.dst_codes)
+
+    counts = np.zeros(n, dtype=np.int64)
+    wedges = oriented.frontier_degrees(oriented.dst_codes)
+    bounds = np.searchsorted(np.cumsum(wedges), np.arange(0, int(wedges.sum()), TRIANGLE_BATCH_WEDGES), side='right')
+    bounds = np.unique(np.concatenate([[0], bounds, [oriented.n_edges]]))
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        u = oriented.src_codes[lo:hi]
+        v = oriented.dst_codes[lo:hi]
+        w = oriented.dst_codes[oriented.frontier_edges(v)]
+        uu = np.repeat(u, wedges[lo:hi]).astype(np.int64)
+        vv = np.repeat(v, wedges[lo:hi])
+        wedge_keys = uu * base + w
+        pos = np.searchsorted(keys, wedge_keys).clip(max=max(len(keys) - 1, 0))
+        closed = keys[pos] == wedge_keys if len(keys) > 0 else np.zeros(len(wedge_keys), dtype=bool)
+        for corner in [uu, vv, w]:
+            counts += np.bincount(corner[closed], minlength=n)
+    return counts
+
+
+native_algs = [
+    'pagerank',
+    'weakly_connected_components',
+    'strongly_connected_components',
+    'coreness',
+    'triangle_count'
+]
+
+
+def compute_native(
+    self: Plottable,
+    alg: str,
+    out_col: Optional[str] = None,
+    directed: bool = True,
+    params: dict = {}
+) -> Plottable:
+    """Enrich nodes with a graph algorithm computed directly on the pandas node and edge tables
+
+    Runs vectorized NumPy kernels over a CSR index of the edges, avoiding conversion to and from
+    igraph or other graph libraries. See native_algs for the supported algorithms:
+
+    * pagerank: PageRank score, with params damping (0.85), weight (edge column, default unweighted), max_iter (100), tol (1e-10)
+    * weakly_connected_components: component id, ignoring direction
+    * strongly_connected_components: component id, following direction
+    * coreness: k-core number, ignoring direction, self-loops, and multi-edges
+    * triangle_count: number of triangles through the node, ignoring direction, self-loops, and multi-edges
+
+    Component ids are numbered 0, 1, ... in order of each component's first node in the node table.
+
+    :param alg: Name of the algorithm, such as `pagerank`
+    :type alg: str
+
+    :param out_col: Output node column name. When `None`, use the algorithm's name. (default None)
+    :type out_col: Optional[str]
+
+    :param directed: For pagerank, whether to follow edge direction (default True)
+    :type directed: bool
+
+    :param params: Any named parameters to pass to the algorithm
+    :type params: dict
+
+    :returns: Plotter
+    :rtype: Plotter
+
+    **Example: Pagerank**
+        ::
+
+            import graphistry, pandas as pd
+            edges = pd.DataFrame({'s': ['a','b','c','d'], 'd': ['c','c','e','e']})
+            g = graphistry.edges(edges, 's', 'd')
+            g2 = g.compute_native('pagerank')
+            assert 'pagerank' in g2._nodes.columns
+
+    **Example: Components with a custom name**
+        ::
+
+            g2 = g.compute_native('weakly_connected_components', out_col='component')
+
+    """
+
+    if alg not in native_algs:
+        raise ValueError(f'Unexpected parameter alg "{alg}", expected one of: {native_algs}')
+
+    if out_col is None:
+        out_col = alg
+
+    params = dict(params)
+    weight = params.pop('weight', None) if alg == 'pagerank' else None
+    g2, index, weights = node_adjacency(self, weight)
+
+    if alg == 'pagerank':
+        out = pagerank(index, weights, directed=directed, **params)
+    elif alg == 'weakly_connected_components':
+        out = weakly_connected_components(index, **params)
+    elif alg == 'strongly_connected_components':
+        out = strongly_connected_components(index, **params)
+    elif alg == 'coreness':
+        out = coreness(index, **params)
+    else:
+        out = triangle_count(index, **params)
+
+    return g2.nodes(g2._nodes.assign(**{out_col: out}))
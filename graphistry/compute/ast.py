@@ -1,11 +1,10 @@
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 import pandas as pd
 
 from graphistry.Plottable import Plottable
 
 import logging
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 
 ##############################################################################
@@ -53,10 +52,7 @@ class ASTNode(ASTObject):
         if self._name is not None:
             out_g = out_g.nodes(out_g._nodes.assign(**{self._name: True}))
 
-        logger.debug(f'CALL NODE {self} ===>')
-        logger.debug(out_g._nodes)
-        logger.debug(out_g._edges)
-        logger.debug('----------------------------------------')
+        logger.debug('CALL NODE %s ===> %s nodes, %s edges', self, len(out_g._nodes), len(out_g._edges))
 
         return out_g
 
@@ -73,6 +69,7 @@ DEFAULT_HOPS = 1
 DEFAULT_FIXED_POINT = False
 DEFAULT_DIRECTION = 'forward'
 DEFAULT_FILTER_DICT = None
+REVERSED_TIME_ORDER: Dict[Optional[str], Optional[str]] = {'increasing': 'decreasing', 'decreasing': 'increasing'}
 
 class ASTEdge(ASTObject):
     """
@@ -86,7 +83,11 @@ class ASTEdge(ASTObject):
         to_fixed_point: bool = DEFAULT_FIXED_POINT,
         source_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
         destination_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        label_hops: Optional[str] = None,
+        time_col: Optional[str] = None,
+        time_window: Optional[Tuple[Any, Any]] = None,
+        time_order: Optional[str] = None
     ):
 
         super().__init__(name)
@@ -99,6 +100,8 @@ class ASTEdge(ASTObject):
             edge_match = None
         if destination_node_match == {}:
             destination_node_match = None
+        if time_order not in [None, 'increasing', 'decreasing']:
+            raise ValueError('time_order must be one of None, "increasing", or "decreasing"')
 
         self._hops = hops
         self._to_fixed_point = to_fixed_point
@@ -106,9 +109,13 @@ class ASTEdge(ASTObject):
         self._source_node_match = source_node_match
         self._edge_match = edge_match
         self._destination_node_match = destination_node_match
+        self._label_hops = label_hops
+        self._time_col = time_col
+        self._time_window = time_window
+        self._time_order = time_order
 
     def __repr__(self) -> str:
-        return f'ASTEdge(direction={self._direction}, edge_match={self._edge_match}, hops={self._hops}, to_fixed_point={self._to_fixed_point}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, name={self._name})'
+        return f'ASTEdge(direction={self._direction}, edge_match={self._edge_match}, hops={self._hops}, to_fixed_point={self._to_fixed_point}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, name={self._name}, label_hops={self._label_hops}, time_col={self._time_col}, time_window={self._time_window}, time_order={self._time_order})'
 
     def __call__(self, g: Plottable, prev_node_wavefront: Optional[pd.DataFrame]) -> Plottable:
 
@@ -120,16 +127,17 @@ class ASTEdge(ASTObject):
             source_node_match=self._source_node_match,
             edge_match=self._edge_match,
             destination_node_match=self._destination_node_match,
-            return_as_wave_front=True
+            return_as_wave_front=True,
+            label_hops=self._label_hops,
+            time_col=self._time_col,
+            time_window=self._time_window,
+            time_order=self._time_order
         )
 
         if self._name is not None:
             out_g = out_g.edges(out_g._edges.assign(**{self._name: True}))
 
-        logger.debug(f'CALL EDGE {self} ===>')
-        logger.debug(out_g._nodes)
-        logger.debug(out_g._edges)
-        logger.debug('----------------------------------------')
+        logger.debug('CALL EDGE %s ===> %s nodes, %s edges', self, len(out_g._nodes), len(out_g._edges))
 
         return out_g
 
@@ -143,7 +151,13 @@ class ASTEdge(ASTObject):
             hops=self._hops,
             to_fixed_point=self._to_fixed_point,
             source_node_match=self._destination_node_match,
-            destination_node_match=self._source_node_match
+            destination_node_match=self._source_node_match,
+            name=self._name,
+            label_hops=self._label_hops,
+            time_col=self._time_col,
+            time_window=self._time_window,
+            # a causal path read backwards runs back in time
+            time_order=REVERSED_TIME_ORDER.get(self._time_order)
         )
 e = ASTEdge  # noqa: E305
 
@@ -157,7 +171,11 @@ class ASTEdgeForward(ASTEdge):
         source_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
         destination_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
         to_fixed_point: bool = DEFAULT_FIXED_POINT,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        label_hops: Optional[str] = None,
+        time_col: Optional[str] = None,
+        time_window: Optional[Tuple[Any, Any]] = None,
+        time_order: Optional[str] = None
     ):
         super().__init__(
             direction='forward',
@@ -166,11 +184,15 @@ class ASTEdgeForward(ASTEdge):
             source_node_match=source_node_match,
             destination_node_match=destination_node_match,
             to_fixed_point=to_fixed_point,
-            name=name
+            name=name,
+            label_hops=label_hops,
+            time_col=time_col,
+            time_window=time_window,
+            time_order=time_order
         )
 
     def __repr__(self) -> str:
-        return f'ASTEdgeForward(edge_match={self._edge_match}, hops={self._hops}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, to_fixed_point={self._to_fixed_point}, name={self._name})'
+        return f'ASTEdgeForward(edge_match={self._edge_match}, hops={self._hops}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, to_fixed_point={self._to_fixed_point}, name={self._name}, label_hops={self._label_hops}, time_col={self._time_col}, time_window={self._time_window}, time_order={self._time_order})'
 
 e_forward = ASTEdgeForward  # noqa: E305
 
@@ -184,7 +206,11 @@ class ASTEdgeReverse(ASTEdge):
         source_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
         destination_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
         to_fixed_point: bool = DEFAULT_FIXED_POINT,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        label_hops: Optional[str] = None,
+        time_col: Optional[str] = None,
+        time_window: Optional[Tuple[Any, Any]] = None,
+        time_order: Optional[str] = None
     ):
         super().__init__(
             direction='reverse',
@@ -193,11 +219,15 @@ class ASTEdgeReverse(ASTEdge):
             source_node_match=source_node_match,
             destination_node_match=destination_node_match,
             to_fixed_point=to_fixed_point,
-            name=name
+            name=name,
+            label_hops=label_hops,
+            time_col=time_col,
+            time_window=time_window,
+            time_order=time_order
         )
     
     def __repr__(self) -> str:
-        return f'ASTEdgeReverse(edge_match={self._edge_match}, hops={self._hops}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, to_fixed_point={self._to_fixed_point}, name={self._name})'
+        return f'ASTEdgeReverse(edge_match={self._edge_match}, hops={self._hops}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, to_fixed_point={self._to_fixed_point}, name={self._name}, label_hops={self._label_hops}, time_col={self._time_col}, time_window={self._time_window}, time_order={self._time_order})'
 
 e_reverse = ASTEdgeReverse  # noqa: E305
 
@@ -211,7 +241,11 @@ class ASTEdgeUndirected(ASTEdge):
         source_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
         destination_node_match: Optional[dict] = DEFAULT_FILTER_DICT,
         to_fixed_point: bool = DEFAULT_FIXED_POINT,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        label_hops: Optional[str] = None,
+        time_col: Optional[str] = None,
+        time_window: Optional[Tuple[Any, Any]] = None,
+        time_order: Optional[str] = None
     ):
         super().__init__(
             direction='undirected',
@@ -220,10 +254,14 @@ class ASTEdgeUndirected(ASTEdge):
             source_node_match=source_node_match,
             destination_node_match=destination_node_match,
             to_fixed_point=to_fixed_point,
-            name=name
+            name=name,
+            label_hops=label_hops,
+            time_col=time_col,
+            time_window=time_window,
+            time_order=time_order
         )
 
     def __repr__(self) -> str:
-        return f'ASTEdgeUndirected(edge_match={self._edge_match}, hops={self._hops}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, to_fixed_point={self._to_fixed_point}, name={self._name})'
+        return f'ASTEdgeUndirected(edge_match={self._edge_match}, hops={self._hops}, source_node_match={self._source_node_match}, destination_node_match={self._destination_node_match}, to_fixed_point={self._to_fixed_point}, name={self._name}, label_hops={self._label_hops}, time_col={self._time_col}, time_window={self._time_window}, time_order={self._time_order})'
 
 e_undirected = ASTEdgeUndirected  # noqa: E305
@@ -1,13 +1,18 @@
-from typing import cast, List, Optional, Tuple, Union
-import pandas as pd
+from typing import cast, Dict, List, Optional, Tuple, Union
+import numpy as np, pandas as pd
 
 from graphistry.Plottable import Plottable
+from .adjacency import adjacency_index
 from .ast import ASTObject, ASTNode, ASTEdge
+from .chain_paths import PathEnumerator, is_path_chain, paths_subgraph, paths_table
+from .chain_plan import PlanDirection, plan_chain
+from .chain_profile import ChainProfiler
 from .filter_by_dict import filter_by_dict
+from .out_of_core import chain_dask, is_dask_df
+from .result_cache import cached_call
 
 import logging
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 
 ###############################################################################
@@ -15,7 +20,9 @@ logger.setLevel(logging.DEBUG)
 
 def combine_steps(g: Plottable, kind: str, steps: List[Tuple[ASTObject,Plottable]]) -> pd.DataFrame:
     """
-    Collect nodes and edges, taking care to deduplicate and tag any names
+    Collect nodes and edges of the pruned steps, tagging any names
+
+    Rows are selected and tagged by boolean masks over the input table, so output follows its order
     """
 
     id = getattr(g, '_node' if kind == 'nodes' else '_edge')
@@ -25,37 +32,45 @@ def combine_steps(g: Plottable, kind: str, steps: List[Tuple[ASTObject,Plottable
     if id is None:
         raise ValueError(f'Cannot combine steps with empty id for kind {kind}')
 
-    logger.debug('combine_steps ops pre: %s', [op for (op, _) in steps])
-    if kind == 'edges':
-        logger.debug('EDGES << recompute forwards given reduced set')
-        steps = [
-            (
-                op,
-                op(g=g.edges(g_step._edges), prev_node_wavefront=g_step._nodes)
-            )
-            for (op, g_step) in steps
-        ]
-
-    # df[[id]]
-    out_df = pd.concat([
-        getattr(g_step, df_fld)[[id]]
-        for (_, g_step) in steps
-    ]).drop_duplicates(subset=[id])
-
-    # df[[id, op_name1, ...]]
     logger.debug('combine_steps ops: %s', [op for (op, _) in steps])
+
+    table_df = getattr(g, df_fld)
+    ids = table_df[id]
+    hits = np.zeros(len(table_df), dtype=bool)
+    tags: Dict[str, np.ndarray] = {}
     for (op, g_step) in steps:
+        step_hits = ids.isin(getattr(g_step, df_fld)[id]).to_numpy()
+        hits |= step_hits
         if op._name is not None and isinstance(op, op_type):
             logger.debug('tagging kind [%s] name %s', op_type, op._name)
-            out_df = out_df.merge(
-                getattr(g_step, df_fld)[[id, op._name]],
-                on=id,
-                how='left'
-            )
-            out_df[op._name] = out_df[op._name].fillna(False).astype(bool)
-    out_df = out_df.merge(getattr(g, df_fld), on=id, how='left')
+            tags[op._name] = tags[op._name] | step_hits if op._name in tags else step_hits
+
+    out_df = table_df[hits].assign(**{
+        name: step_hits[hits]
+        for name, step_hits in tags.items()
+    }).reset_index(drop=True)
+    out_df = out_df[
+        [id] + list(tags.keys()) + [c for c in table_df.columns if c != id and c not in tags]
+    ]
 
-    logger.debug('COMBINED[%s] >> %s', kind, out_df)
+    logger.debug('COMBINED[%s] >> %s rows', kind, len(out_df))
+
+    return out_df
+
+
+def label_steps(g: Plottable, kind: str, out_df: pd.DataFrame, steps: List[Tuple[ASTObject,Plottable]]) -> pd.DataFrame:
+    """
+    Copy hop labels of forward edge steps onto combined output, -1 where a step did not reach a row
+    """
+
+    id = getattr(g, '_node' if kind == 'nodes' else '_edge')
+    df_fld = '_nodes' if kind == 'nodes' else '_edges'
+
+    for (op, g_step) in steps:
+        if isinstance(op, ASTEdge) and op._label_hops is not None:
+            step_df = getattr(g_step, df_fld)
+            labels = pd.Series(step_df[op._label_hops].to_numpy(), index=step_df[id].to_numpy())
+            out_df[op._label_hops] = out_df[id].map(labels).fillna(-1).astype(np.int32)
 
     return out_df
 
@@ -82,13 +97,119 @@ def combine_steps(g: Plottable, kind: str, steps: List[Tuple[ASTObject,Plottable
 #    
 #     - No 'bad' deadend nodes will be included
 #
-#     3. Forward output pass
+#     3. Output (fused into Step 2)
 #
-#     This pass is likely fusable into Step 2: collect and label outputs
+#     The pruned reverse steps already hold exactly the nodes and edges on full paths, so each step
+#     runs at most twice: outputs are selected and named-tagged by boolean masks over the input tables
 #
 ###############################################################################
 
-def chain(self: Plottable, ops: List[ASTObject]) -> Plottable:
+def pad_ops(ops: List[ASTObject]) -> List[ASTObject]:
+    """
+    Ensure ops start and end with a node matcher
+    """
+
+    logger.debug('orig chain >> %s', ops)
+
+    if isinstance(ops[0], ASTEdge):
+        logger.debug('adding initial node to ensure initial link has needed reversals')
+        ops = cast(List[ASTObject], [ ASTNode() ]) + ops
+
+    if isinstance(ops[-1], ASTEdge):
+        logger.debug('adding final node to ensure final link has needed reversals')
+        ops = ops + cast(List[ASTObject], [ ASTNode() ])
+
+    logger.debug('final chain >> %s', ops)
+
+    return ops
+
+
+def run_chain(g: Plottable, ops: List[ASTObject], direction: str, added_edge_index: bool, profiler: ChainProfiler) -> Plottable:
+    """
+    Run the forward, backward, and combine phases of planned ops over g, see chain()
+    """
+
+    logger.debug('============ FORWARDS ============')
+
+    #forwards
+    g_stack : List[Plottable] = []
+    for (i, op) in enumerate(ops):
+        prev_node_wavefront = (
+            None  # first uses full graph
+            if len(g_stack) == 0
+            else g_stack[-1]._nodes
+        )
+        g_step = profiler.run(
+            'forward', i, op,
+            lambda: op(g=g, prev_node_wavefront=prev_node_wavefront),
+            nodes_in=len(g._nodes if prev_node_wavefront is None else prev_node_wavefront),
+            edges_in=len(g._edges)
+        )
+        g_stack.append(g_step)
+
+    encountered_nodes_df = pd.concat([
+        g_step._nodes
+        for g_step in g_stack
+    ]).drop_duplicates(subset=[g._node])
+
+    logger.debug('============ BACKWARDS ============')
+
+    #backwards
+    g_stack_reverse : List[Plottable] = [g_stack[-1]]
+    for (i, (op, g_step)) in reversed(list(enumerate(zip(ops, g_stack)))):
+        g_step_reverse = profiler.run(
+            'backward', i, op,
+            lambda: (op.reverse())(
+
+                # all encountered nodes + step's edges
+                g=g_step.nodes(encountered_nodes_df),
+
+                # check for hits against fully valid targets
+                prev_node_wavefront=g_stack_reverse[-1]._nodes
+
+            ),
+            nodes_in=len(g_stack_reverse[-1]._nodes),
+            edges_in=len(g_step._edges)
+        )
+        g_stack_reverse.append(g_step_reverse)
+
+    # last-to-first in terms of the caller's ops, so named columns come out the same for either plan
+    steps = list(zip(reversed(ops), g_stack_reverse[1:]))
+    if direction == 'reverse':
+        steps = steps[::-1]
+
+    logger.debug('============ COMBINE NODES ============')
+    final_nodes_df = profiler.run(
+        'combine', 0, 'nodes',
+        lambda: combine_steps(g, 'nodes', steps),
+        nodes_in=len(g._nodes)
+    )
+
+    logger.debug('============ COMBINE EDGES ============')
+    final_edges_df = profiler.run(
+        'combine', 1, 'edges',
+        lambda: combine_steps(g, 'edges', steps),
+        edges_in=len(g._edges)
+    )
+
+    # planner keeps labelled chains forward, so forward steps count hops from the caller's start
+    final_nodes_df = label_steps(g, 'nodes', final_nodes_df, list(zip(ops, g_stack)))
+    final_edges_df = label_steps(g, 'edges', final_edges_df, list(zip(ops, g_stack)))
+    if added_edge_index:
+        final_edges_df = final_edges_df.drop(columns=['index'])
+
+    return g.nodes(final_nodes_df).edges(final_edges_df)
+
+
+def chain(
+    self: Plottable,
+    ops: List[ASTObject],
+    plan: PlanDirection = 'auto',
+    cache: bool = False,
+    profile: bool = False,
+    limit: Optional[int] = None,
+    return_paths: bool = False
+) -> Plottable:
     """
 
     Experimental: Chain a list of operations
@@ -97,9 +218,31 @@ def chain(self: Plottable, ops: List[ASTObject]) -> Plottable:
 
     If any matchers are named, add a correspondingly named boolean-valued column to the output
 
+    If any edge matchers set label_hops, add a correspondingly named column with the hop of that step on which each
+    node and edge was first reached from the nodes the step started from, and -1 for rows it did not reach
+
+    Output rows follow the order of the input node and edge tables
+
+    Dask edges are supported: a forward scan collects the reachable subgraph into memory, see chain_dask()
+
     :param ops: List[ASTobject] Various node and edge matchers
     :type fg: dict
 
+    :param plan: Which end the wavefront starts from: 'auto' (default) picks the more selective end, see chain_plan(); or 'forward', 'reverse'
+    :type plan: str
+
+    :param cache: Reuse the result of an identical earlier chain over an unchanged graph, see graphistry.compute.result_cache
+    :type cache: bool
+
+    :param profile: Record wall time, input/output node and edge counts, and peak memory of each step of each phase into a DataFrame at g._chain_profile of the result; see also chain_plan(ops).explain(analyze=True)
+    :type profile: bool
+
+    :param limit: Stop once this many complete paths match, returning just their nodes and edges. Requires every edge step to be single-hop, see chain_paths.PathEnumerator
+    :type limit: Optional[int]
+
+    :param return_paths: Also enumerate each matched path into a DataFrame at g._chain_paths of the result, one row per path and one column per step's node or edge id, see chain_paths.paths_table(). Requires every edge step to be single-hop; bound its size with limit
+    :type return_paths: bool
+
     :returns: Plotter
     :rtype: Plotter
 
@@ -142,81 +285,105 @@ def chain(self: Plottable, ops: List[ASTObject]) -> Plottable:
             ])
             print('# hits:', len(g_risky._nodes[ g_risky._nodes.hit ]))
 
+    **Example: Filter by ranges, sets, and prefixes**
+
+    ::
+
+            from graphistry import n, e_forward, gt, isin, startswith
+
+            g_big = g.chain([
+                n({"type": isin(["user", "admin"])}),
+                e_forward({"amount": gt(1000)}),
+                n({"name": startswith("acct_")})
+            ])
+
+    **Example: Peek at any 100 matching paths**
+
+    ::
+
+            from graphistry import n, e_forward
+
+            g_sample = g.chain([n({"type": "user"}), e_forward(), n(), e_forward(), n({"type": "merchant"})], limit=100)
+            g_sample.plot()
+
+    **Example: Table of who paid whom through which account**
+
+    ::
+
+            from graphistry import n, e_forward
+
+            paths_df = g.chain(
+                [n({"type": "user"}, name="payer"), e_forward(name="paid"), n(name="account"), e_forward(), n(name="payee")],
+                return_paths=True, limit=10000
+            )._chain_paths
+
     """
 
     if len(ops) == 0:
         return self
 
-    logger.debug('orig chain >> %s', ops)
+    enumerate_paths = limit is not None or return_paths
+    if enumerate_paths:
+        if limit is not None and limit < 0:
+            raise ValueError(f'limit must be non-negative, got {limit}')
+        if not is_path_chain(ops):
+            raise ValueError('chain() limit and return_paths require every edge step to be single-hop, without to_fixed_point')
 
-    if isinstance(ops[0], ASTEdge):
-        logger.debug('adding initial node to ensure initial link has needed reversals')
-        ops = cast(List[ASTObject], [ ASTNode() ]) + ops
+    if is_dask_df(self._edges):
+        if enumerate_paths:
+            raise NotImplementedError('chain() limit and return_paths are not supported for dask edges')
+        return chain_dask(self, pad_ops(ops), plan, profile)
 
-    if isinstance(ops[-1], ASTEdge):
-        logger.debug('adding final node to ensure final link has needed reversals')
-        ops = ops + cast(List[ASTObject], [ ASTNode() ])
+    if cache and not profile:
+        query = ops if not enumerate_paths else {'ops': ops, 'limit': limit, 'return_paths': return_paths}
+        return cached_call(self, 'chain', query, lambda: chain(self, ops, plan, limit=limit, return_paths=return_paths))
 
-    logger.debug('final chain >> %s', ops)
+    ops = pad_ops(ops)
 
     g = self.materialize_nodes()
 
+    if enumerate_paths:
+        # enumerate paths from the more selective end, stopping at limit, and hydrate only their rows
+        g._adjacency_index = adjacency_index(self)
+        g._time_index = getattr(self, '_time_index', None)
+        chain_plan = plan_chain(g, ops, plan)
+        logger.debug('plan >> %s', chain_plan)
+
+        def run_paths() -> Plottable:
+            node_cols, edge_cols, far_cols = PathEnumerator(g, chain_plan.ops_to_run).run(limit)
+            if chain_plan.direction == 'reverse':
+                node_cols, edge_cols, far_cols = node_cols[::-1], edge_cols[::-1], far_cols[::-1]
+            g_paths = paths_subgraph(g, ops, node_cols, edge_cols, far_cols)
+            g_paths._chain_paths = paths_table(g, ops, node_cols, edge_cols) if return_paths else None
+            return g_paths
+
+        with ChainProfiler(profile) as profiler:
+            g_out = profiler.run('paths', 0, f'limit={limit}', run_paths, nodes_in=len(g._nodes), edges_in=len(g._edges))
+        g_out._chain_profile = profiler.to_df() if profile else None
+        return g_out
+
     if g._edge is None:
         if 'index' in g._edges.columns:
             raise ValueError('Edges cannot have column "index", please remove or set as g._edge via bind() or edges()')
         added_edge_index = True
+        index = adjacency_index(self)
         indexed_edges_df = g._edges.reset_index()
         g = g.edges(indexed_edges_df, edge='index')
+        # same rows in the same order, so reuse the cached indexes of the input graph
+        g._adjacency_index = index
+        g._time_index = getattr(self, '_time_index', None)
     else:
         added_edge_index = False
     
 
-    logger.debug('============ FORWARDS ============')
-
-    #forwards
-    g_stack : List[Plottable] = []
-    for op in ops:
-        g_step = (
-            op(
-                g=g,
-                prev_node_wavefront=(
-                    None  # first uses full graph
-                    if len(g_stack) == 0
-                    else g_stack[-1]._nodes
-                )))
-        g_stack.append(g_step)
+    chain_plan = plan_chain(g, ops, plan)
+    logger.debug('plan >> %s', chain_plan)
+    ops = chain_plan.ops_to_run
 
-    encountered_nodes_df = pd.concat([
-        g_step._nodes
-        for g_step in g_stack
-    ]).drop_duplicates(subset=[g._node])
-
-    logger.debug('============ BACKWARDS ============')
-
-    #backwards
-    g_stack_reverse : List[Plottable] = [g_stack[-1]]
-    for (op, g_step) in zip(reversed(ops), reversed(g_stack)):
-        g_step_reverse = (
-            (op.reverse())(
-
-                # all encountered nodes + step's edges
-                g=g_step.nodes(encountered_nodes_df),
-
-                # check for hits against fully valid targets
-                prev_node_wavefront=g_stack_reverse[-1]._nodes
-
-            )
-        )
-        g_stack_reverse.append(g_step_reverse)
-
-    logger.debug('============ COMBINE NODES ============')
-    final_nodes_df = combine_steps(g, 'nodes', list(zip(reversed(ops), g_stack_reverse[1:])))
-
-    logger.debug('============ COMBINE EDGES ============')
-    final_edges_df = combine_steps(g, 'edges', list(zip(reversed(ops), g_stack_reverse[1:])))
-    if added_edge_index:
-        final_edges_df = final_edges_df.drop(columns=['index'])
+    with ChainProfiler(profile) as profiler:
+        g_out = run_chain(g, ops, chain_plan.direction, added_edge_index, profiler)
 
-    g_out = g.nodes(final_nodes_df).edges(final_edges_df)
+    g_out._chain_profile = profiler.to_df() if profile else None
+    g_out._chain_paths = None
 
     return g_out
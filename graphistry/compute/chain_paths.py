@@ -0,0 +1,256 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+from .adjacency import REVERSALS, adjacency_index, time_index
+from .ast import ASTObject, ASTNode, ASTEdge
+from .filter_by_dict import match_by_dict
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+# edges gathered per expansion of partial paths, bounding memory
+PATH_EXPANSION_EDGES = 1 << 18
+
+
+def is_path_chain(ops: List[ASTObject]) -> bool:
+    """
+    Whether each edge step of ops crosses exactly one edge, so matches can be enumerated as fixed-width paths
+    """
+    return all(
+        not isinstance(op, ASTEdge) or (op._hops == 1 and not op._to_fixed_point)
+        for op in ops
+    )
+
+
+class PathEnumerator(object):
+    """
+    Enumerates the paths matched by a chain of node and single-hop edge steps as integer code columns
+
+    Nodes are coded by their position in the node table, and edges by their row position. Partial paths advance
+    one step at a time over the graph's cached adjacency index (see adjacency_index), depth first over chunks of
+    at most PATH_EXPANSION_EDGES gathered edges, so enumeration stops as soon as a limit of complete paths is reached,
+    and memory stays bounded by the chunk size.
+
+    Edges with an endpoint missing from the node table are never on a match, as in chain().
+    """
+
+    def __init__(self, g: Plottable, ops: List[ASTObject]):
+
+        node, src, dst = g._node, g._source, g._destination
+        if node is None or src is None or dst is None:
+            raise ValueError('Node, source, and destination bindings cannot be None, please set via bind(), nodes(), or edges()')
+        self.g = g
+        self.ops = ops
+
+        ids = pd.Index(g._nodes[node].to_numpy())
+        if not ids.is_unique:
+            raise ValueError(f'Node ids in column "{node}" must be unique')
+        self.n_nodes = len(ids)
+
+        # node table positions <-> index codes, with -1 for nodes without edges and for edge ids without nodes
+        self.index = adjacency_index(g)
+        self.pos_codes = self.index.encode(ids)
+        self.code_pos = np.full(self.index.n_nodes, -1, dtype=np.int64)
+        self.code_pos[self.pos_codes[self.pos_codes >= 0]] = np.flatnonzero(self.pos_codes >= 0)
+
+    def node_mask(self, filter_dict: Optional[dict]) -> Optional[np.ndarray]:
+        hits = match_by_dict(self.g._nodes, filter_dict)
+        return hits.to_numpy() if hits is not None else None
+
+    def edge_mask(self, op: ASTEdge) -> Optional[np.ndarray]:
+        hits = match_by_dict(self.g._edges, op._edge_match)
+        mask = hits.to_numpy() if hits is not None else None
+        if op._time_col is not None and op._time_window is not None:
+            t_index = time_index(self.g, op._time_col)
+            lo, hi = t_index.window_ranks(op._time_window)
+            in_window = (t_index.ranks >= lo) & (t_index.ranks < hi)
+            mask = in_window if mask is None else mask & in_window
+        return mask
+
+    def frontier(self, last: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        -> rows of last with edges, and their index codes
+        """
+        codes = self.pos_codes[last]
+        rows = np.flatnonzero(codes >= 0)
+        return rows, codes[rows]
+
+    def expand(
+        self, op: ASTEdge, last: np.ndarray, edge_mask: Optional[np.ndarray], dest_mask: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        -> for each path extension along op: the extended path's row in last, the edge crossed, and its far node
+        """
+        frontier_rows, codes = self.frontier(last)
+        rows_list, edges_list, far_list = [], [], []
+        for reverse in REVERSALS[op._direction]:
+            edge_pos = self.index.frontier_edges(codes, reverse=reverse)
+            rows = np.repeat(frontier_rows, self.index.frontier_degrees(codes, reverse=reverse))
+            far = self.code_pos[(self.index.src_codes if reverse else self.index.dst_codes)[edge_pos]]
+            keep = far >= 0
+            if edge_mask is not None:
+                keep &= edge_mask[edge_pos]
+            if dest_mask is not None:
+                keep &= dest_mask[far]
+            if reverse and op._direction == 'undirected':
+                # self-loops were already crossed forward
+                keep &= far != last[rows]
+            rows_list.append(rows[keep])
+            edges_list.append(edge_pos[keep])
+            far_list.append(far[keep])
+        return np.concatenate(rows_list), np.concatenate(edges_list), np.concatenate(far_list)
+
+    def chunks(self, op: ASTEdge, last: np.ndarray) -> List[slice]:
+        """
+        Split partial paths so each chunk gathers at most PATH_EXPANSION_EDGES edges (or one path's worth)
+        """
+        # only rows with edges, as the index has no codes at all when edges are empty
+        frontier_rows, codes = self.frontier(last)
+        degrees = np.zeros(len(last), dtype=np.int64)
+        for reverse in REVERSALS[op._direction]:
+            degrees[frontier_rows] += self.index.frontier_degrees(codes, reverse=reverse)
+        total = np.cumsum(degrees)
+        if len(last) <= 1 or total[-1] <= PATH_EXPANSION_EDGES:
+            return [slice(0, len(last))]
+        bounds = np.searchsorted(total, np.arange(PATH_EXPANSION_EDGES, total[-1], PATH_EXPANSION_EDGES), side='right')
+        bounds = np.unique(np.concatenate([[0], np.maximum(bounds, 1), [len(last)]]))
+        return [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def run(self, limit: Optional[int] = None) -> Tuple[List[np.ndarray], List[np.ndarray], List[np.ndarray]]:
+        """
+        Paths as aligned columns, up to limit paths:
+        node codes for each node step, edge rows for each edge step, and far node codes for each edge step
+        """
+        node_masks = [self.node_mask(op._filter_dict) if isinstance(op, ASTNode) else None for op in self.ops]
+        edge_masks = [self.edge_mask(op) if isinstance(op, ASTEdge) else None for op in self.ops]
+        src_masks = [self.node_mask(op._source_node_match) if isinstance(op, ASTEdge) else None for op in self.ops]
+        dst_masks = [self.node_mask(op._destination_node_match) if isinstance(op, ASTEdge) else None for op in self.ops]
+
+        n_node_steps = sum(isinstance(op, ASTNode) for op in self.ops)
+        n_cols = n_node_steps + 2 * (len(self.ops) - n_node_steps)
+        done: List[List[np.ndarray]] = [[] for _ in range(n_cols)]
+        n_done = 0
+
+        # partial paths: (next op, columns so far in op order, current node codes), where each
+        # node step adds its node column, and each edge step its edge and far node columns
+        stack: List[Tuple[int, List[np.ndarray], np.ndarray]] = [(0, [], np.arange(self.n_nodes))]
+        while len(stack) > 0 and (limit is None or n_done < limit):
+            i, cols, last = stack.pop()
+            if len(last) == 0:
+                continue
+
+            if i == len(self.ops):
+                if limit is not None and n_done + len(last) > limit:
+                    cols = [c[:limit - n_done] for c in cols]
+                for col, acc in zip(cols, done):
+                    acc.append(col)
+                n_done += len(cols[0])
+                continue
+
+            op = self.ops[i]
+            if isinstance(op, ASTNode):
+                mask = node_masks[i]
+                if mask is not None:
+                    keep = mask[last]
+                    cols, last = [c[keep] for c in cols], last[keep]
+                stack.append((i + 1, cols + [last], last))
+            elif isinstance(op, ASTEdge):
+                src_mask = src_masks[i]
+                if src_mask is not None:
+                    keep = src_mask[last]
+                    cols, last = [c[keep] for c in cols], last[keep]
+                if len(last) == 0:
+                    continue
+                parts = self.chunks(op, last)
+                if len(parts) > 1:
+                    # depth first: the first chunk is expanded first
+                    for part in reversed(parts):
+                        stack.append((i, [c[part] for c in cols], last[part]))
+                    continue
+                rows, edge_pos, far = self.expand(op, last, edge_masks[i], dst_masks[i])
+                stack.append((i + 1, [c[rows] for c in cols] + [edge_pos, far], far))
+            else:
+                raise ValueError(f'Unexpected chain op type: {type(op)}')
+
+        logger.debug('PathEnumerator: %s paths', n_done)
+
+        out = [np.concatenate(acc) if len(acc) > 0 else np.zeros(0, dtype=np.int64) for acc in done]
+        node_cols: List[np.ndarray] = []
+        edge_cols: List[np.ndarray] = []
+        far_cols: List[np.ndarray] = []
+        for op in self.ops:
+            if isinstance(op, ASTNode):
+                node_cols.append(out.pop(0))
+            else:
+                edge_cols.append(out.pop(0))
+                far_cols.append(out.pop(0))
+        return node_cols, edge_cols, far_cols
+
+
+def paths_subgraph(
+    g: Plottable,
+    ops: List[ASTObject],
+    node_cols: List[np.ndarray],
+    edge_cols: List[np.ndarray],
+    far_cols: List[np.ndarray]
+) -> Plottable:
+    """
+    Nodes and edges on enumerated paths, laid out as chain() output: named steps tag their rows, and rows follow input order
+
+    ops are as the caller gave them, with columns from PathEnumerator(g, ops).run() in the same step order
+    """
+    node = g._node
+    node_ops = [op for op in ops if isinstance(op, ASTNode)]
+    edge_ops = [op for op in ops if isinstance(op, ASTEdge)]
+
+    edge_rows = np.unique(np.concatenate(edge_cols)) if len(edge_cols) > 0 else np.zeros(0, dtype=np.int64)
+    edges_df = g._edges.iloc[edge_rows].reset_index(drop=True)
+
+    # far nodes include any intermediate nodes between consecutive edge steps
+    node_rows = np.unique(np.concatenate(node_cols + far_cols))
+    nodes_df = g._nodes.iloc[node_rows].reset_index(drop=True)
+
+    # last-to-first, as chain() tags steps
+    node_tags: Dict[str, np.ndarray] = {}
+    for op, col in reversed(list(zip(node_ops, node_cols))):
+        if op._name is not None:
+            hits = np.isin(node_rows, col)
+            node_tags[op._name] = node_tags[op._name] | hits if op._name in node_tags else hits
+    edge_tags: Dict[str, np.ndarray] = {}
+    for op, col in reversed(list(zip(edge_ops, edge_cols))):
+        if op._name is not None:
+            hits = np.isin(edge_rows, col)
+            edge_tags[op._name] = edge_tags[op._name] | hits if op._name in edge_tags else hits
+
+    nodes_df = nodes_df.assign(**node_tags)
+    nodes_df = nodes_df[[node] + list(node_tags.keys()) + [c for c in g._nodes.columns if c != node and c not in node_tags]]
+    edges_df = edges_df.assign(**edge_tags)
+    lead = [g._edge] if g._edge is not None else []
+    edges_df = edges_df[lead + list(edge_tags.keys()) + [c for c in g._edges.columns if c not in lead and c not in edge_tags]]
+
+    # as in chain(), a labelled step marks the edges it crossed and the nodes they reached with hop 1
+    for op, col, far in zip(edge_ops, edge_cols, far_cols):
+        if op._label_hops is not None:
+            nodes_df[op._label_hops] = np.where(np.isin(node_rows, far), 1, -1).astype(np.int32)
+            edges_df[op._label_hops] = np.where(np.isin(edge_rows, col), 1, -1).astype(np.int32)
+
+    return g.nodes(nodes_df).edges(edges_df)
+
+
+def paths_table(g: Plottable, ops: List[ASTObject], node_cols: List[np.ndarray], edge_cols: List[np.ndarray]) -> pd.DataFrame:
+    """
+    One row per enumerated path, with one column per step of ops: the node id of node steps, and the edge id of
+    edge steps (g._edge, or the edge table's index when unbound)
+
+    Columns are named by the step's name, or step_<i> for unnamed steps and repeated names, in step order
+    """
+    node_ids = g._nodes[g._node].to_numpy()
+    edge_ids = g._edges[g._edge].to_numpy() if g._edge is not None else g._edges.index.to_numpy()
+    node_iter, edge_iter = iter(node_cols), iter(edge_cols)
+    cols = {}
+    for i, op in enumerate(ops):
+        col = op._name if op._name is not None and op._name not in cols else f'step_{i}'
+        cols[col] = node_ids[next(node_iter)] if isinstance(op, ASTNode) else edge_ids[next(edge_iter)]
+    return pd.DataFrame(cols)
@@ -0,0 +1,203 @@
+from typing import List, Optional
+from typing_extensions import Literal
+import numpy as np
+
+from graphistry.Plottable import Plottable
+from .ast import ASTObject, ASTNode, ASTEdge
+from .filter_by_dict import match_by_dict
+
+
+PlanDirection = Literal['auto', 'forward', 'reverse']
+
+
+def reverse_ops(ops: List[ASTObject]) -> List[ASTObject]:
+    """
+    Equivalent chain when traversed from the last op to the first
+    """
+    return [op.reverse() for op in reversed(ops)]
+
+
+def is_reversible(ops: List[ASTObject]) -> bool:
+    """
+    Whether traversing ops from either end yields the same matches
+
+    chain() narrows each step to the nodes of its neighbours rather than tracking whole paths, so for
+    multi-hop and undirected edges the result depends on the end it starts from: only plan those forward.
+    Hop labels count from the start of each step, so labelled chains also run forward.
+    """
+    for op in ops:
+        if isinstance(op, ASTEdge):
+            if op._hops != 1 or op._to_fixed_point or op._direction == 'undirected':
+                return False
+            if op._label_hops is not None:
+                return False
+    return True
+
+
+def count_nodes(g: Plottable, filter_dicts: List[Optional[dict]]) -> int:
+    """
+    Number of nodes matching all filter dicts
+    """
+    hits = np.ones(len(g._nodes), dtype=bool)
+    for filter_dict in filter_dicts:
+        mask = match_by_dict(g._nodes, filter_dict)
+        if mask is not None:
+            hits &= mask.to_numpy()
+    return int(hits.sum())
+
+
+class ChainStepEstimate(object):
+    """
+    Cheap statistics for one chain step: matched node count, or matched edge fraction
+    """
+    def __init__(self, op: ASTObject, nodes: Optional[int] = None, edge_selectivity: Optional[float] = None):
+        self.op = op
+        self.nodes = nodes
+        self.edge_selectivity = edge_selectivity
+
+    def __repr__(self) -> str:
+        if self.nodes is not None:
+            return f'{self.op}  est. {self.nodes} nodes'
+        return f'{self.op}  est. edge selectivity {self.edge_selectivity:.3g}'
+
+
+class ChainPlan(object):
+    """
+    Traversal plan for chain(): which end the forward wavefront starts from
+
+    Build via g.chain_plan(ops), and inspect via explain()
+    """
+
+    def __init__(
+        self,
+        ops: List[ASTObject],
+        direction: Literal['forward', 'reverse'],
+        estimates: List[ChainStepEstimate],
+        forward_cost: Optional[int] = None,
+        reverse_cost: Optional[int] = None,
+        reason: str = ''
+    ):
+        self.ops = ops
+        self.direction = direction
+        self.estimates = estimates
+        self.forward_cost = forward_cost
+        self.reverse_cost = reverse_cost
+        self.reason = reason
+        # set by chain_plan() so explain(analyze=True) can run the chain
+        self.g: Optional[Plottable] = None
+
+    @property
+    def ops_to_run(self) -> List[ASTObject]:
+        return self.ops if self.direction == 'forward' else reverse_ops(self.ops)
+
+    def explain(self, analyze: bool = False) -> str:
+        """
+        Human-readable summary of the chosen plan and the statistics behind it
+
+        When analyze is set, also run the chain with profile=True and append its per-step measurements
+        """
+        lines = [f'ChainPlan(direction={self.direction}): {self.reason}']
+        if self.forward_cost is not None:
+            lines.append(f'  start cost: forward={self.forward_cost}, reverse={self.reverse_cost}')
+        for i, estimate in enumerate(self.estimates):
+            lines.append(f'  [{i}] {estimate}')
+        if analyze:
+            if self.g is None:
+                raise ValueError('explain(analyze=True) needs a plan built via g.chain_plan(ops)')
+            profile = self.g.chain(self.ops, plan=self.direction, profile=True)._chain_profile
+            if profile is None:
+                raise ValueError('explain(analyze=True) needs a chain with at least one step to profile')
+            lines.append('  profile (steps in run order):')
+            lines.extend(f'  {line}' for line in profile.to_string(index=False).split('\n'))
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return self.explain()
+
+
+def plan_chain(g: Plottable, ops: List[ASTObject], direction: PlanDirection = 'auto') -> ChainPlan:
+    """
+    Pick the end of a chain whose initial wavefront is smallest
+
+    Expects ops to start and end with an ASTNode, and g to have materialized nodes.
+
+    The start cost of an end is the number of nodes matching its node filter and, when the adjacent
+    edge filters its seeds, that edge's seed filter. Traversing from either end yields the same matches,
+    so when ops are reversible and the last end is smaller, the wavefront starts there instead.
+    """
+
+    estimates: List[ChainStepEstimate] = []
+    for op in ops:
+        if isinstance(op, ASTNode):
+            estimates.append(ChainStepEstimate(op, nodes=count_nodes(g, [op._filter_dict])))
+        elif isinstance(op, ASTEdge):
+            mask = match_by_dict(g._edges, op._edge_match)
+            n_edges = len(g._edges)
+            selectivity = 1.0 if mask is None or n_edges == 0 else float(mask.sum()) / n_edges
+            estimates.append(ChainStepEstimate(op, edge_selectivity=selectivity))
+        else:
+            raise ValueError(f'Unexpected chain op type: {type(op)}')
+
+    if direction == 'reverse' and not is_reversible(ops):
+        raise ValueError(
+            'Cannot plan a chain with multi-hop, undirected, or hop-labelled edges in reverse, use plan="auto" or plan="forward"')
+
+    if direction != 'auto':
+        return ChainPlan(ops, direction, estimates, reason='set by caller')
+
+    if len(ops) < 3:
+        return ChainPlan(ops, 'forward', estimates, reason='single step')
+
+    if not is_reversible(ops):
+        return ChainPlan(ops, 'forward', estimates, reason='multi-hop, undirected, or hop-labelled edge is direction-sensitive')
+
+    first, second, penultimate, last = ops[0], ops[1], ops[-2], ops[-1]
+    assert isinstance(first, ASTNode) and isinstance(last, ASTNode)
+    forward_cost = count_nodes(g, [
+        first._filter_dict,
+        second._source_node_match if isinstance(second, ASTEdge) else None
+    ])
+    reverse_cost = count_nodes(g, [
+        last._filter_dict,
+        penultimate._destination_node_match if isinstance(penultimate, ASTEdge) else None
+    ])
+
+    if reverse_cost < forward_cost:
+        return ChainPlan(ops, 'reverse', estimates, forward_cost, reverse_cost, reason='last step is more selective')
+    return ChainPlan(ops, 'forward', estimates, forward_cost, reverse_cost, reason='first step is at least as selective')
+
+
+def chain_plan(self: Plottable, ops: List[ASTObject], plan: PlanDirection = 'auto') -> ChainPlan:
+    """
+    Traversal plan chain(ops) would use, without running it
+
+    chain() starts its wavefront from the end of ops with the fewest matching nodes when traversing
+    from either end gives the same matches, so all-single-hop directed chains anchored on a selective last node
+    avoid sweeping out from a large first step.
+
+    :param ops: List[ASTobject] Various node and edge matchers, as for chain()
+    :param plan: 'auto' (default), 'forward', or 'reverse'
+
+    :returns: ChainPlan, see explain() for a readable summary
+
+    **Example: Inspect the plan for a chain**
+        ::
+
+            from graphistry.ast import n, e_forward
+
+            print(g.chain_plan([ n(), e_forward(), n({g._node: "a"}) ]).explain())
+
+    **Example: Measure each step of the plan**
+        ::
+
+            print(g.chain_plan([ n(), e_forward(), n({g._node: "a"}) ]).explain(analyze=True))
+
+    """
+
+    if isinstance(ops[0], ASTEdge):
+        ops = [ ASTNode() ] + ops
+    if isinstance(ops[-1], ASTEdge):
+        ops = ops + [ ASTNode() ]
+    out = plan_chain(self.materialize_nodes(), ops, plan)
+    out.g = self
+    return out
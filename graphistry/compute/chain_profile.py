@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict, List, Optional
+import time, tracemalloc
+import pandas as pd
+
+from graphistry.Plottable import Plottable
+
+
+PROFILE_COLUMNS = [
+    'phase', 'step', 'op', 'wall_s',
+    'nodes_in', 'edges_in', 'nodes_out', 'edges_out',
+    'peak_bytes'
+]
+
+
+def df_len(df: Any) -> int:
+    return 0 if df is None else len(df)
+
+
+class ChainProfiler(object):
+    """
+    Records wall time, input/output table sizes, and peak traced memory of each chain() step
+
+    A disabled profiler just runs steps, so chain() pays nothing when profiling is off.
+
+    Peak memory is measured with tracemalloc, which numpy and pandas allocations report to,
+    and is the peak during the step above its starting allocation.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.rows: List[Dict[str, Any]] = []
+        self._owns_tracing = False
+
+    def __enter__(self) -> 'ChainProfiler':
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def run(
+        self,
+        phase: str,
+        step: int,
+        op: Any,
+        fn: Callable[[], Any],
+        nodes_in: Optional[int] = None,
+        edges_in: Optional[int] = None
+    ) -> Any:
+        """
+        Run fn(), recording a row when enabled; output sizes come from a Plottable or DataFrame result
+        """
+        if not self.enabled:
+            return fn()
+
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        mem_start, _ = tracemalloc.get_traced_memory()
+        t0 = time.perf_counter()
+
+        out = fn()
+
+        wall_s = time.perf_counter() - t0
+        _, mem_peak = tracemalloc.get_traced_memory()
+
+        if isinstance(out, Plottable):
+            nodes_out, edges_out = df_len(out._nodes), df_len(out._edges)
+        elif phase == 'combine' and op == 'edges':
+            nodes_out, edges_out = None, df_len(out)
+        else:
+            nodes_out, edges_out = df_len(out), None
+
+        self.rows.append({
+            'phase': phase,
+            'step': step,
+            'op': str(op),
+            'wall_s': wall_s,
+            'nodes_in': nodes_in,
+            'edges_in': edges_in,
+            'nodes_out': nodes_out,
+            'edges_out': edges_out,
+            'peak_bytes': max(mem_peak - mem_start, 0)
+        })
+        return out
+
+    def to_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self.rows, columns=PROFILE_COLUMNS).astype({
+            'nodes_in': 'Int64', 'edges_in': 'Int64', 'nodes_out': 'Int64', 'edges_out': 'Int64'
+        })
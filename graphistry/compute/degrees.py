@@ -0,0 +1,71 @@
+from typing import Any, Dict, Optional
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+
+
+def degree_counts(ids: pd.Index, edges: pd.DataFrame, col: str, weight: Optional[str]) -> np.ndarray:
+    """
+    Count (or sum weight over) the edges whose col value is each of ids, in one bincount over positional codes
+    """
+    codes = ids.get_indexer(edges[col])
+    valid = (codes >= 0) & edges[col].notna().to_numpy()
+    if weight is None:
+        return np.bincount(codes[valid], minlength=len(ids)).astype(np.int32)
+    weights = edges[weight].to_numpy(dtype=np.float64)
+    return np.bincount(codes[valid], weights=weights[valid], minlength=len(ids))
+
+
+def degree_frame(edges: Any, col: str, out_col: str, node: str, weight: Optional[str]) -> Any:
+    """
+    Per-node edge count (or weight sum) over col, via a groupby for engines without positional gathers
+    """
+    if weight is None:
+        return edges[[col]].assign(**{out_col: 1}).groupby(col).agg({out_col: 'sum'}).reset_index().rename(columns={col: node})
+    return edges[[col, weight]].groupby(col).agg({weight: 'sum'}).reset_index().rename(columns={col: node, weight: out_col})
+
+
+def degrees(
+    g: Plottable,
+    g_nodes: Plottable,
+    degree_in: Optional[str] = None,
+    degree_out: Optional[str] = None,
+    col: Optional[str] = None,
+    weight: Optional[str] = None
+) -> Plottable:
+    """
+    Decorate g_nodes._nodes with in, out, and total degree columns, computed from g._edges in one pass
+
+    Each column is only generated when its name is given, and col (total) requires both others.
+    pandas tables are counted by bincount over node table positions and attached positionally, without a join.
+    Other engines (cudf, dask) count with one groupby per side, and the sides are combined before a single join onto the nodes.
+
+    weight: optional edge column whose sums replace edge counts
+    """
+    src, dst, node = g._source, g._destination, g_nodes._node
+    if src is None or dst is None or node is None:
+        raise ValueError('Node, source, and destination bindings cannot be None, please set via bind(), nodes(), or edges()')
+
+    sides = {c: key for c, key in [(degree_in, dst), (degree_out, src)] if c is not None}
+    generated = list(sides.keys()) + ([col] if col is not None else [])
+    nodes = g_nodes._nodes
+    nodes = nodes[[c for c in nodes.columns if c not in generated]]
+    edges = g._edges
+
+    fill_dtype = 'int32' if weight is None else 'float64'
+    ids = pd.Index(nodes[node].to_numpy()) if isinstance(nodes, pd.DataFrame) else None
+    if ids is not None and isinstance(edges, pd.DataFrame) and ids.is_unique:
+        out: Dict[str, Any] = {c: degree_counts(ids, edges, key, weight) for c, key in sides.items()}
+        nodes_df = nodes.assign(**out)
+    else:
+        counts = None
+        for c, key in sides.items():
+            side = degree_frame(edges, key, c, node, weight)
+            counts = side if counts is None else counts.merge(side, how='outer', on=node)
+        nodes_df = nodes.merge(counts, how='left', on=node)
+        nodes_df = nodes_df.assign(**{c: nodes_df[c].fillna(0).astype(fill_dtype) for c in sides})
+
+    if col is not None:
+        nodes_df = nodes_df.assign(**{col: nodes_df[degree_in] + nodes_df[degree_out]})
+
+    return g.nodes(nodes_df, node)
@@ -0,0 +1,98 @@
+from typing import Any
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+from .adjacency import index_dtype
+
+
+def encode_ids(self: Plottable) -> Plottable:
+    """
+    Replace node ids with dense integer codes in both g._nodes[g._node] and g._edges[g._source/g._destination]
+
+    Compute methods (materialize_nodes, get_degrees, hop, keep_nodes, drop_nodes, chain, ...) then join and
+    dedupe on the small integer codes instead of the original ids, which is much cheaper for long string ids.
+    Call decode_ids() on the result to restore the original ids.
+
+    Codes follow node table order, and any edge endpoints missing from the node table are appended after.
+
+    Node ids passed to compute methods of an encoded graph, such as hop(nodes=...) and keep_nodes(...),
+    must be codes: use node_codes() to translate original ids.
+
+    Idempotent: returns the graph unchanged when already encoded
+
+    **Example: Run a pipeline over encoded ids**
+
+        ::
+
+            edges = pd.DataFrame({'s': ['a','b','c','d'], 'd': ['c','c','e','e']})
+            g = graphistry.edges(edges, 's', 'd').encode_ids()
+            g2 = g.hop(pd.DataFrame({g._node: g.node_codes(['a'])}), hops=2).get_degrees().decode_ids()
+            print(g2._nodes)  # pd.DataFrame with original 'id' values
+
+    """
+
+    if getattr(self, '_node_encoding', None) is not None:
+        return self
+
+    g = self.materialize_nodes()
+    node, src, dst = g._node, g._source, g._destination
+    if g._edges is None or g._nodes is None or node is None or src is None or dst is None:
+        raise ValueError('Missing edges, nodes, or their bindings; set via .edges() and .nodes()')
+
+    n_nodes = len(g._nodes)
+    n_edges = len(g._edges)
+    codes, uniques = pd.factorize(
+        pd.concat([g._nodes[node], g._edges[src], g._edges[dst]], ignore_index=True)
+    )
+    codes = codes.astype(index_dtype(len(uniques) + 1), copy=False)
+
+    nodes_df = g._nodes.assign(**{node: codes[:n_nodes]})
+    edges_df = g._edges.assign(**{
+        src: codes[n_nodes:n_nodes + n_edges],
+        dst: codes[n_nodes + n_edges:]
+    })
+
+    out = g.nodes(nodes_df).edges(edges_df)
+    out._node_encoding = pd.Index(uniques)
+    return out
+
+
+def decode_ids(self: Plottable) -> Plottable:
+    """
+    Restore the original node ids of a graph produced by encode_ids()
+
+    Returns the graph unchanged when not encoded
+    """
+
+    encoding = getattr(self, '_node_encoding', None)
+    if encoding is None:
+        return self
+
+    def decode(codes: Any) -> np.ndarray:
+        codes = np.asarray(codes)
+        if (codes < 0).any():
+            return encoding.take(codes, allow_fill=True, fill_value=np.nan).to_numpy()
+        return encoding.take(codes).to_numpy()
+
+    node, src, dst = self._node, self._source, self._destination
+    out = self.bind()
+    if self._edges is not None and src is not None and dst is not None:
+        out = out.edges(self._edges.assign(**{
+            src: decode(self._edges[src]),
+            dst: decode(self._edges[dst])
+        }))
+    if self._nodes is not None and node is not None:
+        out = out.nodes(self._nodes.assign(**{node: decode(self._nodes[node])}))
+    out._node_encoding = None
+    return out
+
+
+def node_codes(self: Plottable, ids: Any) -> np.ndarray:
+    """
+    Translate original node ids into the codes of a graph produced by encode_ids(), with -1 for unknown ids
+    """
+
+    encoding = getattr(self, '_node_encoding', None)
+    if encoding is None:
+        raise ValueError('Graph ids are not encoded, see encode_ids()')
+    return encoding.get_indexer(ids)
@@ -1,22 +1,40 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional
 import pandas as pd
 
 from graphistry.Plottable import Plottable
+from .predicates import ASTPredicate
 
 
-def filter_by_dict(df, filter_dict: Optional[dict] = None) -> pd.DataFrame:
+def match_by_dict(df, filter_dict: Optional[dict] = None) -> Optional[pd.Series]:
     """
-    return df where rows match all values in filter_dict
+    return boolean series of rows in df that match all values in filter_dict, or None when there is no filter
+
+    Values are matched exactly, except for predicates such as gt(0) or isin([...]) (see graphistry.compute.predicates).
+    Each column is evaluated as one vectorized mask and the masks are and-ed together.
     """
 
     if filter_dict is None or filter_dict == {}:
-        return df
+        return None
 
     for col in filter_dict.keys():
         if col not in df.columns:
             raise ValueError(f'Key "{col}" not in columns of df, available columns are: {df.columns}')
 
-    hits = (df[list(filter_dict)] == pd.Series(filter_dict)).all(axis=1)
+    hits = None
+    for col, val in filter_dict.items():
+        col_hits = val(df[col]) if isinstance(val, ASTPredicate) else df[col] == val
+        hits = col_hits if hits is None else hits & col_hits
+    return hits
+
+
+def filter_by_dict(df, filter_dict: Optional[dict] = None) -> pd.DataFrame:
+    """
+    return df where rows match all values in filter_dict
+    """
+
+    hits = match_by_dict(df, filter_dict)
+    if hits is None:
+        return df
     return df[hits]
 
 
@@ -1,8 +1,12 @@
-from typing import List, Optional
-import pandas as pd
+from typing import Any, List, Optional, Tuple
+import numpy as np, pandas as pd
 
 from graphistry.Plottable import Plottable
-from .filter_by_dict import filter_by_dict
+from .adjacency import REVERSALS, AdjacencyIndex, adjacency_index, time_index
+from .filter_by_dict import filter_by_dict, match_by_dict
+from .out_of_core import hop_dask, is_dask_df
+from .paths import dijkstra
+from .result_cache import cached_call, table_fingerprint
 
 
 def hop(self: Plottable,
@@ -13,11 +17,23 @@ def hop(self: Plottable,
     edge_match: Optional[dict] = None,
     source_node_match: Optional[dict] = None,
     destination_node_match: Optional[dict] = None,
-    return_as_wave_front = False
+    return_as_wave_front = False,
+    label_hops: Optional[str] = None,
+    cache: bool = False,
+    time_col: Optional[str] = None,
+    time_window: Optional[Tuple[Any, Any]] = None,
+    time_order: Optional[str] = None,
+    max_cost: Optional[float] = None,
+    label_cost: Optional[str] = None,
+    limit: Optional[int] = None
 ) -> Plottable:
     """
     Given a graph and some source nodes, return subgraph of all paths within k-hops from the sources
 
+    Frontiers are expanded by array gathers against the graph's cached adjacency index (see adjacency_index)
+
+    Dask edges are scanned partition by partition with an in-memory wave front instead, see hop_dask()
+
     g: Plotter
     nodes: dataframe with id column matching g._node. None signifies all nodes (default).
     hops: how many hops to consider, if any bound (default 1)
@@ -27,9 +43,56 @@ def hop(self: Plottable,
     source_node_match: dict of kv-pairs to match nodes before hopping
     destination_node_match: dict of kv-pairs to match nodes after hopping (including intermediate)
     return_as_wave_front: Only return the nodes/edges reached, ignoring past ones (primarily for internal use)
+    label_hops: optional column name, such as 'hop_distance', for the hop on which each node and edge was first reached (0 for matched seeds, -1 for unreached nodes)
+    cache: reuse the result of an identical earlier hop over an unchanged graph, see graphistry.compute.result_cache
+    time_col: optional edge column of timestamps (or any ordered values) for time_window and time_order
+    time_window: optional (start, end) pair, inclusive, of edge times to traverse; None leaves a side open
+    time_order: optional 'increasing' or 'decreasing': each traversed edge must be strictly later (or earlier) than the edge that reached its near node, so paths respect causality
+
+    Temporal constraints are evaluated against a per-node time-sorted edge index (see time_index), so each hop
+    only gathers the edges inside its time range. With a time_order, a node reached again by an earlier (or later)
+    edge is expanded again over the edges it newly enables.
+
+    max_cost: optional bound on the total g._edge_weight of paths from the sources, replacing hops and to_fixed_point
+    label_cost: optional column name, such as 'distance', for the least path cost from the sources to each node, and through each edge to its far node
+
+    Setting max_cost or label_cost switches to a weighted traversal: a multi-source Dijkstra over the nonnegative
+    weights in the g._edge_weight column (see graphistry.compute.paths.dijkstra), where edges with null weights are
+    not traversed. Every edge whose near node is reached within max_cost - weight is returned, along with its far node.
+    It cannot be combined with label_hops or temporal constraints.
+
+    limit: optional cap on returned edges: hopping stops once that many are matched, keeping those reached on the
+    earliest hops (or, when weighted, the cheapest), and only their endpoints among the matched nodes are returned
+
+    **Example: Label nodes by hops from a seed**
+        ::
+
+            g2 = g.hop(pd.DataFrame({g._node: ['a']}), hops=3, label_hops='hop_distance')
+            g2._nodes.groupby('hop_distance').size()
+
+    **Example: Causal spread from a compromised host within a day**
+        ::
+
+            g2 = g.hop(
+                pd.DataFrame({g._node: ['host_1']}), to_fixed_point=True,
+                time_col='time', time_window=('2023-01-01', '2023-01-02'), time_order='increasing')
+
+    **Example: Peek at some of a hub's neighborhood**
+        ::
+
+            g2 = g.hop(pd.DataFrame({g._node: ['hub']}), to_fixed_point=True, limit=100)
+
+    **Example: Hosts within a latency budget, by distance**
+        ::
+
+            g2 = g.bind(edge_weight='latency_ms').hop(
+                pd.DataFrame({g._node: ['host_1', 'host_2']}), max_cost=50, label_cost='latency_to_host')
+
     """
 
-    if not to_fixed_point and not isinstance(hops, int):
+    weighted = max_cost is not None or label_cost is not None
+
+    if not weighted and not to_fixed_point and not isinstance(hops, int):
         raise ValueError(f'Must provide hops int when to_fixed_point is False, received: {hops}')
 
     if direction not in ['forward', 'reverse', 'undirected']:
@@ -38,133 +101,461 @@ def hop(self: Plottable,
     if destination_node_match == {}:
         destination_node_match = None
 
+    if time_col is None and (time_window is not None or time_order is not None):
+        raise ValueError('time_window and time_order require a time_col')
+
+    if time_order not in [None, 'increasing', 'decreasing']:
+        raise ValueError(f'Invalid time_order: "{time_order}", must be one of: None (default), "increasing", "decreasing"')
+
+    if weighted:
+        if label_hops is not None or time_col is not None:
+            raise ValueError('Weighted hop() via max_cost or label_cost cannot be combined with label_hops or time_col')
+        if self._edge_weight is None:
+            raise ValueError('Weighted hop() requires an edge weight binding, please set via bind(edge_weight=...)')
+        if max_cost is not None and max_cost < 0:
+            raise ValueError(f'max_cost must be nonnegative, received: {max_cost}')
+
+    if limit is not None and limit < 0:
+        raise ValueError(f'limit must be nonnegative, received: {limit}')
+
+    if is_dask_df(self._edges):
+        if time_col is not None:
+            raise NotImplementedError('Temporal hop() constraints are not supported for dask edges')
+        if weighted:
+            raise NotImplementedError('Weighted hop() is not supported for dask edges')
+        if limit is not None:
+            raise NotImplementedError('hop() limit is not supported for dask edges')
+        return hop_dask(
+            self, nodes, hops, to_fixed_point, direction, edge_match,
+            source_node_match, destination_node_match, return_as_wave_front, label_hops
+        )
+
+    if cache:
+        query = [
+            table_fingerprint(nodes), hops, to_fixed_point, direction, edge_match,
+            source_node_match, destination_node_match, return_as_wave_front, label_hops,
+            time_col, time_window, time_order, max_cost, label_cost, self._edge_weight, limit
+        ]
+        return cached_call(self, 'hop', query, lambda: hop(
+            self, nodes, hops, to_fixed_point, direction, edge_match,
+            source_node_match, destination_node_match, return_as_wave_front, label_hops,
+            time_col=time_col, time_window=time_window, time_order=time_order,
+            max_cost=max_cost, label_cost=label_cost, limit=limit
+        ))
+
     g2 = self.materialize_nodes()
 
     if nodes is None:
         nodes = g2._nodes
 
-    if g2._edge is None:
-        if 'index' in g2._edges.columns:
-            raise ValueError('Edges cannot have column "index", please remove or set as g._edge via bind() or edges()')
-        edges_indexed = g2.filter_edges_by_dict(edge_match)._edges.reset_index()
-        EDGE_ID = 'index'
-    else:
-        edges_indexed = g2.filter_edges_by_dict(edge_match)._edges
-        EDGE_ID = g2._edge
-
     if g2._node is None:
         raise ValueError('Node binding cannot be None, please set g._node via bind() or nodes()')
 
     if g2._source is None or g2._destination is None:
         raise ValueError('Source and destination binding cannot be None, please set g._source and g._destination via bind() or edges()')
 
+    # reuse across calls: materialize_nodes() does not change edges
+    index = adjacency_index(self)
+
+    edge_hits = match_by_dict(g2._edges, edge_match)
+    edge_mask = edge_hits.to_numpy() if edge_hits is not None else None
+
+    dest_mask = None
+    if destination_node_match is not None:
+        dest_codes = index.encode(filter_by_dict(g2._nodes, destination_node_match)[g2._node])
+        dest_mask = np.zeros(index.n_nodes, dtype=bool)
+        dest_mask[dest_codes[dest_codes >= 0]] = True
+
+    t_index = time_index(self, time_col) if time_col is not None else None
+    if t_index is not None:
+        window_lo, window_hi = t_index.window_ranks(time_window)
+        # time rank of the edge each node was (best) reached by, and as of its last expansion:
+        # with a time_order, a node only needs expanding again over the edges an improved arrival enables
+        increasing = time_order == 'increasing'
+        unreached, seeded = (t_index.n_times, -1) if increasing else (-1, t_index.n_times)
+        arrival = np.full(index.n_nodes, unreached, dtype=np.int64)
+        expanded_arrival = np.full(index.n_nodes, unreached, dtype=np.int64)
+
+    def time_bounds(wave_front: np.ndarray):
+        # -> per frontier node time rank range [lo, hi) of edges to gather
+        lo = np.full(len(wave_front), window_lo, dtype=np.int64)
+        hi = np.full(len(wave_front), window_hi, dtype=np.int64)
+        if time_order == 'increasing':
+            lo = np.maximum(lo, arrival[wave_front] + 1)
+            hi = np.minimum(hi, expanded_arrival[wave_front] + 1)
+        elif time_order == 'decreasing':
+            lo = np.maximum(lo, expanded_arrival[wave_front])
+            hi = np.minimum(hi, arrival[wave_front])
+        return lo, hi
+
+    def expand(wave_front: np.ndarray, reverse: bool, bounds: Optional[Tuple[np.ndarray, np.ndarray]]):
+        # -> edge positions, their frontier-side node codes, their far-side node codes
+        if t_index is not None and bounds is not None:
+            edge_pos = t_index.frontier_edges(wave_front, bounds[0], bounds[1], reverse=reverse)
+        else:
+            edge_pos = index.frontier_edges(wave_front, reverse=reverse)
+        if edge_mask is not None:
+            edge_pos = edge_pos[edge_mask[edge_pos]]
+        near = index.dst_codes if reverse else index.src_codes
+        far = index.src_codes if reverse else index.dst_codes
+        near_codes, far_codes = near[edge_pos], far[edge_pos]
+        # edges to or from null ids (code -1) are never traversed
+        keep = (near_codes >= 0) & (far_codes >= 0)
+        if dest_mask is not None:
+            keep[keep] = dest_mask[far_codes[keep]]
+        return edge_pos[keep], near_codes[keep], far_codes[keep]
+
+    # Traversal state is kept in visited masks so each iteration only costs its frontier:
+    #   node_matched: nodes to output, edge_matched: edges to output, expanded: nodes already hopped from
+    node_matched = np.zeros(index.n_nodes, dtype=bool)
+    edge_matched = np.zeros(index.n_edges, dtype=bool)
+    expanded = np.zeros(index.n_nodes, dtype=bool)
+    if label_hops is not None:
+        node_hop = np.full(index.n_nodes, -1, dtype=np.int32)
+    if label_hops is not None or limit is not None:
+        edge_hop = np.full(index.n_edges, -1, dtype=np.int32)
+    n_edges_matched = 0
+
     hops_remaining = hops
-    wave_front = filter_by_dict(nodes[[ g2._node ]], source_node_match)
-    matches_nodes = None
-    matches_edges = edges_indexed[[EDGE_ID]][:0]
+    wave_front = np.unique(index.encode(filter_by_dict(nodes[[ g2._node ]], source_node_match)[g2._node]))
+    wave_front = wave_front[wave_front >= 0]
+
+    if weighted:
+        return hop_weighted(
+            self, g2, index, wave_front, direction, edge_mask, dest_mask,
+            return_as_wave_front, max_cost, label_cost, limit
+        )
+
+    if time_order is not None:
+        arrival[wave_front] = seeded
+    first_hop = True
+    hop_num = 0
 
     while True:
         if not to_fixed_point and hops_remaining is not None:
             if hops_remaining < 1:
                 break
             hops_remaining = hops_remaining - 1
+        if limit is not None and n_edges_matched >= limit:
+            break
+        hop_num = hop_num + 1
+
+        expanded[wave_front] = True
+        bounds = time_bounds(wave_front) if t_index is not None else None
+        if time_order is not None:
+            expanded_arrival[wave_front] = arrival[wave_front]
+        new_node_ids_list: List[np.ndarray] = []
+        improved_list: List[np.ndarray] = []
+        for reverse in REVERSALS[direction]:
+            edge_pos, near_codes, far_codes = expand(wave_front, reverse, bounds)
+            if time_order is not None:
+                assert t_index is not None  # time_order requires time_col
+                before = arrival[far_codes]
+                (np.minimum if increasing else np.maximum).at(arrival, far_codes, t_index.ranks[edge_pos])
+                improved_list.append(far_codes[arrival[far_codes] != before])
+            if label_hops is not None or limit is not None:
+                fresh = edge_pos[~edge_matched[edge_pos]]
+                edge_hop[fresh] = hop_num
+                n_edges_matched += len(fresh)
+            edge_matched[edge_pos] = True
+            # Finally add initial nodes as confirmed also match edge + post-node predicates, not just pre-node predicates
+            if first_hop and not return_as_wave_front:
+                node_matched[near_codes] = True
+                if label_hops is not None:
+                    node_hop[near_codes] = 0
+            new_node_ids_list.append(far_codes)
+        first_hop = False
 
-        hop_edges_forward = None
-        new_node_ids_forward = None
-        if direction in ['forward', 'undirected']:
-            hop_edges_forward = (
-                wave_front.merge(
-                    edges_indexed[[g2._source, g2._destination, EDGE_ID]].assign(**{g2._node: edges_indexed[g2._source]}),
-                    how='inner',
-                    on=g2._node)
-                [[g2._source, g2._destination, EDGE_ID]]
-            )
-            new_node_ids_forward = hop_edges_forward[[g2._destination]].rename(columns={g2._destination: g2._node}).drop_duplicates()
-
-            if destination_node_match is not None:
-                new_node_ids_forward = filter_by_dict(
-                    g2._nodes.merge(new_node_ids_forward, on=g2._node, how='inner'),
-                    destination_node_match
-                )[[g2._node]]
-                hop_edges_forward = hop_edges_forward.merge(
-                    new_node_ids_forward.rename(columns={g2._node: g2._destination}),
-                    how='inner',
-                    on=g2._destination
-                )
-
-        hop_edges_reverse = None
-        new_node_ids_reverse = None
-        if direction in ['reverse', 'undirected']:
-            hop_edges_reverse = (
-                wave_front.merge(
-                    edges_indexed[[g2._destination, g2._source, EDGE_ID]].assign(**{g2._node: edges_indexed[g2._destination]}),
-                    how='inner',
-                    on=g2._node)
-                [[g2._destination, g2._source, EDGE_ID]]
-            )
-            new_node_ids_reverse = hop_edges_reverse[[g2._source]].rename(columns={g2._source: g2._node}).drop_duplicates()
-
-            if destination_node_match is not None:
-                new_node_ids_reverse = filter_by_dict(
-                    g2._nodes.merge(new_node_ids_reverse, on=g2._node, how='inner'),
-                    destination_node_match
-                )[[g2._node]]
-                hop_edges_reverse = hop_edges_reverse.merge(
-                    new_node_ids_reverse.rename(columns={g2._node: g2._source}),
-                    how='inner',
-                    on=g2._source
-                )
-
-        mt : List[pd.DataFrame] = []  # help mypy
-
-        matches_edges = pd.concat(
-            [ matches_edges ]
-            + ([ hop_edges_forward[[ EDGE_ID ]] ] if hop_edges_forward is not None else mt)  # noqa: W503
-            + ([ hop_edges_reverse[[ EDGE_ID ]] ] if hop_edges_reverse is not None else mt),  # noqa: W503
-            ignore_index=True, sort=False).drop_duplicates(subset=[EDGE_ID])
-
-        new_node_ids = pd.concat(
-            mt
-                + ( [ new_node_ids_forward ] if new_node_ids_forward is not None else mt )  # noqa: W503
-                + ( [ new_node_ids_reverse] if new_node_ids_reverse is not None else mt ),  # noqa: W503
-            ignore_index=True, sort=False).drop_duplicates()
-
-        # Finally add initial nodes as confirmed also match edge + post-node predicates, not just pre-node predicates 
-        if matches_nodes is None:
-            if return_as_wave_front:
-                matches_nodes = new_node_ids[:0]
-            else:
-                matches_nodes = pd.concat(
-                    mt
-                        + ( [hop_edges_forward[[g2._source]].rename(columns={g2._source: g2._node}).drop_duplicates()]  # noqa: W503
-                            if hop_edges_forward is not None
-                            else mt)
-                        + ( [hop_edges_reverse[[g2._destination]].rename(columns={g2._destination: g2._node}).drop_duplicates()]  # noqa: W503
-                            if hop_edges_reverse is not None
-                            else mt),
-                    ignore_index=True, sort=False).drop_duplicates(subset=[g2._node])
-
-        combined_node_ids = pd.concat([matches_nodes, new_node_ids], ignore_index=True, sort=False).drop_duplicates()
-
-        if len(combined_node_ids) == len(matches_nodes):
+        new_node_ids = np.unique(np.concatenate(new_node_ids_list))
+        unseen = ~node_matched[new_node_ids]
+
+        if time_order is not None:
+            # nodes reached earlier (or later) than before can continue along more edges
+            # far nodes are matched even when not improved, such as seeds, as their edges are
+            node_matched[new_node_ids[unseen]] = True
+            if label_hops is not None:
+                node_hop[new_node_ids[unseen]] = hop_num
+            improved = np.unique(np.concatenate(improved_list))
+            if len(improved) == 0:
+                break
+            wave_front = improved
+            continue
+
+        if not unseen.any():
             #fixedpoint, exit early: future will come to same spot!
             break
-    
-        wave_front = new_node_ids
-        matches_nodes = combined_node_ids
+
+        node_matched[new_node_ids[unseen]] = True
+        if label_hops is not None:
+            node_hop[new_node_ids[unseen]] = hop_num
+        # re-expanding a node cannot reach anything new
+        wave_front = new_node_ids[~expanded[new_node_ids]]
+
+    final_edge_pos = np.flatnonzero(edge_matched)
+    if limit is not None and len(final_edge_pos) > limit:
+        final_edge_pos = limit_edges(index, final_edge_pos, edge_hop[final_edge_pos], limit, node_matched)
+
+    #hydrate edges
+    final_edges = g2._edges.iloc[final_edge_pos].reset_index(drop=True)
+    if label_hops is not None:
+        final_edges[label_hops] = edge_hop[final_edge_pos]
+    g_out = g2.edges(final_edges)
+
+    #hydrate nodes
+    if self._nodes is not None:
+        final_node_ids = index.decode(np.flatnonzero(node_matched))
+        final_nodes = self._nodes[self._nodes[self._node].isin(final_node_ids)].reset_index(drop=True)
+        g_out = g_out.nodes(final_nodes)
+
+    if label_hops is not None:
+        codes = index.encode(g_out._nodes[g_out._node])
+        g_out = g_out.nodes(g_out._nodes.assign(**{
+            label_hops: np.where(codes >= 0, node_hop[codes], -1).astype(np.int32)
+        }))
+
+    return g_out
+
+
+def limit_edges(index: AdjacencyIndex, edge_pos: np.ndarray, rank: np.ndarray, limit: int, node_matched: np.ndarray) -> np.ndarray:
+    """
+    The limit edges of edge_pos with the lowest rank, ties broken by position, in position order
+
+    Narrows node_matched in place to the endpoints of the kept edges
+    """
+    kept = np.sort(edge_pos[np.lexsort((edge_pos, rank))[:limit]])
+    endpoints = np.zeros(len(node_matched), dtype=bool)
+    endpoints[index.src_codes[kept]] = True
+    endpoints[index.dst_codes[kept]] = True
+    node_matched &= endpoints
+    return kept
+
+
+def hop_weighted(
+    self: Plottable,
+    g2: Plottable,
+    index: AdjacencyIndex,
+    seeds: np.ndarray,
+    direction: str,
+    edge_mask: Optional[np.ndarray],
+    dest_mask: Optional[np.ndarray],
+    return_as_wave_front: bool,
+    max_cost: Optional[float],
+    label_cost: Optional[str],
+    limit: Optional[int] = None
+) -> Plottable:
+    """
+    Weighted hop() from seed node codes, after its arguments are validated and edges indexed, see hop()
+    """
+
+    weight = g2._edge_weight
+    if weight not in g2._edges.columns:
+        raise ValueError(f'Edge weight column "{weight}" not found in edges')
+    weights = g2._edges[weight].to_numpy(dtype=np.float64, na_value=np.nan)
+    if (weights < 0).any():
+        raise ValueError(f'Edge weights in column "{weight}" must be nonnegative')
+
+    # traversable arcs: each edge once per direction it may be crossed in
+    traversable = ~np.isnan(weights) & (index.src_codes >= 0) & (index.dst_codes >= 0)
+    if edge_mask is not None:
+        traversable &= edge_mask
+    arcs = []
+    for reverse in REVERSALS[direction]:
+        near, far = (index.dst_codes, index.src_codes) if reverse else (index.src_codes, index.dst_codes)
+        keep = traversable & (dest_mask[np.maximum(far, 0)] if dest_mask is not None else True)
+        edge_pos = np.flatnonzero(keep)
+        arcs.append((edge_pos, near[edge_pos], far[edge_pos]))
+    arc_edges = np.concatenate([a[0] for a in arcs])
+    arc_near = np.concatenate([a[1] for a in arcs])
+    arc_far = np.concatenate([a[2] for a in arcs])
+    arc_weights = weights[arc_edges]
+
+    node_cost = dijkstra(index.n_nodes, arc_near, arc_far, arc_weights, seeds, max_cost)
+
+    arc_cost = node_cost[arc_near] + arc_weights
+    hit = arc_cost <= max_cost if max_cost is not None else np.isfinite(arc_cost)
+    edge_cost = np.full(index.n_edges, np.inf)
+    np.minimum.at(edge_cost, arc_edges[hit], arc_cost[hit])
+
+    node_matched = np.zeros(index.n_nodes, dtype=bool)
+    node_matched[arc_far[hit]] = True
+    if not return_as_wave_front:
+        # as in hop(), seeds are confirmed by leaving along a matched edge
+        seed_mask = np.zeros(index.n_nodes, dtype=bool)
+        seed_mask[seeds] = True
+        node_matched[arc_near[hit][seed_mask[arc_near[hit]]]] = True
+
+    final_edge_pos = np.flatnonzero(np.isfinite(edge_cost))
+    if limit is not None and len(final_edge_pos) > limit:
+        final_edge_pos = limit_edges(index, final_edge_pos, edge_cost[final_edge_pos], limit, node_matched)
 
     #hydrate edges
-    final_edges = edges_indexed.merge(matches_edges, on=EDGE_ID, how='inner')
-    if EDGE_ID not in self._edges:
-        final_edges = final_edges.drop(columns=[EDGE_ID])
+    final_edges = g2._edges.iloc[final_edge_pos].reset_index(drop=True)
+    if label_cost is not None:
+        final_edges[label_cost] = edge_cost[final_edge_pos]
     g_out = g2.edges(final_edges)
 
     #hydrate nodes
     if self._nodes is not None:
-        final_nodes = self._nodes.merge(
-            matches_nodes if matches_nodes is not None else wave_front[:0],
-            on=self._node,
-            how='inner')
+        final_node_ids = index.decode(np.flatnonzero(node_matched))
+        final_nodes = self._nodes[self._nodes[self._node].isin(final_node_ids)].reset_index(drop=True)
         g_out = g_out.nodes(final_nodes)
 
+    if label_cost is not None:
+        codes = index.encode(g_out._nodes[g_out._node])
+        g_out = g_out.nodes(g_out._nodes.assign(**{
+            label_cost: np.where(codes >= 0, node_cost[np.maximum(codes, 0)], np.nan)
+        }))
+
     return g_out
+
+
+def hop_batch(self: Plottable,
+    seeds: pd.DataFrame,
+    seed_col: str = 'seed_id',
+    hops: Optional[int] = 1,
+    to_fixed_point: bool = False,
+    direction: str = 'forward',
+    edge_match: Optional[dict] = None,
+    source_node_match: Optional[dict] = None,
+    destination_node_match: Optional[dict] = None,
+    return_as_wave_front = False
+) -> Plottable:
+    """
+    Run one hop() per seed in a single vectorized pass, returning reached nodes and edges tagged by seed
+
+    Each row of seeds names a start node (column g._node) and the seed it belongs to (column seed_col).
+    The result matches running hop() separately on each seed's nodes and concatenating, with a seed_col
+    column added to both tables: a node or edge reached from several seeds appears once per seed.
+
+    Traversal state is kept as (seed, node) and (seed, edge) integer pairs, so the graph is materialized,
+    indexed, and filtered once for the whole batch instead of once per seed.
+
+    g: Plotter
+    seeds: dataframe with id column matching g._node, and seed_col
+    seed_col: column of seeds identifying each traversal (default 'seed_id')
+    hops, to_fixed_point, direction, edge_match, destination_node_match, return_as_wave_front: see hop()
+    source_node_match: dict of kv-pairs to match seed nodes against the node table before hopping
+
+    **Example: 2-hop neighborhoods of many alerts**
+        ::
+
+            seeds_df = alerts_df[['alert_id', 'host']].rename(columns={'alert_id': 'seed_id', 'host': g._node})
+            g2 = g.hop_batch(seeds_df, hops=2)
+            g2._edges.groupby('seed_id').size()
+
+    """
+
+    if not to_fixed_point and not isinstance(hops, int):
+        raise ValueError(f'Must provide hops int when to_fixed_point is False, received: {hops}')
+
+    if direction not in ['forward', 'reverse', 'undirected']:
+        raise ValueError(f'Invalid direction: "{direction}", must be one of: "forward" (default), "reverse", "undirected"')
+
+    if destination_node_match == {}:
+        destination_node_match = None
+
+    if source_node_match == {}:
+        source_node_match = None
+
+    g2 = self.materialize_nodes()
+
+    if g2._node is None:
+        raise ValueError('Node binding cannot be None, please set g._node via bind() or nodes()')
+
+    if g2._source is None or g2._destination is None:
+        raise ValueError('Source and destination binding cannot be None, please set g._source and g._destination via bind() or edges()')
+
+    if seed_col not in seeds.columns or g2._node not in seeds.columns:
+        raise ValueError(f'Seeds must have columns "{g2._node}" and "{seed_col}", received: {list(seeds.columns)}')
+
+    index = adjacency_index(self)
+
+    edge_hits = match_by_dict(g2._edges, edge_match)
+    edge_mask = edge_hits.to_numpy() if edge_hits is not None else None
+
+    def node_mask(filter_dict: Optional[dict]) -> Optional[np.ndarray]:
+        if filter_dict is None:
+            return None
+        codes = index.encode(filter_by_dict(g2._nodes, filter_dict)[g2._node])
+        mask = np.zeros(index.n_nodes, dtype=bool)
+        mask[codes[codes >= 0]] = True
+        return mask
+
+    src_mask = node_mask(source_node_match)
+    dest_mask = node_mask(destination_node_match)
+
+    # (seed, node) and (seed, edge) pairs are packed into int64 keys: seed * base + code
+    node_base = max(index.n_nodes, 1)
+    edge_base = max(index.n_edges, 1)
+
+    seed_idx, seed_values = pd.factorize(seeds[seed_col])
+    seed_codes = index.encode(seeds[g2._node])
+    # seeds with null ids or seed_col values (-1) are skipped
+    valid = (seed_codes >= 0) & (seed_idx >= 0)
+    if src_mask is not None:
+        valid[valid] = src_mask[seed_codes[valid]]
+    wave_keys = np.unique(seed_idx[valid].astype(np.int64) * node_base + seed_codes[valid])
+
+    node_keys = np.zeros(0, dtype=np.int64)
+    expanded_keys = np.zeros(0, dtype=np.int64)
+    edge_keys_list: List[np.ndarray] = []
+
+    hops_remaining = hops
+    first_hop = True
+
+    while True:
+        if not to_fixed_point and hops_remaining is not None:
+            if hops_remaining < 1:
+                break
+            hops_remaining = hops_remaining - 1
+
+        expanded_keys = np.union1d(expanded_keys, wave_keys)
+        wave_seeds, wave_codes = np.divmod(wave_keys, node_base)
+        near_keys_list: List[np.ndarray] = []
+        new_keys_list: List[np.ndarray] = []
+        for reverse in REVERSALS[direction]:
+            degrees = index.frontier_degrees(wave_codes, reverse=reverse)
+            edge_pos = index.frontier_edges(wave_codes, reverse=reverse)
+            edge_seeds = np.repeat(wave_seeds, degrees)
+            near_codes = np.repeat(wave_codes, degrees)
+            far_codes = (index.src_codes if reverse else index.dst_codes)[edge_pos]
+            keep = far_codes >= 0
+            if edge_mask is not None:
+                keep &= edge_mask[edge_pos]
+            if dest_mask is not None:
+                keep[keep] = dest_mask[far_codes[keep]]
+            edge_seeds = edge_seeds[keep]
+            edge_keys_list.append(edge_seeds * edge_base + edge_pos[keep])
+            # Finally add initial nodes as confirmed also match edge + post-node predicates, as in hop()
+            if first_hop and not return_as_wave_front:
+                near_keys_list.append(edge_seeds * node_base + near_codes[keep])
+            new_keys_list.append(edge_seeds * node_base + far_codes[keep])
+        first_hop = False
+
+        if len(near_keys_list) > 0:
+            node_keys = np.union1d(node_keys, np.concatenate(near_keys_list))
+
+        new_keys = np.unique(np.concatenate(new_keys_list))
+        unseen = ~np.isin(new_keys, node_keys, assume_unique=True)
+
+        if not unseen.any():
+            break
+
+        node_keys = np.union1d(node_keys, new_keys[unseen])
+        # seeds reaching nothing new hit their fixed point, and stop as hop() would
+        live = np.isin(new_keys // node_base, np.unique(new_keys[unseen] // node_base))
+        wave_keys = new_keys[live & ~np.isin(new_keys, expanded_keys, assume_unique=True)]
+
+    #hydrate edges
+    edge_seeds, edge_pos = np.divmod(np.unique(np.concatenate(edge_keys_list)) if len(edge_keys_list) > 0 else np.zeros(0, dtype=np.int64), edge_base)
+    edges_df = g2._edges.iloc[edge_pos].reset_index(drop=True).assign(**{seed_col: seed_values.take(edge_seeds)})
+
+    #hydrate nodes
+    node_seeds, node_codes = np.divmod(node_keys, node_base)
+    nodes_df = pd.DataFrame({
+        seed_col: seed_values.take(node_seeds),
+        g2._node: index.decode(node_codes)
+    }).merge(g2._nodes, on=g2._node, how='inner')
+    nodes_df = nodes_df[[c for c in g2._nodes.columns if c != seed_col] + [seed_col]]
+
+    return g2.nodes(nodes_df).edges(edges_df)
@@ -0,0 +1,209 @@
+from typing import Any, List, Optional, Set
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+from .adjacency import AdjacencyIndex
+from .ast import ASTObject, ASTEdge
+from .chain import chain
+from .out_of_core import is_dask_df
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+# arrival position of each edge, used as the edge id of chain() runs
+EDGE_POS = '__graphistry_edge_pos__'
+
+
+def chain_radius(ops: List[ASTObject]) -> Optional[int]:
+    """
+    Most edges a path matched by ops can have, or None when unbounded
+    """
+    radius = 0
+    for op in ops:
+        if isinstance(op, ASTEdge):
+            if op._to_fixed_point or op._hops is None:
+                return None
+            radius += op._hops
+    return radius
+
+
+class IncrementalChain(object):
+    """
+    Standing chain() query over a graph whose edges keep arriving
+
+    Build via g.chain_incremental(ops), which runs the chain once, then call append_edges(df) per batch
+    for just the newly matched nodes and edges.
+
+    Adding edges never removes matches, and every new match lies on a path through a new edge. Each batch therefore
+    only gathers the edges within the chain's reach (its total hops, ignoring direction) of the new edges' endpoints,
+    and reruns the chain on that neighborhood. Unbounded (to_fixed_point) steps reach the whole connected component.
+
+    New edges are kept in a side table, scanned per batch, until they outgrow merge_ratio of the indexed edges and are
+    merged into the index. Each batch so costs time in proportion to the batch, its neighborhood, and the side table,
+    rather than to the whole graph.
+    """
+
+    def __init__(self, g: Plottable, ops: List[ASTObject], merge_ratio: float = 0.1):
+
+        if is_dask_df(g._edges):
+            raise NotImplementedError('Incremental chain() is not supported for dask edges')
+
+        # without a node table, nodes are whichever ids edges mention, including those of appended edges
+        self._materialize = g._nodes is None
+        g = g.materialize_nodes()
+        node, src, dst = g._node, g._source, g._destination
+        if node is None or src is None or dst is None:
+            raise ValueError('Node, source, and destination bindings cannot be None, please set via bind(), nodes(), or edges()')
+
+        self._g = g
+        self._src: str = src
+        self._dst: str = dst
+        self._ops = ops
+        self._radius = chain_radius(ops)
+        self._merge_ratio = merge_ratio
+
+        self._node_ids = pd.Index(g._nodes[node].to_numpy())
+        if not self._node_ids.is_unique:
+            raise ValueError(f'Node ids in column "{node}" must be unique')
+
+        self._base_edges = g._edges.assign(**{EDGE_POS: np.arange(len(g._edges), dtype=np.int64)})
+        self._base_index = AdjacencyIndex(self._base_edges, src, dst)
+        self._recent_edges: Optional[pd.DataFrame] = None
+        self._n_edges = len(self._base_edges)
+
+        self._matched_nodes: Set[Any] = set()
+        # capacity doubles as edges arrive
+        self._matched_edges = np.zeros(max(self._n_edges, 1), dtype=bool)
+        self._nodes_list: List[pd.DataFrame] = []
+        self._edges_list: List[pd.DataFrame] = []
+
+        self._match(g._nodes, self._base_edges)
+
+    def append_edges(self, edges_df: pd.DataFrame) -> Plottable:
+        """
+        Add a batch of edges, returning a graph of only the nodes and edges it newly matches
+
+        As in chain(), endpoints missing from a given node table are not returned as nodes
+        """
+        src, dst = self._src, self._dst
+        delta = edges_df.assign(**{EDGE_POS: np.arange(self._n_edges, self._n_edges + len(edges_df), dtype=np.int64)})
+        self._n_edges += len(delta)
+        if self._n_edges > len(self._matched_edges):
+            grown = np.zeros(max(self._n_edges, 2 * len(self._matched_edges)), dtype=bool)
+            grown[:len(self._matched_edges)] = self._matched_edges
+            self._matched_edges = grown
+        self._recent_edges = delta if self._recent_edges is None else pd.concat([self._recent_edges, delta], ignore_index=True)
+
+        seeds = pd.Index(pd.concat([delta[src], delta[dst]]).dropna().unique())
+        nodes_df, sub_edges_df = self._neighborhood(seeds)
+        g_new = self._match(nodes_df, sub_edges_df)
+
+        if len(self._recent_edges) > self._merge_ratio * max(len(self._base_edges), 1):
+            self._base_edges = pd.concat([self._base_edges, self._recent_edges], ignore_index=True)
+            self._base_index = AdjacencyIndex(self._base_edges, src, dst)
+            self._recent_edges = None
+
+        return g_new
+
+    def result(self) -> Plottable:
+        """
+        All nodes and edges matched so far, in the order they were first matched
+        """
+        g = self._g
+        nodes_df = pd.concat(self._nodes_list, ignore_index=True) if len(self._nodes_list) > 0 else g._nodes[:0]
+        edges_df = pd.concat(self._edges_list, ignore_index=True) if len(self._edges_list) > 0 else g._edges[:0]
+        return g.nodes(nodes_df).edges(edges_df)
+
+    def _neighborhood(self, seeds: pd.Index):
+        """
+        Nodes and edges within the chain's radius of seeds, ignoring direction
+        """
+        src, dst = self._src, self._dst
+        index = self._base_index
+        recent = self._recent_edges if self._recent_edges is not None else self._base_edges[:0]
+
+        visited = seeds
+        frontier = seeds
+        base_pos: List[np.ndarray] = []
+        recent_pos: List[np.ndarray] = []
+        hop_num = 0
+        while len(frontier) > 0 and (self._radius is None or hop_num < self._radius):
+            hop_num = hop_num + 1
+
+            codes = index.encode(frontier)
+            codes = codes[codes >= 0]
+            out_pos = index.frontier_edges(codes, reverse=False)
+            in_pos = index.frontier_edges(codes, reverse=True)
+            base_pos.extend([out_pos, in_pos])
+            far_codes = np.concatenate([index.dst_codes[out_pos], index.src_codes[in_pos]])
+
+            recent_out = recent[src].isin(frontier).to_numpy()
+            recent_in = recent[dst].isin(frontier).to_numpy()
+            recent_pos.append(np.flatnonzero(recent_out | recent_in))
+
+            far_ids = pd.Index(np.concatenate([
+                index.decode(np.unique(far_codes)).to_numpy(),
+                recent[dst][recent_out].to_numpy(),
+                recent[src][recent_in].to_numpy()
+            ])).dropna().unique()
+            frontier = far_ids.difference(visited)
+            visited = visited.union(frontier)
+
+        edges_df = pd.concat([
+            self._base_edges.iloc[np.unique(np.concatenate(base_pos))] if len(base_pos) > 0 else self._base_edges[:0],
+            recent.iloc[np.unique(np.concatenate(recent_pos))] if len(recent_pos) > 0 else recent[:0]
+        ], ignore_index=True)
+
+        node = self._g._node
+        pos = self._node_ids.get_indexer(visited)
+        nodes_df = self._g._nodes.iloc[np.sort(pos[pos >= 0])]
+        if self._materialize:
+            nodes_df = pd.concat([nodes_df, pd.DataFrame({node: visited[pos < 0]})], ignore_index=True)
+
+        logger.debug('IncrementalChain: %s seeds, neighborhood of %s nodes, %s edges', len(seeds), len(nodes_df), len(edges_df))
+        return nodes_df, edges_df
+
+    def _match(self, nodes_df: pd.DataFrame, edges_df: pd.DataFrame) -> Plottable:
+        """
+        Run the chain over a subgraph, recording and returning matches not seen before
+        """
+        g = self._g
+        out = chain(g.nodes(nodes_df).edges(edges_df, edge=EDGE_POS), self._ops)
+
+        out_edges = out._edges
+        edge_pos = out_edges[EDGE_POS].to_numpy()
+        new_edges = ~self._matched_edges[edge_pos]
+        self._matched_edges[edge_pos] = True
+        out_edges = out_edges[new_edges].sort_values(EDGE_POS).drop(columns=[EDGE_POS]).reset_index(drop=True)
+
+        out_nodes = out._nodes
+        new_nodes = np.array([v not in self._matched_nodes for v in out_nodes[g._node]], dtype=bool)
+        out_nodes = out_nodes[new_nodes].reset_index(drop=True)
+        self._matched_nodes.update(out_nodes[g._node].tolist())
+
+        self._nodes_list.append(out_nodes)
+        self._edges_list.append(out_edges)
+        return g.nodes(out_nodes).edges(out_edges)
+
+
+def chain_incremental(self: Plottable, ops: List[ASTObject], merge_ratio: float = 0.1) -> IncrementalChain:
+    """
+    Standing chain(ops) query that reports only new matches as edges are appended, see IncrementalChain
+
+    :param ops: List[ASTobject] Various node and edge matchers, as in chain()
+    :param merge_ratio: Re-index once appended edges exceed this fraction of the indexed ones
+    :returns: IncrementalChain, whose result() holds the initial matches
+
+    **Example: Refresh a watchlist as edges stream in**
+        ::
+
+            from graphistry import n, e_forward
+
+            watch = g.chain_incremental([n({"watchlist": True}), e_forward(hops=2), n({"type": "account"})])
+            for batch_df in batches:
+                g_new = watch.append_edges(batch_df)
+                print('# new matched edges:', len(g_new._edges))
+
+    """
+    return IncrementalChain(self, ops, merge_ratio)
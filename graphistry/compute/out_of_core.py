@@ -0,0 +1,241 @@
+from typing import Any, List, Optional
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+from .adjacency import REVERSALS
+from .ast import ASTObject, ASTNode, ASTEdge
+from .filter_by_dict import filter_by_dict, match_by_dict
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+# edge row key: partition number and position within it, unique without a global index
+PART = '__graphistry_part__'
+POS = '__graphistry_pos__'
+REVERSED = '__graphistry_reversed__'
+
+
+def is_dask_df(df: Any) -> bool:
+    """
+    Whether df is a partitioned dask (or dask_cudf) DataFrame
+    """
+    if df is None or not type(df).__module__.startswith(('dask', 'dask_cudf')):
+        return False
+    try:
+        import dask.dataframe as dd
+    except ImportError:
+        return False
+    return isinstance(df, dd.DataFrame)
+
+
+def to_local(df: Any) -> Any:
+    """
+    Collect a dask DataFrame into memory, passing local ones through
+    """
+    return df.compute() if is_dask_df(df) else df
+
+
+def select_node_ids(nodes: Any, node: str, filter_dict: Optional[dict]) -> pd.Index:
+    """
+    Ids of nodes matching filter_dict, scanning a dask node table partition by partition
+    """
+    if is_dask_df(nodes):
+        hits = nodes[[node]].map_partitions(filter_by_dict, filter_dict) if filter_dict is not None else nodes[[node]]
+        nodes = hits.compute()
+    else:
+        nodes = filter_by_dict(nodes[[node]], filter_dict)
+    return pd.Index(nodes[node].dropna().unique())
+
+
+def select_edges(
+    df: pd.DataFrame,
+    src: str,
+    dst: str,
+    reversals: List[bool],
+    wave_front: pd.Index,
+    edge_match: Optional[dict],
+    dest_ids: Optional[pd.Index],
+    partition_info: Optional[dict] = None
+) -> pd.DataFrame:
+    """
+    Edges of one partition leaving (or entering, for reversals) the wave front, keyed by partition and position
+    """
+    edge_hits = match_by_dict(df, edge_match)
+    outs = []
+    for reverse in reversals:
+        near, far = (dst, src) if reverse else (src, dst)
+        mask = df[near].isin(wave_front).to_numpy()
+        if edge_hits is not None:
+            mask &= edge_hits.to_numpy()
+        if dest_ids is not None:
+            mask &= df[far].isin(dest_ids).to_numpy()
+        outs.append(df[mask].assign(**{
+            PART: partition_info['number'] if partition_info is not None else 0,
+            POS: np.flatnonzero(mask),
+            REVERSED: reverse
+        }))
+    return pd.concat(outs)
+
+
+def hop_dask(self: Plottable,
+    nodes: Optional[pd.DataFrame] = None,
+    hops: Optional[int] = 1,
+    to_fixed_point: bool = False,
+    direction: str = 'forward',
+    edge_match: Optional[dict] = None,
+    source_node_match: Optional[dict] = None,
+    destination_node_match: Optional[dict] = None,
+    return_as_wave_front = False,
+    label_hops: Optional[str] = None,
+    keep_edge_keys: bool = False
+) -> Plottable:
+    """
+    hop() over dask edges: the wave front is kept in memory while each hop scans the edge table partition by partition
+
+    Reached nodes and edges are assumed to fit in memory and are returned as pandas DataFrames.
+    See hop() for parameters; keep_edge_keys keeps the internal partition/position key columns (for chain())
+    """
+
+    g2 = self.materialize_nodes()
+    node, src, dst = g2._node, g2._source, g2._destination
+    if node is None or src is None or dst is None:
+        raise ValueError('Node, source, and destination bindings cannot be None, please set via bind(), nodes(), or edges()')
+
+    wave_front = select_node_ids(nodes if nodes is not None else g2._nodes, node, source_node_match)
+    dest_ids = (
+        select_node_ids(g2._nodes, node, destination_node_match)
+        if destination_node_match is not None else None
+    )
+
+    meta = select_edges(g2._edges._meta, src, dst, REVERSALS[direction], pd.Index([]), None, None)
+
+    node_matched = pd.Index([])
+    expanded = pd.Index([])
+    edge_hits_list: List[pd.DataFrame] = []
+    node_hops: List[pd.Series] = []
+
+    hops_remaining = hops
+    first_hop = True
+    hop_num = 0
+
+    while True:
+        if not to_fixed_point and hops_remaining is not None:
+            if hops_remaining < 1:
+                break
+            hops_remaining = hops_remaining - 1
+        hop_num = hop_num + 1
+
+        if len(wave_front) == 0:
+            break
+
+        expanded = expanded.union(wave_front)
+        logger.debug('hop_dask %s: scanning for wave front of %s nodes', hop_num, len(wave_front))
+        hits = g2._edges.map_partitions(
+            select_edges, src, dst, REVERSALS[direction], wave_front, edge_match, dest_ids,
+            meta=meta
+        ).compute()
+        if label_hops is not None:
+            hits[label_hops] = np.int32(hop_num)
+        edge_hits_list.append(hits)
+
+        reversed_hits = hits[REVERSED].to_numpy().astype(bool)
+        near_ids = pd.concat([hits[src][~reversed_hits], hits[dst][reversed_hits]])
+        far_ids = pd.concat([hits[dst][~reversed_hits], hits[src][reversed_hits]])
+
+        # Finally add initial nodes as confirmed also match edge + post-node predicates, as in hop()
+        if first_hop and not return_as_wave_front:
+            near_ids = pd.Index(near_ids.unique())
+            node_matched = node_matched.union(near_ids)
+            node_hops.append(pd.Series(0, index=near_ids, dtype=np.int32))
+        first_hop = False
+
+        new_ids = pd.Index(far_ids.unique())
+        unseen = new_ids.difference(node_matched)
+        if len(unseen) == 0:
+            break
+
+        node_matched = node_matched.union(unseen)
+        node_hops.append(pd.Series(hop_num, index=unseen, dtype=np.int32))
+        wave_front = new_ids.difference(expanded)
+
+    #hydrate edges, keeping the first hop each row was reached on
+    if len(edge_hits_list) > 0:
+        edges_df = pd.concat(edge_hits_list).drop_duplicates(subset=[PART, POS])
+    else:
+        edges_df = meta
+    edges_df = edges_df.drop(columns=[REVERSED] if keep_edge_keys else [PART, POS, REVERSED]).reset_index(drop=True)
+
+    #hydrate nodes
+    nodes_df = g2._nodes
+    nodes_df = to_local(
+        nodes_df.map_partitions(lambda df: df[df[node].isin(node_matched)]) if is_dask_df(nodes_df)
+        else nodes_df[nodes_df[node].isin(node_matched)]
+    ).reset_index(drop=True)
+    if label_hops is not None:
+        labels = pd.concat(node_hops) if len(node_hops) > 0 else pd.Series([], dtype=np.int32)
+        labels = labels[~labels.index.duplicated(keep='first')]
+        nodes_df[label_hops] = nodes_df[node].map(labels).fillna(-1).astype(np.int32)
+
+    return g2.nodes(nodes_df).edges(edges_df)
+
+
+def chain_dask(self: Plottable, ops: List[ASTObject], plan: Any = 'auto', profile: bool = False) -> Plottable:
+    """
+    chain() over dask edges
+
+    A forward pass over the partitioned tables collects every node and edge the chain can reach into memory,
+    and chain() then runs on that local subgraph: any full path lies within it, so results match running over
+    the whole graph. The first node matcher should be selective, as its matches seed the scan.
+
+    Expects ops to start and end with an ASTNode
+    """
+
+    g = self.materialize_nodes()
+    node = g._node
+    if node is None:
+        raise ValueError('Node binding cannot be None, please set g._node via bind() or nodes()')
+
+    nodes_list: List[pd.DataFrame] = []
+    edges_list: List[pd.DataFrame] = []
+    wave_front: Optional[pd.DataFrame] = None
+    for op in ops:
+        if isinstance(op, ASTNode):
+            if wave_front is None:
+                wave_front = to_local(
+                    g._nodes.map_partitions(filter_by_dict, op._filter_dict)
+                    if op._filter_dict is not None else g._nodes
+                )
+            else:
+                wave_front = filter_by_dict(wave_front, op._filter_dict)
+        elif isinstance(op, ASTEdge):
+            if op._time_col is not None:
+                raise NotImplementedError('Temporal chain() edge constraints are not supported for dask edges')
+            g_step = hop_dask(
+                g,
+                nodes=wave_front,
+                hops=op._hops,
+                to_fixed_point=op._to_fixed_point,
+                direction=op._direction,
+                edge_match=op._edge_match,
+                source_node_match=op._source_node_match,
+                destination_node_match=op._destination_node_match,
+                return_as_wave_front=True,
+                keep_edge_keys=True
+            )
+            edges_list.append(g_step._edges)
+            wave_front = g_step._nodes
+        else:
+            raise ValueError(f'Unexpected chain op type: {type(op)}')
+        nodes_list.append(wave_front)
+
+    nodes_df = pd.concat(nodes_list).drop_duplicates(subset=[node]).reset_index(drop=True)
+    if len(edges_list) > 0:
+        edges_df = pd.concat(edges_list).drop_duplicates(subset=[PART, POS])
+    else:
+        edges_df = g._edges._meta.assign(**{PART: 0, POS: 0})
+    edges_df = edges_df.drop(columns=[PART, POS]).reset_index(drop=True)
+
+    logger.debug('chain_dask: localized %s nodes, %s edges', len(nodes_df), len(edges_df))
+
+    return g.nodes(nodes_df).edges(edges_df).chain(ops, plan=plan, profile=profile)
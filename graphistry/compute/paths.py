@@ -0,0 +1,185 @@
+from typing import Any, List, Optional, Tuple
+import numpy as np, pandas as pd
+
+from graphistry.Plottable import Plottable
+from .adjacency import REVERSALS, adjacency_index, gather_ranges
+from .algorithms import lazy_csgraph
+from .filter_by_dict import match_by_dict
+
+
+def shortest_path_lengths(self: Plottable,
+    sources: Any,
+    targets: Any,
+    direction: str = 'forward',
+    edge_match: Optional[dict] = None,
+    max_hops: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Unweighted shortest path length, in hops, for each (source, target) pair
+
+    All pairs are solved in one breadth-first search over the graph's cached adjacency index (see adjacency_index):
+    each distinct source is a seed whose frontier advances level by level, and a seed stops once all its targets are found.
+
+    sources: list-like of node ids
+    targets: list-like of node ids, aligned with sources
+    direction: 'forward', 'reverse', 'undirected'
+    edge_match: dict of kv-pairs to exact match edges that may be traversed
+    max_hops: stop searching after this many hops (default unbounded)
+
+    Returns a pd.DataFrame with columns 'source', 'target', and 'distance', in the order of the input pairs,
+    where distance is -1 for unreachable pairs
+
+    **Example: Hops between alert hosts and crown jewels**
+        ::
+
+            dists_df = g.shortest_path_lengths(alerts_df['host'], alerts_df['asset'], direction='undirected')
+
+    """
+
+    if direction not in ['forward', 'reverse', 'undirected']:
+        raise ValueError(f'Invalid direction: "{direction}", must be one of: "forward" (default), "reverse", "undirected"')
+
+    sources = pd.Series(sources).reset_index(drop=True)
+    targets = pd.Series(targets).reset_index(drop=True)
+    if len(sources) != len(targets):
+        raise ValueError(f'Expected as many sources as targets, received {len(sources)} and {len(targets)}')
+
+    index = adjacency_index(self)
+
+    edge_hits = match_by_dict(self._edges, edge_match)
+    edge_mask = edge_hits.to_numpy() if edge_hits is not None else None
+
+    distances = np.full(len(sources), -1, dtype=np.int32)
+    distances[(sources == targets).to_numpy()] = 0
+
+    src_codes = index.encode(sources)
+    tgt_codes = index.encode(targets)
+    pending_pairs = np.flatnonzero((src_codes >= 0) & (tgt_codes >= 0) & (distances < 0))
+
+    # (seed, node) pairs are packed into int64 keys: seed * base + code
+    base = max(index.n_nodes, 1)
+    seed_codes, pair_seeds = np.unique(src_codes[pending_pairs], return_inverse=True)
+    pair_keys = pair_seeds.astype(np.int64) * base + tgt_codes[pending_pairs]
+
+    pending = np.unique(pair_keys)
+    frontier = np.arange(len(seed_codes), dtype=np.int64) * base + seed_codes
+    visited = frontier
+    found_keys: List[np.ndarray] = []
+    found_hops: List[np.ndarray] = []
+
+    hop_num = 0
+    while len(frontier) > 0 and len(pending) > 0 and (max_hops is None or hop_num < max_hops):
+        hop_num = hop_num + 1
+
+        frontier_seeds, frontier_codes = np.divmod(frontier, base)
+        new_keys_list: List[np.ndarray] = []
+        for reverse in REVERSALS[direction]:
+            edge_pos = index.frontier_edges(frontier_codes, reverse=reverse)
+            edge_seeds = np.repeat(frontier_seeds, index.frontier_degrees(frontier_codes, reverse=reverse))
+            if edge_mask is not None:
+                keep = edge_mask[edge_pos]
+                edge_pos = edge_pos[keep]
+                edge_seeds = edge_seeds[keep]
+            far_codes = (index.src_codes if reverse else index.dst_codes)[edge_pos]
+            # edges to null ids (code -1) are never traversed
+            reached = far_codes >= 0
+            new_keys_list.append(edge_seeds[reached] * base + far_codes[reached])
+
+        new_keys = np.unique(np.concatenate(new_keys_list))
+        new_keys = new_keys[~np.isin(new_keys, visited, assume_unique=True)]
+        visited = np.union1d(visited, new_keys)
+
+        found = np.isin(pending, new_keys, assume_unique=True)
+        found_keys.append(pending[found])
+        found_hops.append(np.full(found.sum(), hop_num, dtype=np.int32))
+        pending = pending[~found]
+
+        # seeds with all targets found stop expanding
+        frontier = new_keys[np.isin(new_keys // base, np.unique(pending // base))]
+
+    if len(found_keys) > 0:
+        keys = np.concatenate(found_keys)
+        hops = np.concatenate(found_hops)
+        order = np.argsort(keys)
+        keys, hops = keys[order], hops[order]
+        pos = np.searchsorted(keys, pair_keys)
+        hit = pos < len(keys)
+        hit[hit] = keys[pos[hit]] == pair_keys[hit]
+        distances[pending_pairs[hit]] = hops[pos[hit]]
+
+    return pd.DataFrame({
+        'source': sources,
+        'target': targets,
+        'distance': distances
+    })
+
+
+def dijkstra(
+    n_nodes: int,
+    near: np.ndarray,
+    far: np.ndarray,
+    weights: np.ndarray,
+    seeds: np.ndarray,
+    max_cost: Optional[float] = None
+) -> np.ndarray:
+    """
+    Multi-source shortest path cost from the nearest seed to every node, over arcs near -> far with nonnegative weights
+
+    Uses scipy's csgraph when installed. Otherwise, runs delta-stepping over arrays: open nodes within one average
+    arc weight of the smallest open cost are relaxed together, repeating until their costs stop improving, at which
+    point they are final. Parallel arcs keep their smallest weight.
+
+    Returns costs aligned with node codes, inf for nodes not reached within max_cost
+    """
+    dist = np.full(n_nodes, np.inf)
+    if len(seeds) == 0:
+        return dist
+
+    # sort arcs by near node, keeping the lightest of parallel arcs
+    order = np.lexsort((weights, far, near))
+    near, far, weights = near[order], far[order], weights[order]
+    first = np.ones(len(near), dtype=bool)
+    first[1:] = (near[1:] != near[:-1]) | (far[1:] != far[:-1])
+    near, far, weights = near[first], far[first], weights[first]
+    offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(near, minlength=n_nodes), out=offsets[1:])
+
+    csgraph = lazy_csgraph()
+    if csgraph is not None:
+        from scipy.sparse import csr_matrix as scipy_csr_matrix
+        # explicit zero weights stay arcs when the matrix is built from CSR arrays
+        matrix = scipy_csr_matrix((weights, far, offsets), shape=(n_nodes, n_nodes))
+        return csgraph.dijkstra(
+            matrix, directed=True, indices=seeds, min_only=True,
+            limit=max_cost if max_cost is not None else np.inf
+        )
+
+    # delta-stepping: settle costs in buckets of one average arc weight
+    step = float(weights.mean()) if len(weights) > 0 else 0.0
+    dist[seeds] = 0.0
+    open_nodes = np.unique(seeds)
+    while len(open_nodes) > 0:
+        low = dist[open_nodes].min()
+        if max_cost is not None and low > max_cost:
+            break
+        bucket_hi = low + step
+
+        # relax arcs of nodes in the bucket until no cost in it improves, as later buckets cannot improve it
+        active = open_nodes[dist[open_nodes] <= bucket_hi]
+        touched = [open_nodes]
+        while len(active) > 0:
+            arcs = gather_ranges(offsets[active], offsets[active + 1])
+            targets = far[arcs]
+            costs = dist[near[arcs]] + weights[arcs]
+            keep = costs < dist[targets]
+            np.minimum.at(dist, targets[keep], costs[keep])
+            changed = np.unique(targets[keep])
+            touched.append(changed)
+            active = changed[dist[changed] <= bucket_hi]
+
+        open_nodes = np.unique(np.concatenate(touched))
+        open_nodes = open_nodes[dist[open_nodes] > bucket_hi]
+
+    if max_cost is not None:
+        dist[dist > max_cost] = np.inf
+    return dist
@@ -0,0 +1,111 @@
+from typing import Any, Iterable
+import pandas as pd
+
+
+class ASTPredicate(object):
+    """
+    Column predicate usable as a value in filter dicts, such as n({'score': gt(0.5)})
+
+    Evaluated as one vectorized boolean mask over the column, see filter_by_dict.match_by_dict
+    """
+    def __call__(self, s: pd.Series) -> pd.Series:
+        raise RuntimeError('__call__ not implemented')
+
+    def __repr__(self) -> str:
+        args = ', '.join(f'{k[1:]}={v!r}' for k, v in vars(self).items())
+        return f'{type(self).__name__}({args})'
+
+
+class GT(ASTPredicate):
+    def __init__(self, val: Any):
+        self._val = val
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s > self._val
+gt = GT  # noqa: E305
+
+
+class GE(ASTPredicate):
+    def __init__(self, val: Any):
+        self._val = val
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s >= self._val
+ge = GE  # noqa: E305
+
+
+class LT(ASTPredicate):
+    def __init__(self, val: Any):
+        self._val = val
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s < self._val
+lt = LT  # noqa: E305
+
+
+class LE(ASTPredicate):
+    def __init__(self, val: Any):
+        self._val = val
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s <= self._val
+le = LE  # noqa: E305
+
+
+class NE(ASTPredicate):
+    def __init__(self, val: Any):
+        self._val = val
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s != self._val
+ne = NE  # noqa: E305
+
+
+class Between(ASTPredicate):
+    """
+    Values in [lower, upper], or (lower, upper) when not inclusive
+    """
+    def __init__(self, lower: Any, upper: Any, inclusive: bool = True):
+        self._lower = lower
+        self._upper = upper
+        self._inclusive = inclusive
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        if self._inclusive:
+            return (s >= self._lower) & (s <= self._upper)
+        return (s > self._lower) & (s < self._upper)
+between = Between  # noqa: E305
+
+
+class IsIn(ASTPredicate):
+    def __init__(self, options: Iterable[Any]):
+        self._options = list(options)
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s.isin(self._options)
+isin = IsIn  # noqa: E305
+
+
+class StartsWith(ASTPredicate):
+    """
+    String values starting with prefix, where nulls do not match
+    """
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        # nulls and non-strings give null, not False, so compare rather than fill
+        return s.str.startswith(self._prefix) == True  # noqa: E712
+startswith = StartsWith  # noqa: E305
+
+
+class IsNA(ASTPredicate):
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s.isna()
+isna = IsNA  # noqa: E305
+
+
+class NotNA(ASTPredicate):
+    def __call__(self, s: pd.Series) -> pd.Series:
+        return s.notna()
+notna = NotNA  # noqa: E305
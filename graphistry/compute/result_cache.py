@@ -0,0 +1,175 @@
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import datetime, hashlib, threading
+
+from graphistry.Plottable import Plottable
+from graphistry.util import hash_pdf
+from .ast import ASTObject
+from .predicates import ASTPredicate
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_RESULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def table_fingerprint(df: Any) -> str:
+    if df is None:
+        return 'N'
+    return hash_pdf(df)
+
+
+def graph_fingerprint(g: Plottable) -> str:
+    """
+    Content hash of g's node and edge tables and their bindings
+
+    The table hash is cached on g until .nodes() or .edges() is called, so repeated queries only pay for it once.
+    In-place mutation of g._nodes or g._edges is not detected: set them via .nodes() / .edges() instead.
+    """
+    cached: Optional[Tuple[int, int, str]] = getattr(g, '_fingerprint', None)
+    if cached is None or cached[0] != id(g._nodes) or cached[1] != id(g._edges):
+        tables = hashlib.sha256(
+            (table_fingerprint(g._nodes) + table_fingerprint(g._edges)).encode('utf-8')
+        ).hexdigest()
+        cached = (id(g._nodes), id(g._edges), tables)
+        g._fingerprint = cached
+    return f'{cached[2]}:{g._node}:{g._source}:{g._destination}:{g._edge}'
+
+
+def canonical_key(v: Any) -> str:
+    """
+    Order-insensitive serialization of (nested) dicts, lists, scalars, datetimes, AST objects, and predicates, for use as cache keys
+
+    Raises TypeError for values without a stable serialization
+    """
+    if isinstance(v, dict):
+        return '{' + ','.join(f'{canonical_key(k)}:{canonical_key(v[k])}' for k in sorted(v, key=str)) + '}'
+    elif isinstance(v, (list, tuple)):
+        return '[' + ','.join(canonical_key(i) for i in v) + ']'
+    elif v is None:
+        return 'N'
+    elif isinstance(v, bool):
+        return 'T' if v else 'F'
+    elif isinstance(v, (int, float)):
+        return f'{type(v).__name__}:{v}'
+    elif isinstance(v, str):
+        return repr(v)
+    elif isinstance(v, (datetime.datetime, datetime.date)):
+        # includes pd.Timestamp
+        return f'{type(v).__name__}:{v.isoformat()}'
+    elif isinstance(v, (ASTObject, ASTPredicate)):
+        return type(v).__name__ + canonical_key(vars(v))
+    else:
+        # includes DataFrames: callers hash those explicitly
+        raise TypeError(f'Unsupported cache key type: {type(v)}')
+
+
+def result_nbytes(g: Plottable) -> int:
+    """
+    Estimated memory footprint of a result's node and edge tables
+    """
+    total = 0
+    for df in [g._nodes, g._edges]:
+        if df is not None:
+            total += int(df.memory_usage(index=True, deep=False).sum())
+    return total
+
+
+class ResultCache(object):
+    """
+    Byte-budgeted LRU cache of compute results, keyed by graph fingerprint and query
+
+    Opt-in per call, such as g.chain(ops, cache=True) and g.hop(..., cache=True). Results are shared
+    between hits, so treat them as read-only.
+
+    **Example: Monitor and resize the shared cache**
+        ::
+
+            from graphistry.compute import result_cache
+
+            result_cache.max_bytes = 1024 * 1024 * 1024
+            g.chain(ops, cache=True)
+            print(result_cache.stats())  # {'hits': 0, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': ...}
+
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RESULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, Tuple[Plottable, int]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Plottable]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, g: Plottable) -> None:
+        nbytes = result_nbytes(g)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                logger.debug('Result of %s bytes exceeds cache budget, not caching', nbytes)
+                return
+            self._entries[key] = (g, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Plottable]) -> Plottable:
+        hit = self.get(key)
+        if hit is not None:
+            return hit
+        out = compute()
+        self.put(key, out)
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters for monitoring: hits, misses, evictions, and current entries and bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+result_cache = ResultCache()
+
+
+def cached_call(g: Plottable, kind: str, query: Any, compute: Callable[[], Plottable]) -> Plottable:
+    """
+    Run compute() through the shared result_cache, keyed by g's fingerprint and the query
+
+    Queries that cannot be serialized are computed without caching
+    """
+    try:
+        key = (kind, graph_fingerprint(g), canonical_key(query))
+    except TypeError:
+        logger.debug('Uncacheable %s query, computing directly', kind, exc_info=True)
+        return compute()
+    return result_cache.get_or_compute(key, compute)
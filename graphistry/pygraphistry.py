@@ -44,6 +44,7 @@ EnvVarNames = {
     "client_protocol_hostname": "GRAPHISTRY_CLIENT_PROTOCOL_HOSTNAME",
     "certificate_validation": "GRAPHISTRY_CERTIFICATE_VALIDATION",
     "store_token_creds_in_memory": "GRAPHISTRY_STORE_CREDS_IN_MEMORY",
+    "upload_cache_dir": "GRAPHISTRY_UPLOAD_CACHE_DIR",
 }
 
 config_paths = [
@@ -63,6 +64,8 @@ default_config = {
     "client_protocol_hostname": None,
     "certificate_validation": True,
     "store_token_creds_in_memory": True,
+    # Directory of on-disk upload cache shared across processes, None to disable
+    "upload_cache_dir": None,
     # Do not call API when all None
     "privacy": None,
     "login_type": None
@@ -538,6 +541,16 @@ class PyGraphistry(object):
             requests.packages.urllib3.disable_warnings()
         PyGraphistry._config["certificate_validation"] = v
 
+    @staticmethod
+    def upload_cache_dir(value=None):
+        """Set or get the directory of an on-disk upload cache, shared by all processes and sessions using it,
+        so uploads of already uploaded tables to the same server and org are skipped (default None: per session only).
+        Also set via environment variable GRAPHISTRY_UPLOAD_CACHE_DIR."""
+        if value is None:
+            return PyGraphistry._config["upload_cache_dir"]
+        # setter
+        PyGraphistry._config["upload_cache_dir"] = value
+
     @staticmethod
     def set_bolt_driver(driver=None):
         PyGraphistry._config["bolt_driver"] = bolt_util.to_bolt_driver(driver)
@@ -2454,6 +2467,7 @@ from_cugraph = PyGraphistry.from_cugraph
 personal_key_id = PyGraphistry.personal_key_id
 personal_key_secret = PyGraphistry.personal_key_secret
 switch_org = PyGraphistry.switch_org
+upload_cache_dir = PyGraphistry.upload_cache_dir
 
 
 
@@ -1,13 +1,13 @@
-import pandas as pd, pyarrow as pa, unittest
+import mock, pandas as pd, pyarrow as pa, tempfile, unittest
 
 from graphistry.arrow_uploader import ArrowUploader
 from graphistry.ArrowFileUploader import (
     ArrowFileUploader,
     DF_TO_FILE_ID_CACHE,
     MemoizedFileUpload,
-    WrappedTable,
-    cache_arr,
+    arrow_fingerprint,
 )
+from graphistry.upload_cache import UploadCache
 
 # TODO mock requests for testing actual effectful code
 
@@ -15,11 +15,104 @@ from graphistry.ArrowFileUploader import (
 class TestArrowFileUploader_Core(unittest.TestCase):
     def test_memoization(self):
 
-        afu = ArrowFileUploader(ArrowUploader(token="xx"))
+        uploader = ArrowUploader(token="xx")
+        afu = ArrowFileUploader(uploader)
 
         arr = pa.Table.from_pandas(pd.DataFrame({"x": [1, 2, 3]}))
 
-        # avoid directly holding references
-        DF_TO_FILE_ID_CACHE[cache_arr(WrappedTable(arr))] = MemoizedFileUpload("a", "b")
+        DF_TO_FILE_ID_CACHE[(arrow_fingerprint(arr), uploader.server_base_path, uploader.org_name)] = MemoizedFileUpload("a", "b")
 
         assert afu.create_and_post_file(arr) == ("a", "b")
+
+    def test_memoization_by_content(self):
+
+        afu = ArrowFileUploader(ArrowUploader(token="xx"))
+        df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", None, "c"]})
+
+        with mock.patch.object(afu, "create_file", return_value="f1") as mock_create_file, \
+                mock.patch.object(afu, "post_arrow", return_value={"is_valid": True}) as mock_post_arrow:
+            assert afu.create_and_post_file(pa.Table.from_pandas(df))[0] == "f1"
+            assert afu.create_and_post_file(pa.Table.from_pandas(df.copy()))[0] == "f1"
+            assert mock_create_file.call_count == 1
+            assert mock_post_arrow.call_count == 1
+
+            afu.create_and_post_file(pa.Table.from_pandas(df.assign(x=[1, 2, 4])))
+            assert mock_post_arrow.call_count == 2
+
+    def test_arrow_fingerprint(self):
+
+        df = pd.DataFrame({"x": [1, 2, 3, 4]})
+        arr = pa.Table.from_pandas(df)
+        assert arrow_fingerprint(arr) == arrow_fingerprint(pa.Table.from_pandas(df.copy()))
+        assert arrow_fingerprint(arr) != arrow_fingerprint(arr.rename_columns(["z"]))
+        assert arrow_fingerprint(arr.slice(0, 2)) != arrow_fingerprint(arr.slice(2, 2))
+
+    def test_arrow_fingerprint_dictionary(self):
+
+        a = pa.Table.from_pandas(pd.DataFrame({"c": pd.Categorical(["x", "y", "x"])}))
+        b = pa.Table.from_pandas(pd.DataFrame({"c": pd.Categorical(["p", "q", "p"])}))
+        assert not a.equals(b)
+        assert arrow_fingerprint(a) != arrow_fingerprint(b)
+        assert arrow_fingerprint(a) == arrow_fingerprint(pa.Table.from_pandas(pd.DataFrame({"c": pd.Categorical(["x", "y", "x"])})))
+
+        offsets = pa.array([0, 1, 3], pa.int32())
+        nested_a = pa.table({"l": pa.ListArray.from_arrays(offsets, a.column("c").chunk(0))})
+        nested_b = pa.table({"l": pa.ListArray.from_arrays(offsets, b.column("c").chunk(0))})
+        assert arrow_fingerprint(nested_a) != arrow_fingerprint(nested_b)
+        struct_a = pa.table({"s": pa.StructArray.from_arrays([a.column("c").chunk(0)], ["c"])})
+        struct_b = pa.table({"s": pa.StructArray.from_arrays([b.column("c").chunk(0)], ["c"])})
+        assert arrow_fingerprint(struct_a) != arrow_fingerprint(struct_b)
+
+    def test_upload_cache(self):
+
+        df = pd.DataFrame({"x": [5, 6, 7]})
+        with tempfile.TemporaryDirectory() as path:
+            afu = ArrowFileUploader(ArrowUploader(token="xx", server_base_path="https://s", org_name="o", upload_cache=UploadCache(path)))
+            with mock.patch.object(afu, "create_file", return_value="f1"), \
+                    mock.patch.object(afu, "post_arrow", return_value={"is_valid": True}) as mock_post_arrow:
+                afu.create_and_post_file(pa.Table.from_pandas(df))
+                assert mock_post_arrow.call_count == 1
+
+            # as from another process: memory cache empty, same directory
+            DF_TO_FILE_ID_CACHE.clear()
+            afu2 = ArrowFileUploader(ArrowUploader(token="xx", server_base_path="https://s", org_name="o", upload_cache=UploadCache(path)))
+            with mock.patch.object(afu2, "create_file") as mock_create_file, mock.patch.object(afu2, "post_arrow") as mock_post_arrow:
+                assert afu2.create_and_post_file(pa.Table.from_pandas(df)) == ("f1", {"is_valid": True})
+                assert mock_create_file.call_count == 0 and mock_post_arrow.call_count == 0
+
+            # other orgs cannot see the upload
+            DF_TO_FILE_ID_CACHE.clear()
+            afu3 = ArrowFileUploader(ArrowUploader(token="xx", server_base_path="https://s", org_name="o2", upload_cache=UploadCache(path)))
+            with mock.patch.object(afu3, "create_file", return_value="f2"), \
+                    mock.patch.object(afu3, "post_arrow", return_value={"is_valid": True}) as mock_post_arrow:
+                assert afu3.create_and_post_file(pa.Table.from_pandas(df))[0] == "f2"
+                assert mock_post_arrow.call_count == 1
+
+    def test_memoization_by_server_and_org(self):
+
+        df = pd.DataFrame({"x": [8, 9]})
+        with tempfile.TemporaryDirectory() as path:
+            upload_cache = UploadCache(path)
+            afu = ArrowFileUploader(ArrowUploader(token="xx", server_base_path="https://s", org_name="o", upload_cache=upload_cache))
+            with mock.patch.object(afu, "create_file", return_value="f1"), \
+                    mock.patch.object(afu, "post_arrow", return_value={"is_valid": True}):
+                afu.create_and_post_file(pa.Table.from_pandas(df))
+
+            # same process, after switching org or server: memory cache must not answer for the other org's upload
+            for server, org in [("https://s", "o2"), ("https://s2", "o")]:
+                afu2 = ArrowFileUploader(ArrowUploader(token="xx", server_base_path=server, org_name=org, upload_cache=upload_cache))
+                with mock.patch.object(afu2, "create_file", return_value="f2"), \
+                        mock.patch.object(afu2, "post_arrow", return_value={"is_valid": True}) as mock_post_arrow:
+                    assert afu2.create_and_post_file(pa.Table.from_pandas(df))[0] == "f2"
+                    assert mock_post_arrow.call_count == 1
+
+    def test_upload_cache_categorical(self):
+
+        with tempfile.TemporaryDirectory() as path:
+            afu = ArrowFileUploader(ArrowUploader(token="xx", server_base_path="https://s", org_name="o", upload_cache=UploadCache(path)))
+            with mock.patch.object(afu, "create_file", side_effect=["f1", "f2"]), \
+                    mock.patch.object(afu, "post_arrow", return_value={"is_valid": True}) as mock_post_arrow:
+                afu.create_and_post_file(pa.Table.from_pandas(pd.DataFrame({"c": pd.Categorical(["x", "y", "x"])})))
+                DF_TO_FILE_ID_CACHE.clear()
+                assert afu.create_and_post_file(pa.Table.from_pandas(pd.DataFrame({"c": pd.Categorical(["p", "q", "p"])})))[0] == "f2"
+                assert mock_post_arrow.call_count == 2
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
-import graphistry, mock, pandas as pd, pytest, unittest
+import graphistry, mock, numpy as np, pandas as pd, pyarrow as pa, pytest, threading, unittest
 
 from graphistry import ArrowUploader
+from graphistry.ArrowFileUploader import ArrowFileUploader
+from graphistry.arrow_uploader import choose_compression, compression_benchmark
 from graphistry.pygraphistry import PyGraphistry
 
 # TODO mock requests for testing actual effectful code
@@ -356,3 +358,105 @@ class TestArrowUploader_Comms(unittest.TestCase):
 
         au.sso_get_token(state='ignored-valid')
         assert au.token == '123'
+
+
+class TestArrowUploader_Post(unittest.TestCase):
+
+    def _uploader(self):
+        return ArrowUploader(
+            token="t", org_name="o",
+            edges=pa.Table.from_pandas(pd.DataFrame({"s": [0], "d": [1]})),
+            nodes=pa.Table.from_pandas(pd.DataFrame({"n": [0, 1]})))
+
+    def test_post_files_concurrently(self):
+        au = self._uploader()
+        # each upload waits for the other, so sequential uploads would time out
+        both_started = threading.Barrier(2, timeout=10)
+
+        def create_and_post_file(afu, arr, **kwargs):
+            both_started.wait()
+            return ("edges_file" if arr is au.edges else "nodes_file"), {}
+
+        with mock.patch.object(ArrowFileUploader, "create_and_post_file", create_and_post_file), \
+                mock.patch.object(ArrowUploader, "create_dataset") as mock_create_dataset:
+            au.post()
+
+        json = mock_create_dataset.call_args[0][0]
+        assert json["edge_files"] == ["edges_file"]
+        assert json["node_files"] == ["nodes_file"]
+
+    def test_post_arrow_concurrently(self):
+        au = self._uploader()
+        both_started = threading.Barrier(2, timeout=10)
+
+        def post_arrow(arr, graph_type, opts=""):
+            both_started.wait()
+            return graph_type
+
+        with mock.patch.object(au, "post_arrow", side_effect=post_arrow) as mock_post_arrow, \
+                mock.patch.object(ArrowUploader, "create_dataset"):
+            au.post(as_files=False)
+
+        assert sorted(call[0][1] for call in mock_post_arrow.call_args_list) == ["edges", "nodes"]
+
+    def test_run_concurrently_raises(self):
+        def fail():
+            raise ValueError("upload failed")
+
+        with pytest.raises(ValueError):
+            ArrowUploader(org_name="o").run_concurrently([lambda: 1, fail])
+        assert ArrowUploader(org_name="o").run_concurrently([lambda: 1, lambda: 2]) == [1, 2]
+
+    def test_arrow_to_chunks(self):
+        au = ArrowUploader(org_name="o", batch_size=2)
+        arr = pa.Table.from_pandas(pd.DataFrame({"x": range(5), "y": [str(i) for i in range(5)]}))
+        chunks = list(au.arrow_to_chunks(arr))
+        assert len(chunks) == 4
+        assert pa.ipc.open_file(pa.BufferReader(b"".join(chunks))).read_all().equals(arr)
+        assert pa.ipc.open_file(pa.BufferReader(au.arrow_to_buffer(arr))).read_all().equals(arr)
+
+    def test_post_arrow_generic_streams(self):
+        au = ArrowUploader(org_name="o", batch_size=1)
+        arr = pa.Table.from_pandas(pd.DataFrame({"x": range(3)}))
+        with mock.patch.object(au.session, "post") as mock_post:
+            mock_post.return_value.status_code = 200
+            au.post_arrow_generic("api/v2/upload/files/f", "t", arr, "erase=true")
+        url = mock_post.call_args[0][0]
+        body = mock_post.call_args[1]["data"]
+        assert url.endswith("/api/v2/upload/files/f?erase=true")
+        assert not isinstance(body, bytes)
+        assert pa.ipc.open_file(pa.BufferReader(b"".join(body))).read_all().equals(arr)
+
+
+class TestArrowUploader_Compression(unittest.TestCase):
+
+    def _repetitive(self):
+        return pa.Table.from_pandas(pd.DataFrame({"x": [1, 2, 3, 4] * 5000, "y": ["a", "bb"] * 10000}))
+
+    def test_compressed_chunks_roundtrip(self):
+        arr = self._repetitive()
+        au = ArrowUploader(org_name="o", batch_size=5000)
+        for codec in ["lz4", "zstd"]:
+            chunks = list(au.arrow_to_chunks(arr, compression=codec))
+            assert pa.ipc.open_file(pa.BufferReader(b"".join(chunks))).read_all().equals(arr)
+            assert sum(len(c) for c in chunks) < len(au.arrow_to_buffer(arr)) / 2
+
+    def test_choose_compression(self):
+        assert choose_compression(self._repetitive()) in ["lz4", "zstd"]
+        noise = pa.Table.from_pandas(pd.DataFrame({"x": np.random.default_rng(0).random(20000)}))
+        assert choose_compression(noise) is None
+        assert choose_compression(noise.slice(0, 0)) is None
+
+    def test_compression_modes(self):
+        with pytest.raises(ValueError):
+            ArrowUploader(org_name="o", compression="gzip")
+        au = ArrowUploader(org_name="o", compression="auto")
+        assert au.resolve_compression(self._repetitive()) in ["lz4", "zstd"]
+        au.compression = None
+        assert au.resolve_compression(self._repetitive()) is None
+
+    def test_compression_benchmark(self):
+        out = compression_benchmark(self._repetitive())
+        assert out.compression.to_list() == [None, "lz4", "zstd", "auto"]
+        assert out.bytes_saved[0] == 0
+        assert (out.bytes_saved[1:] > 0).all()
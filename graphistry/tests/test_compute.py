@@ -116,6 +116,32 @@ class TestComputeMixin(NoAuthTestCase):
         ]
         assert g2._node == "id"
 
+    def test_degrees_weighted(self):
+        cg = CGFull()
+        g = cg.edges(
+            pd.DataFrame({"s": ["a", "b", "c"], "d": ["b", "a", "a"], "w": [1.0, 2.0, 0.5]}), "s", "d"
+        )
+        g2 = g.get_degrees(weight="w")
+        assert g2._nodes.to_dict(orient="records") == [
+            {"id": "a", "degree_in": 2.5, "degree_out": 1.0, "degree": 3.5},
+            {"id": "b", "degree_in": 1.0, "degree_out": 2.0, "degree": 3.0},
+            {"id": "c", "degree_in": 0.0, "degree_out": 0.5, "degree": 0.5},
+        ]
+
+    def test_degrees_existing_nodes(self):
+        cg = CGFull()
+        g = cg.edges(
+            pd.DataFrame({"s": ["a", "b", "c"], "d": ["b", "a", "d"]}), "s", "d"
+        ).nodes(pd.DataFrame({"n": ["d", "x", "a", "b", "c"], "degree_in": [9, 9, 9, 9, 9]}), "n")
+        g2 = g.get_degrees()
+        assert g2._nodes.to_dict(orient="records") == [
+            {"n": "d", "degree_in": 1, "degree_out": 0, "degree": 1},
+            {"n": "x", "degree_in": 0, "degree_out": 0, "degree": 0},
+            {"n": "a", "degree_in": 1, "degree_out": 1, "degree": 2},
+            {"n": "b", "degree_in": 1, "degree_out": 1, "degree": 2},
+            {"n": "c", "degree_in": 0, "degree_out": 1, "degree": 1},
+        ]
+
     def test_get_topological_levels_mt(self):
         cg = CGFull()
         g = cg.edges(
@@ -162,6 +188,30 @@ class TestComputeMixin(NoAuthTestCase):
             {"id": "b", "level": 1},
         ]
 
+    def test_get_topological_levels_deep(self):
+        cg = CGFull()
+        n = 2000
+        g = cg.edges(
+            pd.DataFrame({"s": list(range(1, n)), "d": list(range(0, n - 1))}), "s", "d"
+        ).get_topological_levels()
+        assert len(g._nodes) == n
+        assert g._nodes["level"].tolist() == list(range(n))
+        assert g._nodes["id"].tolist() == list(range(n - 1, -1, -1))
+
+    def test_get_topological_levels_cycle_tail(self):
+        cg = CGFull()
+        g = (
+            cg.edges(pd.DataFrame({"s": ["r", "a", "b", "b", "r"], "d": ["a", "b", "a", "c", "c"]}), "s", "d")
+            .nodes(pd.DataFrame({"n": ["c", "b", "a", "r"]}), "n")
+            .get_topological_levels(allow_cycles=True)
+        )
+        assert g._nodes.to_dict(orient="records") == [
+            {"n": "c", "level": 2},
+            {"n": "b", "level": 1},
+            {"n": "a", "level": 2},
+            {"n": "r", "level": 0},
+        ]
+
     def test_drop_nodes(self):
         cg = CGFull()
         g = cg.edges(
@@ -0,0 +1,57 @@
+import numpy as np, pandas as pd
+from common import NoAuthTestCase
+
+from graphistry.compute.adjacency import AdjacencyIndex, adjacency_index, gather_ranges
+from graphistry.tests.test_compute_hops import hops_graph
+
+
+class TestAdjacencyIndex(NoAuthTestCase):
+
+    def test_gather_ranges(self):
+        out = gather_ranges(np.array([0, 5, 2]), np.array([2, 5, 5]))
+        assert out.tolist() == [0, 1, 2, 3, 4]
+
+    def test_gather_ranges_mt(self):
+        assert len(gather_ranges(np.array([], dtype=np.int64), np.array([], dtype=np.int64))) == 0
+
+    def test_csr(self):
+        edges = pd.DataFrame({'s': ['a', 'a', 'b', 'c'], 'd': ['b', 'c', 'c', 'a']})
+        index = AdjacencyIndex(edges, 's', 'd')
+        assert index.n_nodes == 3
+        a, b, c = index.encode(['a', 'b', 'c'])
+        assert sorted(index.frontier_edges(np.array([a])).tolist()) == [0, 1]
+        assert sorted(index.frontier_edges(np.array([c]), reverse=True).tolist()) == [1, 2]
+        assert sorted(index.frontier_edges(np.array([a, b])).tolist()) == [0, 1, 2]
+        assert index.decode(index.dst_codes[index.frontier_edges(np.array([c]))]).tolist() == ['a']
+
+    def test_encode_missing(self):
+        index = AdjacencyIndex(pd.DataFrame({'s': ['a'], 'd': ['b']}), 's', 'd')
+        assert index.encode(['b', 'zz']).tolist() == [1, -1]
+
+    def test_null_ids_not_traversed(self):
+        index = AdjacencyIndex(pd.DataFrame({'s': ['a', None], 'd': ['b', 'a']}), 's', 'd')
+        assert index.n_nodes == 2
+        assert index.src_codes.tolist() == [0, -1]
+        assert index.frontier_edges(index.encode(['b']), reverse=True).tolist() == [0]
+
+    def test_cached(self):
+        g = hops_graph().bind()
+        index = adjacency_index(g)
+        assert adjacency_index(g) is index
+        assert adjacency_index(g.nodes(g._nodes)) is index
+
+    def test_invalidated_by_edges(self):
+        g = hops_graph().bind()
+        index = adjacency_index(g)
+        g2 = g.edges(g._edges[:3])
+        assert g2._adjacency_index is None
+        assert adjacency_index(g2) is not index
+        assert adjacency_index(g2).n_edges == 3
+
+    def test_hop_reuses_index(self):
+        g = hops_graph().bind()
+        g.hop(pd.DataFrame({g._node: ['d']}), 1)
+        index = g._adjacency_index
+        assert index is not None
+        g.hop(pd.DataFrame({g._node: ['e']}), 2)
+        assert g._adjacency_index is index
@@ -0,0 +1,114 @@
+import numpy as np, pandas as pd, pytest
+from common import NoAuthTestCase
+
+from graphistry.compute.algorithms import native_algs
+from graphistry.tests.test_compute import CGFull
+from graphistry.tests.test_compute_hops import hops_graph
+
+
+def two_cycles_graph():
+    # cycle a->b->c->a, a tail c->d->e, and a separate cycle x<->y
+    edges_df = pd.DataFrame({
+        's': ['a', 'b', 'c', 'c', 'd', 'x', 'y'],
+        'd': ['b', 'c', 'a', 'd', 'e', 'y', 'x']
+    })
+    return CGFull().edges(edges_df, 's', 'd')
+
+
+class TestComputeAlgorithms(NoAuthTestCase):
+
+    def test_unknown_alg(self):
+        with pytest.raises(ValueError):
+            hops_graph().compute_native('not_an_alg')
+
+    def test_all_algs_write_node_column(self):
+        g = hops_graph()
+        for alg in native_algs:
+            g2 = g.compute_native(alg)
+            assert g2._nodes.columns.to_list() == g._nodes.columns.to_list() + [alg]
+            assert len(g2._nodes) == len(g._nodes)
+
+    def test_out_col(self):
+        g2 = hops_graph().compute_native('pagerank', out_col='pr')
+        assert 'pr' in g2._nodes.columns and 'pagerank' not in g2._nodes.columns
+
+    def test_pagerank(self):
+        g2 = two_cycles_graph().compute_native('pagerank')
+        pr = g2._nodes.set_index('id')['pagerank']
+        assert abs(pr.sum() - 1) < 1e-9
+        assert pr['x'] == pytest.approx(pr['y'])
+        assert pr['e'] > pr['d']
+
+    def test_pagerank_weighted(self):
+        edges_df = pd.DataFrame({'s': ['a', 'a'], 'd': ['b', 'c'], 'w': [3.0, 1.0]})
+        g2 = CGFull().edges(edges_df, 's', 'd').compute_native('pagerank', params={'weight': 'w'})
+        pr = g2._nodes.set_index('id')['pagerank']
+        assert pr['b'] > pr['c']
+
+    def test_pagerank_undirected(self):
+        edges_df = pd.DataFrame({'s': ['a', 'b'], 'd': ['b', 'c']})
+        g2 = CGFull().edges(edges_df, 's', 'd').compute_native('pagerank', directed=False)
+        pr = g2._nodes.set_index('id')['pagerank']
+        assert pr['a'] == pytest.approx(pr['c'])
+        assert pr['b'] > pr['a']
+
+    def test_weakly_connected_components(self):
+        g2 = two_cycles_graph().compute_native('weakly_connected_components')
+        assert g2._nodes.to_dict(orient='records') == [
+            {'id': 'a', 'weakly_connected_components': 0},
+            {'id': 'b', 'weakly_connected_components': 0},
+            {'id': 'c', 'weakly_connected_components': 0},
+            {'id': 'd', 'weakly_connected_components': 0},
+            {'id': 'x', 'weakly_connected_components': 1},
+            {'id': 'y', 'weakly_connected_components': 1},
+            {'id': 'e', 'weakly_connected_components': 0}
+        ]
+
+    def test_strongly_connected_components(self):
+        g2 = two_cycles_graph().compute_native('strongly_connected_components')
+        assert g2._nodes.to_dict(orient='records') == [
+            {'id': 'a', 'strongly_connected_components': 0},
+            {'id': 'b', 'strongly_connected_components': 0},
+            {'id': 'c', 'strongly_connected_components': 0},
+            {'id': 'd', 'strongly_connected_components': 1},
+            {'id': 'x', 'strongly_connected_components': 2},
+            {'id': 'y', 'strongly_connected_components': 2},
+            {'id': 'e', 'strongly_connected_components': 3}
+        ]
+
+    def test_strongly_connected_components_long_cycle(self):
+        n = 2000
+        edges_df = pd.DataFrame({'s': np.arange(n), 'd': (np.arange(n) + 1) % n})
+        g2 = CGFull().edges(edges_df, 's', 'd').compute_native('strongly_connected_components')
+        assert g2._nodes['strongly_connected_components'].unique().tolist() == [0]
+
+    def test_coreness(self):
+        # 4-clique a..d with a pendant e, duplicate and self-loop edges ignored
+        edges_df = pd.DataFrame({
+            's': ['a', 'a', 'a', 'b', 'b', 'c', 'd', 'b', 'e'],
+            'd': ['b', 'c', 'd', 'c', 'd', 'd', 'e', 'a', 'e']
+        })
+        g2 = CGFull().edges(edges_df, 's', 'd').compute_native('coreness')
+        assert g2._nodes.set_index('id')['coreness'].to_dict() == {'a': 3, 'b': 3, 'c': 3, 'd': 3, 'e': 1}
+
+    def test_triangle_count(self):
+        edges_df = pd.DataFrame({
+            's': ['a', 'a', 'a', 'b', 'b', 'c', 'd', 'b'],
+            'd': ['b', 'c', 'd', 'c', 'd', 'd', 'e', 'a']
+        })
+        g2 = CGFull().edges(edges_df, 's', 'd').compute_native('triangle_count')
+        assert g2._nodes.set_index('id')['triangle_count'].to_dict() == {'a': 3, 'b': 3, 'c': 3, 'd': 3, 'e': 0}
+
+    def test_existing_nodes_kept(self):
+        g = two_cycles_graph().nodes(pd.DataFrame({'n': ['z', 'x', 'y', 'a', 'b', 'c', 'd', 'e'], 'v': range(8)}), 'n')
+        g2 = g.compute_native('weakly_connected_components', out_col='cc')
+        assert g2._nodes.to_dict(orient='records') == [
+            {'n': 'z', 'v': 0, 'cc': 0},
+            {'n': 'x', 'v': 1, 'cc': 1},
+            {'n': 'y', 'v': 2, 'cc': 1},
+            {'n': 'a', 'v': 3, 'cc': 2},
+            {'n': 'b', 'v': 4, 'cc': 2},
+            {'n': 'c', 'v': 5, 'cc': 2},
+            {'n': 'd', 'v': 6, 'cc': 2},
+            {'n': 'e', 'v': 7, 'cc': 2}
+        ]
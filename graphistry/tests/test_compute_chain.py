@@ -1,8 +1,9 @@
-import pandas as pd
+import pandas as pd, pytest
 from common import NoAuthTestCase
 
-from graphistry.tests.test_compute_hops import hops_graph
+from graphistry.tests.test_compute_hops import hops_graph, temporal_graph
 from graphistry.compute.ast import n, e_forward, e_reverse, e_undirected
+from graphistry.compute.predicates import isin, startswith
 
 
 class TestComputeChainMixin(NoAuthTestCase):
@@ -100,3 +101,125 @@ class TestComputeChainMixin(NoAuthTestCase):
         assert sorted(g2._edges[ g2._edges.e2 ][g2._source].to_list()) == ["g", "l"]
         assert sorted(g2._edges[ g2._edges.e2 ][g2._destination].to_list()) == ["a", "b"]
         assert sorted(g2._nodes[ g2._nodes.n2 ][g2._node].to_list()) == ["a", "b"]
+
+    def test_chain_named_masks(self):
+
+        g = hops_graph()
+
+        g2 = g.chain([
+            n({g._node: "e"}, name="n1"),
+            e_forward({}, hops=1, name="e1"),
+            n(name="n2"),
+            e_forward({}, hops=1, name="e2"),
+            n(name="n3"),
+        ])
+
+        assert g2._nodes.columns[0] == g._node
+        assert sorted(g2._nodes.columns[1:4]) == ["n1", "n2", "n3"]
+        for name in ["n1", "n2", "n3"]:
+            assert g2._nodes[name].dtype == bool
+        for name in ["e1", "e2"]:
+            assert g2._edges[name].dtype == bool
+        assert len(g2._nodes) == len(g2._nodes[g._node].unique())
+        assert (g2._nodes.n1 | g2._nodes.n2 | g2._nodes.n3).all()
+        assert (g2._edges.e1 | g2._edges.e2).all()
+
+    def test_chain_label_hops(self):
+
+        g = hops_graph()
+
+        g2 = g.chain([
+            n({g._node: "d"}),
+            e_forward({}, hops=2, label_hops="hop_distance"),
+            n({g._node: "p"})
+        ])
+
+        assert dict(zip(g2._nodes[g._node], g2._nodes.hop_distance)) == {"d": -1, "j": 1, "p": 2}
+        assert sorted(g2._edges.hop_distance.to_list()) == [1, 2]
+
+    def test_chain_profile(self):
+
+        g = hops_graph()
+        ops = [n({g._node: "e"}), e_forward({}, hops=1), n()]
+        g2 = g.chain(ops, profile=True)
+        profile = g2._chain_profile
+        assert profile.phase.to_list() == ['forward'] * 3 + ['backward'] * 3 + ['combine'] * 2
+        assert profile[profile.phase == 'forward'].nodes_out.to_list() == [1, 2, 2]
+        assert profile[profile.phase == 'backward'].step.to_list() == [2, 1, 0]
+        assert (profile.wall_s >= 0).all()
+        assert (profile.peak_bytes >= 0).all()
+        assert g2._nodes.equals(g.chain(ops)._nodes)
+        assert g.chain(ops)._chain_profile is None
+
+    def test_chain_time_order(self):
+
+        g = temporal_graph()
+        g2 = g.chain([
+            n({g._node: 'a'}),
+            e_forward(to_fixed_point=True, time_col='t', time_order='increasing'),
+            n({g._node: 'f'})
+        ])
+        assert sorted(g2._nodes[g._node].to_list()) == ['a', 'b', 'c', 'f']
+        assert sorted(g2._edges.t.to_list()) == [1, 2, 3]
+
+    def test_chain_predicates(self):
+
+        g = hops_graph()
+        g2 = g.chain([
+            n({g._node: isin(['d', 'e'])}),
+            e_forward({g._destination: startswith('j')}),
+            n()
+        ])
+        assert sorted(g2._nodes[g._node].to_list()) == ['d', 'j']
+        assert g2._edges.shape[0] == 1
+
+    def test_chain_limit(self):
+
+        g = hops_graph()
+        ops = [n({g._node: 'd'}), e_forward(name='e1'), n(), e_forward(), n(name='end')]
+        g_all = g.chain(ops)
+        g2 = g.chain(ops, limit=2)
+        assert sorted(g2._nodes[g._node].to_list()) == ['d', 'j', 'o', 'p']
+        assert g2._edges[['s', 'd', 'e1']].values.tolist() == [['d', 'j', True], ['j', 'p', False], ['j', 'o', False]]
+        assert list(g2._nodes.columns) == list(g_all._nodes.columns)
+        assert list(g2._edges.columns) == list(g_all._edges.columns)
+
+    def test_chain_limit_all(self):
+
+        g = hops_graph()
+        ops = [n(), e_reverse(), n({g._node: 'a'}, name='hit')]
+        g_all = g.chain(ops)
+        g2 = g.chain(ops, limit=100)
+        assert g2._nodes.equals(g_all._nodes)
+        assert g2._edges.equals(g_all._edges)
+        assert len(g.chain(ops, limit=0)._edges) == 0
+
+    def test_chain_limit_multi_hop(self):
+
+        g = hops_graph()
+        with pytest.raises(ValueError):
+            g.chain([n(), e_forward(hops=2), n()], limit=10)
+
+    def test_chain_return_paths(self):
+
+        g = hops_graph()
+        g2 = g.chain([n({g._node: 'd'}, name='start'), e_forward(), n(), e_forward(name='last')], return_paths=True)
+        paths = g2._chain_paths
+        assert list(paths.columns) == ['start', 'step_1', 'step_2', 'last', 'step_4']
+        assert sorted(map(tuple, paths[['start', 'step_2', 'step_4']].values.tolist())) == [
+            ('d', 'h', 'm'), ('d', 'i', 'n'), ('d', 'j', 'o'), ('d', 'j', 'p')
+        ]
+        edge_ids = paths[['step_1', 'last']].to_numpy()
+        assert (g._edges.s[edge_ids[:, 0]].to_numpy() == paths.start.to_numpy()).all()
+        assert (g._edges.d[edge_ids[:, 1]].to_numpy() == paths.step_4.to_numpy()).all()
+        assert len(g.chain([n({g._node: 'd'}), e_forward(), n(), e_forward()], return_paths=True, limit=3)._chain_paths) == 3
+        assert g.chain([n()])._chain_paths is None
+
+    def test_chain_paths_no_edges(self):
+
+        g = hops_graph()
+        g = g.edges(g._edges.iloc[:0])
+        ops = [n(), e_forward(), n()]
+        g2 = g.chain(ops, limit=5)
+        assert len(g2._nodes) == 0 and len(g2._edges) == 0
+        assert len(g.chain(ops, return_paths=True)._chain_paths) == 0
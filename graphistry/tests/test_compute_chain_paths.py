@@ -0,0 +1,54 @@
+import pandas as pd
+from common import NoAuthTestCase
+
+from graphistry.compute import chain_paths
+from graphistry.compute.ast import n, e_forward, e_undirected
+from graphistry.compute.chain_paths import PathEnumerator, is_path_chain, paths_table
+from graphistry.tests.test_compute_hops import hops_graph
+
+
+class TestComputeChainPaths(NoAuthTestCase):
+
+    def test_is_path_chain(self):
+        assert is_path_chain([n(), e_forward(), n(), e_undirected()])
+        assert not is_path_chain([n(), e_forward(hops=2), n()])
+        assert not is_path_chain([n(), e_forward(to_fixed_point=True), n()])
+
+    def test_run_columns(self):
+        g = hops_graph()
+        node_cols, edge_cols, far_cols = PathEnumerator(g, [n({g._node: 'j'}), e_forward(), n()]).run()
+        ids = g._nodes[g._node]
+        assert ids[node_cols[0]].to_list() == ['j', 'j']
+        assert ids[node_cols[1]].to_list() == ['p', 'o']
+        assert g._edges.iloc[edge_cols[0]][g._destination].to_list() == ['p', 'o']
+        assert (far_cols[0] == node_cols[1]).all()
+
+    def test_run_limit_chunked(self):
+        g = hops_graph()
+        ops = [n(), e_forward(), n(), e_forward(), n()]
+        full = PathEnumerator(g, ops).run()
+        PATH_EXPANSION_EDGES = chain_paths.PATH_EXPANSION_EDGES
+        try:
+            chain_paths.PATH_EXPANSION_EDGES = 1
+            chunked = PathEnumerator(g, ops).run()
+            limited = PathEnumerator(g, ops).run(limit=3)
+        finally:
+            chain_paths.PATH_EXPANSION_EDGES = PATH_EXPANSION_EDGES
+        assert len(full[0][0]) == len(chunked[0][0]) == 10
+        assert sorted(zip(*full[1])) == sorted(zip(*chunked[1]))
+        assert len(limited[0][0]) == 3
+
+    def test_undirected_self_loop_once(self):
+        g = hops_graph()
+        g = g.edges(pd.concat([g._edges, pd.DataFrame({'s': ['a'], 'd': ['a'], 'type': ['e']})], ignore_index=True))
+        node_cols, edge_cols, _ = PathEnumerator(g, [n({g._node: 'a'}), e_undirected(), n()]).run()
+        assert len(edge_cols[0]) == len(g._edges[(g._edges.s == 'a') | (g._edges.d == 'a')])
+
+    def test_paths_table_edge_ids(self):
+        g = hops_graph()
+        g = g.edges(g._edges.assign(eid=[f'e{i}' for i in range(len(g._edges))]), edge='eid')
+        ops = [n({g._node: 'j'}, name='x'), e_forward(name='x'), n()]
+        node_cols, edge_cols, _ = PathEnumerator(g, ops).run()
+        paths = paths_table(g, ops, node_cols, edge_cols)
+        assert paths.values.tolist() == [['j', 'e10', 'p'], ['j', 'e13', 'o']]
+        assert list(paths.columns) == ['x', 'step_1', 'step_2']
@@ -0,0 +1,97 @@
+import pandas as pd, pytest
+from common import NoAuthTestCase
+
+from graphistry.tests.test_compute_hops import hops_graph
+from graphistry.compute.ast import n, e_forward, e_reverse, e_undirected
+
+
+class TestComputeChainPlanMixin(NoAuthTestCase):
+
+    def test_plan_single_step(self):
+
+        g = hops_graph()
+        plan = g.chain_plan([n({g._node: "a"})])
+        assert plan.direction == 'forward'
+
+    def test_plan_reverse_when_last_selective(self):
+
+        g = hops_graph()
+        plan = g.chain_plan([n(), e_forward(), n({g._node: "b"})])
+        assert plan.direction == 'reverse'
+        assert plan.reverse_cost == 1
+        assert plan.forward_cost == len(g._nodes)
+        assert plan.ops_to_run[0]._filter_dict == {g._node: "b"}
+
+    def test_plan_forward_when_first_selective(self):
+
+        g = hops_graph()
+        plan = g.chain_plan([n({g._node: "e"}), e_forward(), n()])
+        assert plan.direction == 'forward'
+
+    def test_plan_pads_edges(self):
+
+        g = hops_graph()
+        plan = g.chain_plan([e_forward(destination_node_match={g._node: "b"})])
+        assert len(plan.ops) == 3
+        assert plan.direction == 'reverse'
+
+    def test_plan_direction_sensitive(self):
+
+        g = hops_graph()
+        for op in [e_forward(hops=2), e_forward(to_fixed_point=True), e_undirected()]:
+            plan = g.chain_plan([n(), op, n({g._node: "b"})])
+            assert plan.direction == 'forward'
+
+    def test_plan_set_by_caller(self):
+
+        g = hops_graph()
+        plan = g.chain_plan([n({g._node: "e"}), e_forward(), n()], plan='reverse')
+        assert plan.direction == 'reverse'
+
+    def test_plan_reverse_not_reversible(self):
+
+        g = hops_graph()
+        for op in [e_forward(hops=2), e_forward(to_fixed_point=True), e_undirected(), e_forward(label_hops='hop')]:
+            with pytest.raises(ValueError):
+                g.chain_plan([n({g._node: "e"}), op, n()], plan='reverse')
+            with pytest.raises(ValueError):
+                g.chain([n({g._node: "e"}), op, n()], plan='reverse')
+
+    def test_explain(self):
+
+        g = hops_graph()
+        out = g.chain_plan([n(), e_forward({}), n({g._node: "b"})]).explain()
+        assert 'direction=reverse' in out
+        assert 'forward=' in out and 'reverse=1' in out
+        assert len(out.split('\n')) == 5
+
+    def test_chain_same_either_direction(self):
+
+        g = hops_graph()
+        ops = [
+            n(name="n1"),
+            e_forward({}, name="e1"),
+            n(name="n2"),
+            e_reverse({}, name="e2"),
+            n({g._node: "l"}, name="n3")
+        ]
+        g_fwd = g.chain(ops, plan='forward')
+        g_rev = g.chain(ops, plan='reverse')
+        assert g_fwd._nodes.equals(g_rev._nodes)
+        assert g_fwd._edges.equals(g_rev._edges)
+        assert g.chain(ops)._nodes.equals(g_fwd._nodes)
+
+    def test_chain_keeps_table_order(self):
+
+        g = hops_graph()
+        g2 = g.chain([n(), e_forward({}), n({g._node: "b"})])
+        nodes = g._nodes[g._nodes[g._node].isin(g2._nodes[g._node])]
+        assert g2._nodes[g._node].to_list() == nodes[g._node].to_list()
+        assert isinstance(g2._edges, pd.DataFrame)
+
+    def test_explain_analyze(self):
+
+        g = hops_graph()
+        out = g.chain_plan([n(), e_forward({}), n({g._node: "b"})]).explain(analyze=True)
+        assert 'profile' in out
+        assert 'backward' in out and 'combine' in out
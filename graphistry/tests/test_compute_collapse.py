@@ -461,3 +461,20 @@ class TestCollapse(NoAuthTestCase):
         g3 = g2.collapse(node="0", attribute="2", column="level", unwrap=False)
         g4 = g3.collapse(node="0", attribute="0", column="level", unwrap=False)
         self._test_graph_chain_collapse(g, g4)
+
+    def test_collapse_long_chain(self):
+        # deeper than the recursion limit, and runs in one pass
+        n = 5000
+        edges = pd.DataFrame({"src": range(n - 1), "dst": range(1, n)}).astype(str)
+        nodes = pd.DataFrame({"node": range(n), "level": [0] + [1] * (n - 1)}).astype(str)
+        g = CGFull().edges(edges, "src", "dst").nodes(nodes, "node")
+        g2 = g.collapse(node="0", attribute="1", column="level", unwrap=True)
+        assert g2._nodes["node_final"].nunique() == 2
+        assert g2._edges[["src_final", "dst_final"]].drop_duplicates().shape[0] == 2
+
+    def test_collapse_only_reachable(self):
+        edges = pd.DataFrame({"src": ["a", "b", "x", "y"], "dst": ["b", "c", "y", "b"]})
+        nodes = pd.DataFrame({"node": ["a", "b", "c", "x", "y"], "level": ["0", "1", "1", "1", "1"]})
+        g = CGFull().edges(edges, "src", "dst").nodes(nodes, "node")
+        g2 = g.collapse(node="a", attribute="1", column="level", unwrap=False)
+        assert g2._nodes["node_final"].to_list() == ["a", "~b~ ~c~", "~b~ ~c~", "x", "y"]
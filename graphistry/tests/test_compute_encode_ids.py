@@ -0,0 +1,86 @@
+import numpy as np, pandas as pd, pytest
+from common import NoAuthTestCase
+
+from graphistry.compute.ast import n, e_forward
+from graphistry.tests.test_compute import CGFull
+from graphistry.tests.test_compute_hops import hops_graph
+
+
+def sorted_records(df, by):
+    return df.sort_values(by=by).reset_index(drop=True).to_dict(orient='records')
+
+
+class TestEncodeIds(NoAuthTestCase):
+
+    def test_encode(self):
+        g = hops_graph().encode_ids()
+        assert g._nodes[g._node].dtype == np.int32
+        assert g._edges[g._source].dtype == np.int32
+        assert g._edges[g._destination].dtype == np.int32
+        assert g._nodes[g._node].to_list() == list(range(len(g._nodes)))
+        assert g._node_encoding.to_list() == hops_graph()._nodes['node'].to_list()
+
+    def test_encode_idempotent(self):
+        g = hops_graph().encode_ids()
+        assert g.encode_ids() is g
+
+    def test_encode_materializes(self):
+        g = CGFull().edges(pd.DataFrame({'s': ['x', 'y'], 'd': ['y', 'z']}), 's', 'd').encode_ids()
+        assert g._nodes.to_dict(orient='records') == [{'id': 0}, {'id': 1}, {'id': 2}]
+        assert g._edges.to_dict(orient='records') == [{'s': 0, 'd': 1}, {'s': 1, 'd': 2}]
+
+    def test_encode_dangling_edges(self):
+        g = CGFull().edges(pd.DataFrame({'s': ['x'], 'd': ['y']}), 's', 'd').nodes(pd.DataFrame({'n': ['y']}), 'n')
+        g2 = g.encode_ids()
+        assert g2._nodes[g2._node].to_list() == [0]
+        assert g2._edges.to_dict(orient='records') == [{'s': 1, 'd': 0}]
+        assert g2.decode_ids()._edges.equals(g._edges)
+
+    def test_roundtrip(self):
+        g = hops_graph()
+        g2 = g.encode_ids().decode_ids()
+        assert g2._node_encoding is None
+        assert g2._nodes.equals(g._nodes)
+        assert g2._edges.equals(g._edges)
+
+    def test_decode_unencoded(self):
+        g = hops_graph()
+        assert g.decode_ids() is g
+
+    def test_node_codes(self):
+        g = hops_graph().encode_ids()
+        assert g.node_codes(['a', 'c', 'zz']).tolist() == [0, 2, -1]
+        with pytest.raises(ValueError):
+            hops_graph().node_codes(['a'])
+
+    def test_degrees(self):
+        g = hops_graph()
+        assert (
+            sorted_records(g.encode_ids().get_degrees().decode_ids()._nodes, 'node')
+            == sorted_records(g.get_degrees()._nodes, 'node')  # noqa: W503
+        )
+
+    def test_hop(self):
+        g = hops_graph()
+        g2 = g.encode_ids()
+        out = g2.hop(pd.DataFrame({g2._node: g2.node_codes(['k', 'd'])}), 2).decode_ids()
+        expected = g.hop(pd.DataFrame({g._node: ['k', 'd']}), 2)
+        assert sorted_records(out._nodes, 'node') == sorted_records(expected._nodes, 'node')
+        assert sorted_records(out._edges, ['s', 'd']) == sorted_records(expected._edges, ['s', 'd'])
+
+    def test_keep_drop_nodes(self):
+        g = hops_graph()
+        g2 = g.encode_ids()
+        kept = g2.keep_nodes(g2.node_codes(['d', 'f', 'j'])).decode_ids()
+        assert sorted_records(kept._edges, ['s', 'd']) == [{'s': 'd', 'd': 'f', 'type': 'e'}, {'s': 'd', 'd': 'j', 'type': 'e'}]
+        dropped = g2.drop_nodes(g2.node_codes(['d'])).decode_ids()
+        assert len(dropped._edges) == len(g._edges) - 5
+        assert 'd' not in dropped._nodes['node'].to_list()
+
+    def test_chain(self):
+        g = hops_graph()
+        g2 = g.encode_ids()
+        out = g2.chain([n({g2._node: g2.node_codes(['e'])[0]}), e_forward(hops=2)]).decode_ids()
+        expected = g.chain([n({g._node: 'e'}), e_forward(hops=2)])
+        assert sorted_records(out._nodes, 'node') == sorted_records(expected._nodes, 'node')
+        assert sorted_records(out._edges, ['s', 'd']) == sorted_records(expected._edges, ['s', 'd'])
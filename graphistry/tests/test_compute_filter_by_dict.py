@@ -2,6 +2,7 @@ import pandas as pd
 from functools import lru_cache
 
 from graphistry.compute.filter_by_dict import filter_by_dict
+from graphistry.compute.predicates import gt, lt, between, isin, startswith, isna, notna
 from graphistry.tests.test_compute import CGFull
 
 @lru_cache(maxsize=1)
@@ -87,6 +88,36 @@ class TestFilterByDict(object):
         assert filter_by_dict(g._nodes, {'node': 'bad', 'type': 'n'}).equals(g._nodes[:0])
 
 
+class TestPredicates(object):
+
+    def test_gt_lt(self):
+        g = hops_graph()
+        assert filter_by_dict(g._nodes, {'v': gt(26)}).node.to_list() == ['o', 'p']
+        assert filter_by_dict(g._nodes, {'v': lt(2)}).node.to_list() == ['a']
+
+    def test_between(self):
+        g = hops_graph()
+        assert filter_by_dict(g._nodes, {'v': between(2, 6)}).node.to_list() == ['b', 'c', 'd']
+        assert filter_by_dict(g._nodes, {'v': between(2, 6, inclusive=False)}).node.to_list() == ['c']
+
+    def test_isin(self):
+        g = hops_graph()
+        assert filter_by_dict(g._nodes, {'node': isin({'b', 'zz', 'a'})}).node.to_list() == ['a', 'b']
+
+    def test_startswith(self):
+        df = pd.DataFrame({'x': ['ab', None, 'ba', 'abc']})
+        assert filter_by_dict(df, {'x': startswith('ab')}).index.to_list() == [0, 3]
+
+    def test_isna_notna(self):
+        df = pd.DataFrame({'x': [1.0, None, 3.0]})
+        assert filter_by_dict(df, {'x': isna()}).index.to_list() == [1]
+        assert filter_by_dict(df, {'x': notna()}).index.to_list() == [0, 2]
+
+    def test_mixed_with_exact(self):
+        g = hops_graph()
+        assert filter_by_dict(g._edges, {'s': 'd', 'v': gt(12)}).d.to_list() == ['j', 'i', 'h']
+
+
 class TestNodeFilterByDict(object):
 
     def test_kv_multiple_good(self):
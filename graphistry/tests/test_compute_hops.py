@@ -1,4 +1,4 @@
-import pandas as pd
+import pandas as pd, pytest
 from common import NoAuthTestCase
 from functools import lru_cache
 
@@ -50,6 +50,26 @@ def hops_graph():
     return CGFull().nodes(nodes_df, 'node').edges(edges_df, 's', 'd')
 
 
+def temporal_graph():
+    # b->d happens before b is reached from a; c is reached late via a->c, then early via b->c
+    edges_df = pd.DataFrame({
+        's': ['a', 'b', 'b', 'c', 'a', 'c'],
+        'd': ['b', 'c', 'd', 'e', 'c', 'f'],
+        't': [1, 2, 0, 5, 6, 3]
+    })
+    return CGFull().edges(edges_df, 's', 'd').materialize_nodes()
+
+
+def weighted_graph():
+    # a->c is a costly shortcut, d->a closes a free cycle, and b->e has no weight
+    edges_df = pd.DataFrame({
+        's': ['a', 'b', 'a', 'c', 'd', 'b'],
+        'd': ['b', 'c', 'c', 'd', 'a', 'e'],
+        'w': [1, 2, 5, 1, 0, None]
+    })
+    return CGFull().edges(edges_df, 's', 'd').bind(edge_weight='w').materialize_nodes()
+
+
 class TestComputeHopMixin(NoAuthTestCase):
 
 
@@ -138,3 +158,192 @@ class TestComputeHopMixin(NoAuthTestCase):
         assert (g2._nodes[g2._node].sort_values().to_list() ==  # noqa: W504
             sorted(['e', 'l']))
         assert g2._edges.shape == (1, 3)
+
+    def test_hop_fixed_point_deep_path(self):
+        n = 2000
+        g = CGFull().edges(pd.DataFrame({'s': range(n - 1), 'd': range(1, n)}), 's', 'd').materialize_nodes()
+        g2 = g.hop(pd.DataFrame({g._node: [10]}), to_fixed_point=True)
+        assert sorted(g2._nodes[g2._node].to_list()) == list(range(10, n))
+        assert g2._edges.shape == (n - 11, 2)
+
+    def test_hop_fixed_point_cycle_wave_front(self):
+        g = CGFull().edges(pd.DataFrame({'s': ['a', 'b', 'c'], 'd': ['b', 'c', 'a']}), 's', 'd').materialize_nodes()
+        g2 = g.hop(pd.DataFrame({g._node: ['a']}), to_fixed_point=True, return_as_wave_front=True)
+        assert sorted(g2._nodes[g2._node].to_list()) == ['a', 'b', 'c']
+        assert g2._edges.shape == (3, 2)
+
+    def test_hop_null_destination(self):
+        g = CGFull().edges(pd.DataFrame({'s': ['a', 'b', 'a'], 'd': ['b', 'c', None]}), 's', 'd').materialize_nodes()
+        for seed, direction in [('a', 'forward'), ('c', 'reverse'), ('b', 'undirected')]:
+            g2 = g.hop(pd.DataFrame({g._node: [seed]}), hops=2, direction=direction)
+            assert g2._edges[['s', 'd']].values.tolist() == [['a', 'b'], ['b', 'c']]
+
+    def test_hop_batch_matches_hop(self):
+        g = hops_graph()
+        seeds = pd.DataFrame({g._node: ['d', 'e', 'k', 'a', 'e', 'zz'], 'seed_id': [1, 2, 3, 4, 5, 6]})
+        for kwargs in [
+            {'hops': 1},
+            {'hops': 2},
+            {'to_fixed_point': True},
+            {'hops': 2, 'direction': 'undirected'},
+            {'hops': 2, 'direction': 'reverse', 'destination_node_match': {'node': 'a'}},
+            {'hops': 1, 'return_as_wave_front': True}
+        ]:
+            g2 = g.hop_batch(seeds, **kwargs)
+            assert list(g2._nodes.columns) == list(g._nodes.columns) + ['seed_id']
+            assert list(g2._edges.columns) == list(g._edges.columns) + ['seed_id']
+            for seed_id, seed_df in seeds.groupby('seed_id'):
+                g3 = g.hop(seed_df[[g._node]], **kwargs)
+                nodes = g2._nodes[g2._nodes.seed_id == seed_id]
+                edges = g2._edges[g2._edges.seed_id == seed_id]
+                assert sorted(nodes[g._node].to_list()) == sorted(g3._nodes[g._node].to_list())
+                assert (
+                    sorted(zip(edges[g._source], edges[g._destination]))
+                    == sorted(zip(g3._edges[g._source], g3._edges[g._destination]))  # noqa: W503
+                )
+
+    def test_hop_batch_source_node_match(self):
+        g = hops_graph()
+        seeds = pd.DataFrame({g._node: ['d', 'e'], 'seed_id': ['x', 'y']})
+        g2 = g.hop_batch(seeds, source_node_match={g._node: 'e'})
+        assert g2._nodes.seed_id.unique().tolist() == ['y']
+        assert sorted(g2._nodes[g._node].to_list()) == ['e', 'g', 'l']
+        assert g2._edges.shape == (2, 4)
+
+    def test_hop_batch_null_destination(self):
+        g = CGFull().edges(pd.DataFrame({'s': ['a', 'b', 'a'], 'd': ['b', 'c', None]}), 's', 'd').materialize_nodes()
+        g2 = g.hop_batch(pd.DataFrame({g._node: ['a', 'c'], 'seed_id': [1, 2]}), hops=2, direction='undirected')
+        assert sorted(g2._edges[['s', 'd', 'seed_id']].values.tolist()) == [['a', 'b', 1], ['a', 'b', 2], ['b', 'c', 1], ['b', 'c', 2]]
+
+    def test_hop_batch_null_seed_id(self):
+        g = hops_graph()
+        g2 = g.hop_batch(pd.DataFrame({g._node: ['d', 'e'], 'seed_id': [None, 'y']}), hops=1)
+        assert g2._nodes.seed_id.unique().tolist() == ['y']
+        assert sorted(g2._nodes[g._node].to_list()) == ['e', 'g', 'l']
+
+    def test_hop_batch_missing_seed_col(self):
+        g = hops_graph()
+        with pytest.raises(ValueError):
+            g.hop_batch(pd.DataFrame({g._node: ['d']}))
+
+    def test_hop_label_hops(self):
+        g = hops_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['d']}), hops=2, label_hops='hop_distance')
+        labels = dict(zip(g2._nodes[g._node], g2._nodes.hop_distance))
+        assert labels == {'d': 0, 'c': 1, 'f': 1, 'h': 1, 'i': 1, 'j': 1, 'm': 2, 'n': 2, 'o': 2, 'p': 2}
+        edge_labels = dict(zip(zip(g2._edges[g._source], g2._edges[g._destination]), g2._edges.hop_distance))
+        assert edge_labels[('d', 'j')] == 1
+        assert edge_labels[('j', 'p')] == 2
+
+    def test_hop_label_hops_undirected(self):
+        g = hops_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['b']}), to_fixed_point=True, direction='undirected', label_hops='h')
+        labels = dict(zip(g2._nodes[g._node], g2._nodes.h))
+        assert labels['b'] == 0
+        assert labels['l'] == 1
+        assert labels['e'] == 2
+        assert labels['a'] == 4
+        assert labels['k'] == 5
+
+    def test_hop_time_window(self):
+        g = temporal_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['a']}), to_fixed_point=True, time_col='t', time_window=(1, 5))
+        assert sorted(g2._nodes[g._node].to_list()) == ['a', 'b', 'c', 'e', 'f']
+        assert sorted(g2._edges.t.to_list()) == [1, 2, 3, 5]
+
+    def test_hop_time_window_open_datetime(self):
+        g = temporal_graph()
+        g = g.edges(g._edges.assign(t=pd.Timestamp('2023-01-01') + pd.to_timedelta(g._edges.t, unit='D')))
+        g2 = g.hop(pd.DataFrame({g._node: ['b']}), to_fixed_point=True, time_col='t', time_window=('2023-01-03', None))
+        assert sorted(g2._nodes[g._node].to_list()) == ['b', 'c', 'e', 'f']
+
+    def test_hop_time_order_seed_reaches_seed(self):
+        g = CGFull().edges(pd.DataFrame({'s': ['n1'], 'd': ['n0'], 't': [1]}), 's', 'd').materialize_nodes()
+        for order in ['increasing', 'decreasing']:
+            g2 = g.hop(pd.DataFrame({g._node: ['n1', 'n0']}), hops=1, time_col='t', time_order=order, label_hops='hop')
+            assert sorted(g2._nodes[g._node].to_list()) == ['n0', 'n1']
+            assert g2._edges[['s', 'd']].values.tolist() == [['n1', 'n0']]
+
+    def test_hop_time_order_increasing(self):
+        g = temporal_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['a']}), to_fixed_point=True, time_col='t', time_order='increasing')
+        assert sorted(g2._nodes[g._node].to_list()) == ['a', 'b', 'c', 'e', 'f']
+        assert sorted(zip(g2._edges.s, g2._edges.d)) == [('a', 'b'), ('a', 'c'), ('b', 'c'), ('c', 'e'), ('c', 'f')]
+
+    def test_hop_time_order_hops(self):
+        g = temporal_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['a']}), hops=2, time_col='t', time_order='increasing', label_hops='hop')
+        assert dict(zip(g2._nodes[g._node], g2._nodes.hop)) == {'a': 0, 'b': 1, 'c': 1}
+        assert sorted(g2._edges.t.to_list()) == [1, 2, 6]
+
+    def test_hop_time_order_decreasing_reverse(self):
+        g = temporal_graph()
+        g2 = g.hop(
+            pd.DataFrame({g._node: ['e']}), to_fixed_point=True, direction='reverse',
+            time_col='t', time_order='decreasing')
+        assert sorted(g2._nodes[g._node].to_list()) == ['a', 'b', 'c', 'e']
+        assert sorted(g2._edges.t.to_list()) == [1, 2, 5]
+
+    def test_hop_time_bad_args(self):
+        g = temporal_graph()
+        with pytest.raises(ValueError):
+            g.hop(pd.DataFrame({g._node: ['a']}), time_order='increasing')
+        with pytest.raises(ValueError):
+            g.hop(pd.DataFrame({g._node: ['a']}), time_col='t', time_order='sideways')
+        with pytest.raises(ValueError):
+            g.hop(pd.DataFrame({g._node: ['a']}), time_col='missing', time_window=(0, 1))
+
+    def test_hop_max_cost(self):
+        g = weighted_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['a']}), max_cost=3, label_cost='cost')
+        assert dict(zip(g2._nodes[g._node], g2._nodes.cost)) == {'a': 0, 'b': 1, 'c': 3}
+        assert sorted(zip(g2._edges.s, g2._edges.d, g2._edges.cost)) == [('a', 'b', 1), ('b', 'c', 3)]
+
+    def test_hop_label_cost_unbounded(self):
+        g = weighted_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['a']}), label_cost='cost')
+        assert dict(zip(g2._nodes[g._node], g2._nodes.cost)) == {'a': 0, 'b': 1, 'c': 3, 'd': 4}
+        assert sorted(g2._edges.cost.to_list()) == [1, 3, 4, 4, 5]
+
+    def test_hop_max_cost_reverse(self):
+        g = weighted_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['d']}), max_cost=3, direction='reverse')
+        assert sorted(g2._nodes[g._node].to_list()) == ['b', 'c', 'd']
+        assert sorted(zip(g2._edges.s, g2._edges.d)) == [('b', 'c'), ('c', 'd')]
+
+    def test_hop_max_cost_multi_source(self):
+        g = weighted_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['b', 'd']}), max_cost=1, label_cost='cost')
+        assert dict(zip(g2._nodes[g._node], g2._nodes.cost)) == {'a': 0, 'b': 0, 'd': 0}
+        assert sorted(zip(g2._edges.s, g2._edges.d)) == [('a', 'b'), ('d', 'a')]
+
+    def test_hop_weighted_bad_args(self):
+        g = weighted_graph()
+        with pytest.raises(ValueError):
+            CGFull().edges(g._edges, 's', 'd').hop(pd.DataFrame({g._node: ['a']}), max_cost=1)
+        with pytest.raises(ValueError):
+            g.edges(g._edges.assign(w=-1)).hop(pd.DataFrame({g._node: ['a']}), max_cost=1)
+        with pytest.raises(ValueError):
+            g.hop(pd.DataFrame({g._node: ['a']}), max_cost=1, label_hops='hop')
+
+    def test_hop_limit(self):
+        g = hops_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['d']}), hops=2, limit=3)
+        assert g2._edges[['s', 'd']].values.tolist() == [['d', 'f'], ['d', 'c'], ['d', 'j']]
+        assert sorted(g2._nodes[g._node].to_list()) == ['c', 'd', 'f', 'j']
+
+    def test_hop_limit_prefers_earlier_hops(self):
+        g = hops_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['d']}), hops=2, limit=7, label_hops='hop')
+        assert g2._edges.hop.to_list() == [1, 1, 1, 1, 1, 2, 2]
+        assert sorted(g2._nodes[g._node].to_list()) == ['c', 'd', 'f', 'h', 'i', 'j', 'n', 'p']
+        g3 = g.hop(pd.DataFrame({g._node: ['d']}), hops=2, limit=100)
+        assert len(g3._edges) == 9
+
+    def test_hop_limit_weighted(self):
+        g = weighted_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['a']}), label_cost='cost', limit=2)
+        assert sorted(zip(g2._edges.s, g2._edges.d, g2._edges.cost)) == [('a', 'b', 1), ('b', 'c', 3)]
+        assert sorted(g2._nodes[g._node].to_list()) == ['a', 'b', 'c']
+        with pytest.raises(ValueError):
+            g.hop(pd.DataFrame({g._node: ['a']}), limit=-1)
@@ -0,0 +1,49 @@
+import pandas as pd, pytest
+from common import NoAuthTestCase
+
+from graphistry.compute.ast import n, e_forward
+from graphistry.compute.incremental import chain_radius
+from graphistry.tests.test_compute import CGFull
+from graphistry.tests.test_compute_hops import hops_graph
+
+
+class TestComputeIncremental(NoAuthTestCase):
+
+    def test_chain_radius(self):
+        assert chain_radius([n(), e_forward(hops=2), n(), e_forward(), n()]) == 3
+        assert chain_radius([n(), e_forward(to_fixed_point=True), n()]) is None
+
+    def test_initial_matches(self):
+        g = hops_graph()
+        ops = [n({g._node: 'e'}), e_forward(hops=2), n()]
+        q = g.chain_incremental(ops)
+        g2 = g.chain(ops)
+        assert sorted(q.result()._nodes[g._node].to_list()) == sorted(g2._nodes[g._node].to_list())
+        assert len(q.result()._edges) == len(g2._edges)
+
+    def test_append_emits_only_new(self):
+        g = hops_graph()
+        ops = [n({g._node: 'e'}), e_forward(hops=2), n()]
+        q = g.chain_incremental(ops)
+
+        g_new = q.append_edges(pd.DataFrame({'s': ['g', 'k'], 'd': ['c', 'p'], 'type': ['e', 'e']}))
+        assert g_new._nodes[g._node].to_list() == ['c']
+        assert g_new._edges[['s', 'd']].values.tolist() == [['g', 'c']]
+
+        g_none = q.append_edges(pd.DataFrame({'s': ['p'], 'd': ['a'], 'type': ['e']}))
+        assert len(g_none._nodes) == 0 and len(g_none._edges) == 0
+
+    def test_matches_full_rerun(self):
+        edges_df = pd.DataFrame({'s': list('abcdefab'), 'd': list('bcdefgca')})
+        ops = [n({'id': 'a'}), e_forward(hops=3), n()]
+        q = CGFull().edges(edges_df[:2], 's', 'd').chain_incremental(ops, merge_ratio=0.5)
+        for i in range(2, len(edges_df), 2):
+            q.append_edges(edges_df[i:i + 2])
+        g2 = CGFull().edges(edges_df, 's', 'd').chain(ops)
+        assert sorted(q.result()._nodes.id.to_list()) == sorted(g2._nodes.id.to_list())
+        assert sorted(map(tuple, q.result()._edges.values.tolist())) == sorted(map(tuple, g2._edges[['s', 'd']].values.tolist()))
+
+    def test_duplicate_node_ids(self):
+        g = hops_graph()
+        with pytest.raises(ValueError):
+            g.nodes(pd.concat([g._nodes, g._nodes])).chain_incremental([n()])
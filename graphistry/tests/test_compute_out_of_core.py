@@ -0,0 +1,68 @@
+import os, pandas as pd, pytest
+from common import NoAuthTestCase
+
+from graphistry.tests.test_compute_hops import hops_graph
+from graphistry.compute.ast import n, e_forward, e_reverse, e_undirected
+
+
+def dask_hops_graph(npartitions=3):
+    import dask.dataframe as dd
+    g = hops_graph()
+    return g.nodes(dd.from_pandas(g._nodes, npartitions=npartitions)).edges(dd.from_pandas(g._edges, npartitions=npartitions))
+
+
+def sorted_records(df, cols):
+    return sorted(df[cols].itertuples(index=False, name=None))
+
+
+@pytest.mark.skipif(
+    not ("TEST_DASK" in os.environ and os.environ["TEST_DASK"] == "1"),
+    reason="dask tests need TEST_DASK=1",
+)
+class TestComputeOutOfCore(NoAuthTestCase):
+
+    def test_materialize_nodes_dask(self):
+        g = dask_hops_graph()
+        g2 = g.nodes(None).materialize_nodes()
+        assert sorted(g2._nodes.compute()['node'].to_list()) == sorted(g._nodes.compute()['node'].to_list())
+
+    def test_get_degrees_dask(self):
+        g = dask_hops_graph()
+        degrees = g.get_degrees()._nodes.compute()
+        expected = hops_graph().get_degrees()._nodes
+        assert sorted_records(degrees, ['node', 'degree_in', 'degree_out', 'degree']) == sorted_records(expected, ['node', 'degree_in', 'degree_out', 'degree'])
+
+    def test_hop_dask_matches_pandas(self):
+        g_pd = hops_graph()
+        g = dask_hops_graph()
+        for kwargs in [
+            {'hops': 1},
+            {'hops': 2, 'label_hops': 'hop'},
+            {'to_fixed_point': True},
+            {'hops': 2, 'direction': 'undirected'},
+            {'hops': 2, 'direction': 'reverse', 'destination_node_match': {'node': 'a'}},
+            {'to_fixed_point': True, 'return_as_wave_front': True, 'edge_match': {'type': 'e'}}
+        ]:
+            seeds = pd.DataFrame({'node': ['d', 'e', 'a']})
+            out = g.hop(seeds, **kwargs)
+            expected = g_pd.hop(seeds, **kwargs)
+            assert isinstance(out._edges, pd.DataFrame)
+            cols = ['s', 'd'] + (['hop'] if 'label_hops' in kwargs else [])
+            assert sorted_records(out._edges, cols) == sorted_records(expected._edges, cols)
+            node_cols = ['node'] + (['hop'] if 'label_hops' in kwargs else [])
+            assert sorted_records(out._nodes, node_cols) == sorted_records(expected._nodes, node_cols)
+
+    def test_chain_dask_matches_pandas(self):
+        g_pd = hops_graph()
+        g = dask_hops_graph()
+        for ops in [
+            [n({'node': 'e'}), e_forward({}, hops=2)],
+            [n(name='n1'), e_forward({}, name='e1'), n(name='n2'), e_reverse({}, name='e2'), n({'node': 'l'}, name='n3')],
+            [n({'node': 'd'}), e_undirected({}, to_fixed_point=True), n({'node': 'b'})]
+        ]:
+            out = g.chain(ops)
+            expected = g_pd.chain(ops)
+            assert sorted(out._nodes.columns) == sorted(expected._nodes.columns)
+            assert sorted(out._edges.columns) == sorted(expected._edges.columns)
+            assert sorted_records(out._nodes, list(expected._nodes.columns)) == sorted_records(expected._nodes, list(expected._nodes.columns))
+            assert sorted_records(out._edges, list(expected._edges.columns)) == sorted_records(expected._edges, list(expected._edges.columns))
@@ -0,0 +1,53 @@
+import numpy as np, pandas as pd
+from common import NoAuthTestCase
+
+from graphistry.compute.paths import dijkstra
+from graphistry.tests.test_compute_hops import hops_graph
+from graphistry.tests.test_compute import CGFull
+
+
+class TestComputePathsMixin(NoAuthTestCase):
+
+    def test_shortest_path_lengths(self):
+        g = hops_graph()
+        out = g.shortest_path_lengths(['e', 'e', 'd', 'd', 'k', 'a', 'zz'], ['b', 'a', 'b', 'd', 'b', 'e', 'zz'])
+        assert out.columns.to_list() == ['source', 'target', 'distance']
+        assert out.distance.to_list() == [2, 2, 3, 0, -1, -1, 0]
+
+    def test_shortest_path_lengths_directions(self):
+        g = hops_graph()
+        assert g.shortest_path_lengths(['b'], ['e'], direction='reverse').distance.to_list() == [2]
+        assert g.shortest_path_lengths(['k'], ['b'], direction='undirected').distance.to_list() == [5]
+
+    def test_shortest_path_lengths_max_hops(self):
+        g = hops_graph()
+        out = g.shortest_path_lengths(['d', 'd'], ['p', 'b'], max_hops=2)
+        assert out.distance.to_list() == [2, -1]
+
+    def test_shortest_path_lengths_edge_match(self):
+        g = CGFull().edges(
+            pd.DataFrame({'s': ['a', 'b', 'a'], 'd': ['b', 'c', 'c'], 'ok': [True, True, False]}), 's', 'd')
+        assert g.shortest_path_lengths(['a'], ['c']).distance.to_list() == [1]
+        assert g.shortest_path_lengths(['a'], ['c'], edge_match={'ok': True}).distance.to_list() == [2]
+
+    def test_shortest_path_lengths_null_ids(self):
+        g = CGFull().edges(pd.DataFrame({'s': ['a', 'b', 'c', None], 'd': ['b', None, 'a', 'c']}), 's', 'd')
+        out = g.shortest_path_lengths(['a', 'b', 'c'], ['c', 'a', 'b'])
+        assert out.distance.to_list() == [-1, -1, 2]
+
+    def test_shortest_path_lengths_many_pairs(self):
+        n = 500
+        g = CGFull().edges(pd.DataFrame({'s': range(n - 1), 'd': range(1, n)}), 's', 'd')
+        sources = list(range(0, n, 7))
+        targets = [(s * 13) % n for s in sources]
+        out = g.shortest_path_lengths(sources, targets)
+        assert out.distance.to_list() == [t - s if t >= s else -1 for s, t in zip(sources, targets)]
+
+    def test_dijkstra(self):
+        # parallel arcs 0->1 keep the lighter one, and 1->2 is free
+        near = np.array([0, 0, 1, 2, 0])
+        far = np.array([1, 1, 2, 3, 3])
+        weights = np.array([4.0, 1.0, 0.0, 2.5, 9.0])
+        assert dijkstra(5, near, far, weights, np.array([0])).tolist() == [0, 1, 1, 3.5, np.inf]
+        assert dijkstra(5, near, far, weights, np.array([0]), max_cost=3).tolist() == [0, 1, 1, np.inf, np.inf]
+        assert dijkstra(5, near, far, weights, np.array([2, 4])).tolist() == [np.inf, np.inf, 0, 2.5, 0]
@@ -0,0 +1,63 @@
+import pandas as pd
+from common import NoAuthTestCase
+
+from graphistry.tests.test_compute_hops import hops_graph
+from graphistry.compute.ast import n, e_forward
+from graphistry.compute.result_cache import ResultCache, canonical_key, graph_fingerprint, result_cache
+
+
+class TestComputeResultCache(NoAuthTestCase):
+
+    def setUp(self):
+        result_cache.clear()
+
+    def test_chain_cache_hit(self):
+        g = hops_graph()
+        ops = [n({g._node: "e"}), e_forward({}, name="e1")]
+        before = result_cache.stats()
+        g2 = g.chain(ops, cache=True)
+        g3 = g.chain([n({g._node: "e"}), e_forward({}, name="e1")], cache=True)
+        after = result_cache.stats()
+        assert g3 is g2
+        assert after['misses'] - before['misses'] == 1
+        assert after['hits'] - before['hits'] == 1
+        assert g2._edges.equals(g.chain(ops)._edges)
+
+    def test_chain_cache_graph_change(self):
+        g = hops_graph()
+        ops = [n({g._node: "e"}), e_forward({})]
+        g2 = g.chain(ops, cache=True)
+        g_less = g.edges(g._edges[:3])
+        g3 = g_less.chain(ops, cache=True)
+        assert g3 is not g2
+        assert len(g3._edges) < len(g2._edges)
+
+    def test_hop_cache_hit(self):
+        g = hops_graph()
+        g2 = g.hop(pd.DataFrame({g._node: ['d']}), hops=2, cache=True)
+        g3 = g.hop(pd.DataFrame({g._node: ['d']}), hops=2, cache=True)
+        g4 = g.hop(pd.DataFrame({g._node: ['e']}), hops=2, cache=True)
+        assert g3 is g2
+        assert g4 is not g2
+
+    def test_canonical_key_order_insensitive(self):
+        assert canonical_key({'a': 1, 'b': 'x'}) == canonical_key({'b': 'x', 'a': 1})
+        assert canonical_key([n({'a': 1})]) != canonical_key([n({'a': '1'})])
+
+    def test_fingerprint_reused(self):
+        g = hops_graph()
+        assert graph_fingerprint(g) == graph_fingerprint(g)
+        assert graph_fingerprint(g) != graph_fingerprint(g.edges(g._edges[:3]))
+
+    def test_lru_eviction(self):
+        g = hops_graph()
+        nbytes = int(g._nodes.memory_usage(index=True).sum() + g._edges.memory_usage(index=True).sum())
+        cache = ResultCache(max_bytes=2 * nbytes)
+        cache.put('a', g)
+        cache.put('b', g)
+        assert cache.get('a') is g
+        cache.put('c', g)
+        assert cache.get('b') is None
+        assert cache.get('a') is g
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['entries'] == 2
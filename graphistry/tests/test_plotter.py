@@ -140,6 +140,12 @@ class TestPlotterBindings_API_1(NoAuthTestCase):
         with self.assertRaises(ValueError):
             plotter.plot(triangleEdges, triangleNodes)
 
+    def test_compression_requires_api_3(self, mock_etl, mock_open):
+        plotter = graphistry.bind(source="src", destination="dst")
+        with self.assertRaises(ValueError):
+            plotter.plot(triangleEdges, compression="lz4")
+        self.assertFalse(mock_etl.called)
+
     def test_triangle_edges(self, mock_etl, mock_open):
         plotter = graphistry.bind(source="src", destination="dst")
         plotter.plot(triangleEdges)
@@ -0,0 +1,81 @@
+import os, sqlite3, tempfile, time, unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from graphistry.upload_cache import UPLOAD_CACHE_FILENAME, UploadCache, upload_cache_for
+
+
+class TestUploadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):
+        cache = UploadCache(self.path)
+        assert cache.get('h', 'https://s', 'org') is None
+        cache.put('h', 'https://s', 'org', 'f1', {'is_valid': True})
+        assert cache.get('h', 'https://s', 'org') == ('f1', {'is_valid': True})
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_keyed_by_server_and_org(self):
+        cache = UploadCache(self.path)
+        cache.put('h', 'https://s', None, 'f1', {})
+        assert cache.get('h', 'https://s', None) == ('f1', {})
+        assert cache.get('h', 'https://s', 'org') is None
+        assert cache.get('h', 'https://other', None) is None
+
+    def test_shared_across_instances(self):
+        UploadCache(self.path).put('h', 'https://s', 'org', 'f1', {})
+        assert UploadCache(self.path).get('h', 'https://s', 'org') == ('f1', {})
+
+    def test_expiry(self):
+        cache = UploadCache(self.path, max_age=0.05)
+        cache.put('h', 'https://s', 'org', 'f1', {})
+        time.sleep(0.1)
+        assert cache.get('h', 'https://s', 'org') is None
+        cache.put('h2', 'https://s', 'org', 'f2', {})
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = UploadCache(self.path, max_entries=2)
+        cache.put('a', 's', None, 'fa', {})
+        cache.put('b', 's', None, 'fb', {})
+        time.sleep(0.01)
+        assert cache.get('a', 's', None) is not None
+        cache.put('c', 's', None, 'fc', {})
+        assert len(cache) == 2
+        assert cache.get('b', 's', None) is None
+        assert cache.get('a', 's', None) is not None
+
+    def test_concurrent_writers(self):
+        def work(i):
+            cache = UploadCache(self.path)
+            cache.put(f'h{i}', 's', None, f'f{i}', {'i': i})
+            return cache.get(f'h{i}', 's', None)
+        with ThreadPoolExecutor(8) as pool:
+            out = list(pool.map(work, range(32)))
+        assert out == [(f'f{i}', {'i': i}) for i in range(32)]
+        assert len(UploadCache(self.path)) == 32
+
+    def test_corrupt_is_miss(self):
+        cache = UploadCache(self.path)
+        with open(os.path.join(self.path, UPLOAD_CACHE_FILENAME), 'wb') as f:
+            f.write(b'not a database' * 100)
+        assert cache.get('h', 's', None) is None
+        cache.put('h', 's', None, 'f1', {})
+
+    def test_upload_cache_for(self):
+        assert upload_cache_for(None) is None
+        assert upload_cache_for(self.path) is upload_cache_for(self.path + '/')
+        assert isinstance(upload_cache_for(self.path), UploadCache)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            UploadCache(self.path, max_entries=0)
+        with self.assertRaises(ValueError):
+            UploadCache(self.path, max_age=0)
@@ -0,0 +1,134 @@
+import json, os, sqlite3, threading, time
+from contextlib import closing
+from typing import Dict, Optional, Tuple
+from .util import setup_logger
+logger = setup_logger(__name__)
+
+
+# Database file within an upload cache directory, versioned with arrow_fingerprint() so entries keyed by
+# earlier fingerprints, which missed dictionary values, are never reused
+UPLOAD_CACHE_FILENAME = 'uploads-v2.sqlite3'
+
+# Most uploads remembered, beyond which the least recently used are evicted
+UPLOAD_CACHE_MAX_ENTRIES = 10000
+
+# Seconds an upload is reused for, as servers may later delete its file
+UPLOAD_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Seconds to wait on another process holding the database lock
+UPLOAD_CACHE_LOCK_TIMEOUT = 30.0
+
+
+class UploadCache():
+    """
+        On-disk index of uploaded files, shared by all processes using the same directory
+
+        Maps an Arrow content fingerprint (see ArrowFileUploader.arrow_fingerprint), server, and org
+        to the uploaded file_id and server response, so any process, such as a worker of a pool or a
+        restarted notebook kernel, skips re-uploading a table another already uploaded.
+
+        Entries expire max_age seconds after upload, and beyond max_entries, the least recently used are evicted.
+        The index is a SQLite database in write-ahead log mode, so readers do not block the writer, and writers
+        wait up to UPLOAD_CACHE_LOCK_TIMEOUT on each other. Cache failures are logged and treated as misses,
+        so they never fail an upload.
+
+        Example: Enable for all uploads, or via environment variable GRAPHISTRY_UPLOAD_CACHE_DIR
+            graphistry.upload_cache_dir('/shared/graphistry_cache')
+
+        Example: Direct use
+            cache = UploadCache('/tmp/graphistry_cache', max_age=60 * 60)
+            cache.put(fingerprint, 'https://hub.graphistry.com', 'my_org', file_id, resp)
+            assert cache.get(fingerprint, 'https://hub.graphistry.com', 'my_org') == (file_id, resp)
+    """
+
+    def __init__(self, path: str, max_entries: int = UPLOAD_CACHE_MAX_ENTRIES, max_age: float = UPLOAD_CACHE_MAX_AGE):
+        if max_entries < 1:
+            raise ValueError(f'max_entries must be positive, got: {max_entries}')
+        if max_age <= 0:
+            raise ValueError(f'max_age must be positive, got: {max_age}')
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        os.makedirs(path, exist_ok=True)
+        self.db_path = os.path.join(path, UPLOAD_CACHE_FILENAME)
+        with closing(self._connect()) as conn, conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS uploads ('
+                ' fingerprint TEXT NOT NULL, server TEXT NOT NULL, org TEXT NOT NULL,'
+                ' file_id TEXT NOT NULL, output TEXT NOT NULL,'
+                ' expires REAL NOT NULL, last_used REAL NOT NULL,'
+                ' PRIMARY KEY (fingerprint, server, org))')
+            conn.execute('CREATE INDEX IF NOT EXISTS uploads_last_used ON uploads (last_used)')
+
+    def _connect(self) -> sqlite3.Connection:
+        # connections are per call, so threads and forked processes never share one
+        return sqlite3.connect(self.db_path, timeout=UPLOAD_CACHE_LOCK_TIMEOUT)
+
+    def get(self, fingerprint: str, server: str, org: Optional[str]) -> Optional[Tuple[str, dict]]:
+        """
+            -> (file_id, server upload response) of an unexpired upload, if any, marking it as recently used
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    'SELECT file_id, output FROM uploads WHERE fingerprint = ? AND server = ? AND org = ? AND expires > ?',
+                    (fingerprint, server, org or '', now)).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    'UPDATE uploads SET last_used = ? WHERE fingerprint = ? AND server = ? AND org = ?',
+                    (now, fingerprint, server, org or ''))
+            return row[0], json.loads(row[1])
+        except (sqlite3.Error, ValueError):
+            logger.warning('Failed reading upload cache %s, treating as miss', self.db_path, exc_info=True)
+            return None
+
+    def put(self, fingerprint: str, server: str, org: Optional[str], file_id: str, output: dict) -> None:
+        """
+            Record an upload, then evict expired and least recently used entries
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (fingerprint, server, org or '', file_id, json.dumps(output), now + self.max_age, now))
+                conn.execute('DELETE FROM uploads WHERE expires <= ?', (now,))
+                conn.execute(
+                    'DELETE FROM uploads WHERE rowid IN ('
+                    ' SELECT rowid FROM uploads ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,))
+        except (sqlite3.Error, TypeError, ValueError):
+            logger.warning('Failed writing upload cache %s', self.db_path, exc_info=True)
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute('SELECT COUNT(*) FROM uploads').fetchone()[0]
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM uploads')
+
+
+# path -> UploadCache, so each directory's schema is set up once per process
+UPLOAD_CACHES: Dict[str, UploadCache] = {}
+UPLOAD_CACHES_LOCK = threading.Lock()
+
+
+def upload_cache_for(path: Optional[str]) -> Optional[UploadCache]:
+    """
+        Shared UploadCache of a directory, or None when path is None or the cache cannot be opened
+    """
+    if path is None:
+        return None
+    path = os.path.abspath(os.path.expanduser(path))
+    with UPLOAD_CACHES_LOCK:
+        if path not in UPLOAD_CACHES:
+            try:
+                UPLOAD_CACHES[path] = UploadCache(path)
+            except (OSError, sqlite3.Error):
+                logger.warning('Failed opening upload cache in %s, continuing without', path, exc_info=True)
+                return None
+        return UPLOAD_CACHES[path]